@@ -0,0 +1,138 @@
+from typing import Callable, Iterator
+
+import numpy as np
+
+
+class ArrayStore:
+    """
+    Class to store entities (voters, candidates) as a structure of arrays.
+
+    Instead of one object per entity, every attribute is kept in its own
+    contiguous array (a column), and the i-th entity is made of the i-th value
+    of every column. Columns are allocated with some spare room, which doubles
+    whenever it runs out, so that adding entities one by one stays cheap.
+
+    Indexing or iterating over the store gives lightweight views of the
+    entities, built by the given view function: a view only knows the store and
+    its index, and reads and writes its attributes directly in the columns.
+    """
+
+    def __init__(self, columns: dict[str, type], view: Callable[["ArrayStore", int], object]):
+        """
+        :param columns: dict({..., <column name>: <column dtype>, ...})
+        :param view: function building the view of the entity at a given index of a store
+        """
+        self.__columns = {name: np.empty(0, dtype=dtype) for name, dtype in columns.items()}
+        self.__size = 0
+        self.__view = view
+
+    def __len__(self) -> int:
+        return self.__size
+
+    def __getitem__(self, index: int | slice):
+        if isinstance(index, slice):
+            return [self.__view(self, i) for i in range(*index.indices(self.__size))]
+        if index < 0:
+            index += self.__size
+        if not 0 <= index < self.__size:
+            raise IndexError("store index out of range")
+        return self.__view(self, index)
+
+    def __iter__(self) -> Iterator:
+        return (self.__view(self, index) for index in range(self.__size))
+
+    def __reserve(self, size: int):
+        """
+        Makes room in the columns for the given number of entities,
+        doubling their capacity when they are full.
+
+        :param size: the number of entities the columns must be able to hold
+        """
+        capacity = len(next(iter(self.__columns.values())))
+        if size <= capacity:
+            return
+
+        capacity = max(size, 2 * capacity)
+        for name, column in self.__columns.items():
+            resized = np.empty(capacity, dtype=column.dtype)
+            resized[:self.__size] = column[:self.__size]
+            self.__columns[name] = resized
+
+    def append(self, **values) -> int:
+        """
+        Adds an entity to the store.
+
+        :param values: the value of every column
+        :return: the index of the new entity
+        """
+        index = self.__size
+        self.__reserve(index + 1)
+        for name, column in self.__columns.items():
+            column[index] = values[name]
+        self.__size += 1
+        return index
+
+    def extend(self, copy: bool = True, **values) -> int:
+        """
+        Adds several entities to the store at once.
+
+        :param copy: whether to copy the values, or, when the store is empty, to use the arrays of the right type
+                     as the columns themselves (e.g. the memory-mapped arrays of a file), in which case they must
+                     not be modified elsewhere
+        :param values: the values of every column, as lists or arrays of the same length,
+                       or as single values shared by all new entities
+        :return: the index of the first new entity
+        """
+        index = self.__size
+        size = index + max(len(value) for value in values.values() if np.ndim(value) > 0)
+        if not copy and index == 0:
+            for name, column in self.__columns.items():
+                value = values[name]
+                if np.ndim(value) == 0:
+                    value = np.full(size, value, dtype=column.dtype)
+                elif not (isinstance(value, np.ndarray) and value.dtype == column.dtype):
+                    value = np.array(value, dtype=column.dtype)
+                self.__columns[name] = value
+            self.__size = size
+            return index
+
+        self.__reserve(size)
+        for name, column in self.__columns.items():
+            column[index:size] = values[name]
+        self.__size = size
+        return index
+
+    def get(self, name: str, index: int):
+        """
+        :param name: name of the column
+        :param index: index of the entity
+        :return: the value of the column for the entity
+        """
+        return self.__columns[name][index]
+
+    def set(self, name: str, index: int, value):
+        """
+        :param name: name of the column
+        :param index: index of the entity
+        :param value: the new value of the column for the entity
+        """
+        self.__columns[name][index] = value
+
+    def get_column(self, name: str) -> np.ndarray:
+        """
+        Returns the values of a column for all entities, without copying them.
+
+        :param name: name of the column
+        :return: a read-only array of shape (nb_entities,)
+        """
+        column = self.__columns[name][:self.__size]
+        column.flags.writeable = False
+        return column
+
+    def clear(self):
+        """
+        Removes all entities from the store, and frees the columns.
+        """
+        for name, column in self.__columns.items():
+            self.__columns[name] = np.empty(0, dtype=column.dtype)
+        self.__size = 0
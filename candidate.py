@@ -1,21 +1,47 @@
 import random
-from dataclasses import dataclass
 
-import matplotlib.colors as mcolors
+import numpy as np
+
+from array_store import ArrayStore
 
 
-@dataclass
 class Candidate:
-    """Data class for keeping track of a candidate."""
+    """
+    Class for keeping track of a candidate.
+
+    A candidate is a lightweight view of a row of a candidate store (see new_store()):
+    its attributes are read from and written to the store's arrays. A candidate
+    created on its own gets a store of its own.
+    """
 
-    __label: str
-    __coordinates: tuple
-    __color: str
+    __slots__ = ("__store", "__index")
 
     def __init__(self, label: str, coordinates: tuple, color: str):
-        self.__label = label
-        self.__coordinates = coordinates
-        self.__color = color
+        self.__store = self.new_store()
+        self.__index = self.__store.append(label=label, x=coordinates[0], y=coordinates[1], color=color)
+
+    @classmethod
+    def new_store(cls) -> ArrayStore:
+        """
+        Creates an empty store of candidates, whose items are Candidate views.
+
+        :return: the new store
+        """
+        return ArrayStore({"label": object, "x": np.float64, "y": np.float64, "color": object}, cls.view)
+
+    @classmethod
+    def view(cls, store: ArrayStore, index: int):
+        """
+        Creates a view of the candidate at the given index of a store of candidates.
+
+        :param store: the store of candidates
+        :param index: index of the candidate in the store
+        :return: the candidate
+        """
+        candidate = cls.__new__(cls)
+        candidate.__store = store
+        candidate.__index = index
+        return candidate
 
     @classmethod
     def random_color(cls, label: str, coordinates: tuple):
@@ -25,39 +51,61 @@ class Candidate:
         :param coordinates: the coordinates of the candidate
         :return: the new candidate
         """
+        return cls(label, coordinates, cls.pick_random_color())
+
+    @staticmethod
+    def pick_random_color() -> str:
+        """
+        Picks a random color for a candidate, neither black nor white.
+        :return: the color
+        """
+        # Imported here so that candidates can be handled without matplotlib (see cli.py)
+        import matplotlib.colors as mcolors
+
         colors = mcolors.XKCD_COLORS
         if "xkcd:black" in colors:
             colors.pop("xkcd:black")
         if "xkcd:white" in colors:
             colors.pop("xkcd:white")
-        return cls(label, coordinates, random.choice(list(colors.values())))
+        return random.choice(list(colors.values()))
+
+    def __eq__(self, other) -> bool:
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return (
+            (self.get_label(), self.coordinates(), self.get_color())
+            == (other.get_label(), other.coordinates(), other.get_color())
+        )
+
+    def __repr__(self) -> str:
+        return f"Candidate(label={self.get_label()!r}, coordinates={self.coordinates()!r}, color={self.get_color()!r})"
 
     def get_label(self) -> str:
         """
         :return: the candidate's label
         """
-        return self.__label
+        return self.__store.get("label", self.__index)
 
     def set_label(self, label: str):
         """
         :param label: the candidate's new label
         """
-        self.__label = label
+        self.__store.set("label", self.__index, label)
 
     def coordinates(self) -> tuple:
         """
         :return: the candidate's coordinates
         """
-        return self.__coordinates
+        return float(self.__store.get("x", self.__index)), float(self.__store.get("y", self.__index))
 
     def get_color(self) -> str:
         """
         :return: the candidate's color
         """
-        return self.__color
+        return self.__store.get("color", self.__index)
 
     def set_color(self, color: str):
         """
         :param color: the candidate's new color
         """
-        self.__color = color
+        self.__store.set("color", self.__index, color)
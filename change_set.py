@@ -0,0 +1,127 @@
+from dataclasses import dataclass
+
+
+@dataclass
+class ChangeSet:
+    """
+    Data class for keeping track of the changes made to the data during a batch
+    (see DataManager.batch()), so that they can be applied all at once.
+
+    Voters and candidates are only ever appended, edited or cleared, so the
+    changes are summed up as: whether they were cleared, the index from which
+    they were added, and the indexes of the ones that were edited before that.
+    """
+
+    __start_version: int
+    __voters_cleared: bool
+    __first_added_voter: int | None
+    __edited_voters: set[int]
+    __candidates_cleared: bool
+    __first_added_candidate: int | None
+    __edited_candidates: set[int]
+
+    def __init__(self, start_version: int):
+        self.__start_version = start_version
+        self.__voters_cleared = False
+        self.__first_added_voter = None
+        self.__edited_voters = set()
+        self.__candidates_cleared = False
+        self.__first_added_candidate = None
+        self.__edited_candidates = set()
+
+    def get_start_version(self) -> int:
+        """
+        :return: the version of the data before the changes
+        """
+        return self.__start_version
+
+    def is_empty(self) -> bool:
+        """
+        :return: whether nothing changed or not
+        """
+        return not (
+            self.__voters_cleared
+            or self.__first_added_voter is not None
+            or self.__edited_voters
+            or self.__candidates_cleared
+            or self.__first_added_candidate is not None
+            or self.__edited_candidates
+        )
+
+    # Voter
+
+    def add_voters(self, index: int):
+        """
+        :param index: index of the first added voter
+        """
+        if self.__first_added_voter is None:
+            self.__first_added_voter = index
+
+    def edit_voter(self, index: int):
+        """
+        :param index: index of the edited voter
+        """
+        if self.__first_added_voter is None or index < self.__first_added_voter:
+            self.__edited_voters.add(index)
+
+    def clear_voters(self):
+        self.__voters_cleared = True
+        self.__first_added_voter = None
+        self.__edited_voters.clear()
+
+    def has_cleared_voters(self) -> bool:
+        """
+        :return: whether the voters were cleared or not, in which case all the remaining voters were added
+        """
+        return self.__voters_cleared
+
+    def get_first_added_voter(self) -> int | None:
+        """
+        :return: index of the first added voter, None if no voter was added
+        """
+        return self.__first_added_voter
+
+    def get_edited_voters(self) -> list[int]:
+        """
+        :return: the sorted indexes of the edited voters, excluding the added ones
+        """
+        return sorted(self.__edited_voters)
+
+    # Candidate
+
+    def add_candidates(self, index: int):
+        """
+        :param index: index of the first added candidate
+        """
+        if self.__first_added_candidate is None:
+            self.__first_added_candidate = index
+
+    def edit_candidate(self, index: int):
+        """
+        :param index: index of the edited candidate
+        """
+        if self.__first_added_candidate is None or index < self.__first_added_candidate:
+            self.__edited_candidates.add(index)
+
+    def clear_candidates(self):
+        self.__candidates_cleared = True
+        self.__first_added_candidate = None
+        self.__edited_candidates.clear()
+
+    def has_cleared_candidates(self) -> bool:
+        """
+        :return: whether the candidates were cleared or not, in which case all the remaining candidates were added
+        """
+        return self.__candidates_cleared
+
+    def get_first_added_candidate(self) -> int | None:
+        """
+        :return: index of the first added candidate, None if no candidate was added
+        """
+        return self.__first_added_candidate
+
+    def get_edited_candidates(self) -> list[int]:
+        """
+        :return: the sorted indexes of the edited candidates, excluding the added ones
+        """
+        return sorted(self.__edited_candidates)
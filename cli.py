@@ -0,0 +1,200 @@
+import argparse
+import json
+import sys
+
+import numpy as np
+
+from data_manager import DataManager
+from file_manager import FileManager
+from profile_manager import ProfileManager
+from voting_manager import VotingManager, CondorcetMethod, CondorcetTieBreakingRule
+from voting_profile import VotingProfile
+
+# Voting rules which can be run, named after the VotingManager methods
+RULES = ("pluralite_simple", "borda", "veto", "approbation", "elimination_successive", "condorcet")
+
+
+def load_scenario(filename: str) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, list[str]]:
+    """
+    Loads a scenario from any file FileManager can import, without any window.
+    The voters and candidates are given the same weights, delegation flags and labels as when imported on the graph.
+
+    :param filename: name of the file to import from
+    :return: tuple(voters' coordinates, delegation flags, weights, candidates' coordinates, candidates' labels)
+    :raise ValueError: if the file can't be imported, with the error message
+    """
+    errors = []
+    imported = []
+    FileManager().import_objects_from_file(
+        filename,
+        lambda title, message: errors.append(title + " : " + message),
+        lambda *objects: imported.append(objects)
+    )
+    if errors:
+        raise ValueError(errors[0])
+
+    voters, delegations, weights, candidates, labels, colors = imported[0]
+    if delegations is None:
+        delegations = np.zeros(len(voters), dtype=np.bool_)
+    if weights is None:
+        weights = np.ones(len(voters), dtype=np.int64)
+    return (
+        np.asarray(voters),
+        np.asarray(delegations),
+        np.asarray(weights),
+        np.asarray(candidates),
+        DataManager.new_candidate_labels(labels, {})
+    )
+
+
+def compute_profile(
+        voters: np.ndarray,
+        delegations: np.ndarray,
+        weights: np.ndarray,
+        candidates: np.ndarray,
+        candidate_labels: list[str]
+) -> VotingProfile | None:
+    """
+    Computes the voting profile of the voters who haven't delegated their vote, as the graph would
+    (see ProfileManager.get_profile()), the max distance being the diagonal of the graph.
+
+    :param voters: the voters' coordinates, of shape (nb_voters, 2)
+    :param delegations: whether the voters have delegated their vote or not
+    :param weights: the voters' vote weights
+    :param candidates: the candidates' coordinates, of shape (nb_candidates, 2)
+    :param candidate_labels: the candidates' labels
+    :return: the voting profile, None if there are no such voters or no candidates
+    """
+    no_delegation = ~delegations
+    if not no_delegation.any() or len(candidates) == 0:
+        return None
+
+    # Voters are labelled from 1 when imported
+    voter_labels = np.arange(1, len(voters) + 1)[no_delegation].astype(str).tolist()
+    return ProfileManager().generate_profile(
+        voters[no_delegation],
+        candidates,
+        ProfileManager.compute_diagonal(ProfileManager.GRAPH_LIMITS, ProfileManager.GRAPH_LIMITS),
+        weights[no_delegation],
+        candidate_labels,
+        voter_labels
+    )
+
+
+def run_rules(profile: VotingProfile, rules: list[str], arguments: argparse.Namespace) -> dict:
+    """
+    Runs voting rules on a profile.
+
+    :param profile: the voting profile
+    :param rules: the names of the rules to run (see RULES)
+    :param arguments: the parsed command-line arguments, holding the parameters of the rules
+    :return: dict({..., <rule>: <result>, ...}), each result being a dict which can be serialized to JSON,
+             or None if the rule found no winner
+    """
+    voting_manager = VotingManager()
+    details = voting_manager.voting_details_manager
+    results = {}
+
+    for rule in rules:
+        # So that a rule can't report the scores of the previous one
+        details.set_remaining_methods_details([])
+        match rule:
+            case "pluralite_simple":
+                winner = voting_manager.pluralite_simple(profile)
+            case "borda":
+                maximum = profile.get_nb_candidates() if arguments.borda_maximum is None else arguments.borda_maximum
+                winner = voting_manager.borda(profile, maximum, arguments.borda_step)
+            case "veto":
+                winner = voting_manager.veto(profile)
+            case "approbation":
+                winner = voting_manager.approbation(profile, arguments.approval_radius)
+            case "elimination_successive":
+                winner = voting_manager.elimination_successive(profile)
+            case "condorcet":
+                winner = voting_manager.condorcet(
+                    profile,
+                    CondorcetMethod[arguments.condorcet_method.upper()],
+                    CondorcetTieBreakingRule[arguments.tie_breaking_rule.upper()]
+                )
+
+        if winner is None:
+            results[rule] = None
+        elif rule == "condorcet":
+            results[rule] = {
+                "winner": winner[0],
+                "used_method": winner[1],
+                "used_tie_breaking_rule": winner[2],
+                "winners": winner[3],
+            }
+        else:
+            results[rule] = {"winner": winner[0], "multiple_winners": winner[1], "winners": winner[2]}
+            if rule != "elimination_successive" and details.remaining_methods_details:
+                results[rule]["scores"] = details.remaining_methods_details[1]
+
+    return results
+
+
+def parse_arguments(arguments: list[str] | None = None) -> argparse.Namespace:
+    """
+    Parses the command-line arguments.
+
+    :param arguments: the arguments, those of the command line when None
+    :return: the parsed arguments
+    """
+    parser = argparse.ArgumentParser(
+        description="Runs voting rules on a scenario file, without any window, and writes the results as JSON."
+    )
+    parser.add_argument("file", help="scenario file (.csv, .csv.gz, .elec or .zip)")
+    parser.add_argument(
+        "-r", "--rules", nargs="+", choices=RULES, default=list(RULES), help="voting rules to run (default: all)"
+    )
+    parser.add_argument("-o", "--output", help="file to write the results to (default: standard output)")
+    parser.add_argument(
+        "--borda-maximum", type=int, help="points given to the first choice in Borda (default: number of candidates)"
+    )
+    parser.add_argument("--borda-step", type=int, default=1, help="points removed at each rank in Borda (default: 1)")
+    parser.add_argument(
+        "--approval-radius", type=int, default=10, help="radius of the approval circles, in %% (default: 10)"
+    )
+    parser.add_argument(
+        "--condorcet-method", choices=("copeland", "simpson"), default="copeland",
+        help="method used when there is no Condorcet winner (default: copeland)"
+    )
+    parser.add_argument(
+        "--tie-breaking-rule", choices=("ordre_lexico", "random"), default="ordre_lexico",
+        help="tie-breaking rule of Condorcet (default: ordre_lexico)"
+    )
+    return parser.parse_args(arguments)
+
+
+def main(arguments: list[str] | None = None) -> int:
+    """
+    Runs the command line.
+
+    :param arguments: the arguments, those of the command line when None
+    :return: the exit status
+    """
+    arguments = parse_arguments(arguments)
+
+    try:
+        voters, delegations, weights, candidates, candidate_labels = load_scenario(arguments.file)
+    except (OSError, ValueError) as error:
+        print(error, file=sys.stderr)
+        return 1
+
+    profile = compute_profile(voters, delegations, weights, candidates, candidate_labels)
+    if profile is None:
+        print("Il faut au moins un candidat et un votant n'ayant pas délégué son vote.", file=sys.stderr)
+        return 1
+
+    output = json.dumps(run_rules(profile, arguments.rules, arguments), indent=2, ensure_ascii=False)
+    if arguments.output is None:
+        print(output)
+    else:
+        with open(arguments.output, "w", encoding="utf-8") as f:
+            f.write(output + "\n")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,8 +1,11 @@
-from typing import Callable
+from contextlib import contextmanager
+from typing import Callable, Iterator
 
-import matplotlib.colors as mcolors
+import numpy as np
 
+from array_store import ArrayStore
 from candidate import Candidate
+from change_set import ChangeSet
 from voter import Voter
 
 
@@ -11,35 +14,103 @@ class DataManager:
    Class to manage the data.
    """
 
-    # Store the voters
-    __voters: list[Voter] = []
+    # Version of the data, increased on every change of the voters or candidates.
+    # Like the data, it is shared by every instance: it is only ever set on the class
+    __version: int = 0
+
+    # Store the voters, as arrays (see Voter.new_store())
+    __voters: ArrayStore = Voter.new_store()
+
+    # Index of every voter by label: dict({..., <voter label>: <voter index>, ...})
+    __voter_indexes: dict[str, int] = {}
 
     # Voter added callback
-    __on_voter_added: Callable[[Voter, int], None]
+    __on_voter_added: Callable[[Voter, int], None] | None = None
+
+    # Voters added callback
+    __on_voters_added: Callable[[ArrayStore, int], None] | None = None
 
     # Voter edited callback
-    __on_voter_edited: Callable[[Voter, int], None]
+    __on_voter_edited: Callable[[Voter, int], None] | None = None
 
     # Voters cleared callback
-    __on_voters_cleared: Callable[[], None]
+    __on_voters_cleared: Callable[[], None] | None = None
 
     # Voter error callback
-    __on_voter_error: Callable[[str], None]
+    __on_voter_error: Callable[[str], None] | None = None
 
-    # Store the candidates
-    __candidates: list[Candidate] = []
+    # Store the candidates, as arrays (see Candidate.new_store())
+    __candidates: ArrayStore = Candidate.new_store()
+
+    # Index of every candidate by label: dict({..., <candidate label>: <candidate index>, ...})
+    __candidate_indexes: dict[str, int] = {}
 
     # Candidate added callback
-    __on_candidate_added: Callable[[Candidate, int], None]
+    __on_candidate_added: Callable[[Candidate, int], None] | None = None
+
+    # Candidates added callback
+    __on_candidates_added: Callable[[list[Candidate], int], None] | None = None
 
     # Candidate edited callback
-    __on_candidate_edited: Callable[[Candidate, int], None]
+    __on_candidate_edited: Callable[[Candidate, int], None] | None = None
 
     # Candidates cleared callback
-    __on_candidates_cleared: Callable[[], None]
+    __on_candidates_cleared: Callable[[], None] | None = None
 
     # Candidate error callback
-    __on_candidate_error: Callable[[str], None]
+    __on_candidate_error: Callable[[str], None] | None = None
+
+    # Changes made during the current batch, None if there is no batch in progress
+    __changes: ChangeSet | None = None
+
+    # Changes callback, called at the end of a batch
+    __on_changes: Callable[[ChangeSet], None] | None = None
+
+    def get_version(self) -> int:
+        """
+        Returns the version of the data, which increases every time a voter or
+        a candidate is added, edited or cleared. As long as it doesn't change,
+        anything computed from the data is still valid.
+
+        :return: the version of the data
+        """
+        return self.__version
+
+    @contextmanager
+    def batch(self) -> Iterator[ChangeSet]:
+        """
+        Context manager to change the data in bulk:
+
+            with data_manager.batch():
+                ...
+
+        Within the batch, the added, edited and cleared callbacks are not called.
+        Instead, the changes are recorded in a change set, and the changes callback
+        is called once with it at the end of the batch, so that they can all be
+        applied at once. Nested batches are part of the outermost one.
+
+        :return: the change set of the batch
+        """
+        if self.__changes is not None:
+            yield self.__changes
+            return
+
+        self.__changes = ChangeSet(self.__version)
+        try:
+            yield self.__changes
+        finally:
+            changes, self.__changes = self.__changes, None
+            if not changes.is_empty() and self.__on_changes is not None:
+                self.__on_changes(changes)
+
+    def set_changes_callback(self, callback: Callable[[ChangeSet], None]):
+        """
+        Sets the (on changes) callback, which is called at the end of a batch
+        with all the changes made to the data during the batch.
+
+        :param callback: the callback function, takes the ChangeSet of the batch
+        """
+        self.__on_changes = callback
 
     # Voter
 
@@ -51,30 +122,90 @@ class DataManager:
         :return: whether the voter has been added or not
         """
 
+        # Create a new voter
+        index = self.__voters.append(
+            label=self.__new_voter_label(len(self.__voters)),
+            x=coordinates[0],
+            y=coordinates[1],
+            has_delegated_vote=False,
+            weight=1
+        )
+
+        DataManager.__version += 1
+        if self.__changes is not None:
+            self.__changes.add_voters(index)
+        elif self.__on_voter_added is not None:
+            self.__on_voter_added(self.__voters[index], index)
+
+        return True
+
+    def add_voters(
+            self,
+            coordinates: list[tuple[float, float]],
+            has_delegated_votes: list[bool] | None = None,
+            weights: list[int] | None = None,
+            copy: bool = True
+    ) -> bool:
+        """
+        Adds several voters to the data at once.
+        The (on voters added) callback is called only once, with the voters from the first new one.
+
+        :param coordinates: voters' coordinates, as a list of tuples or an array of shape (nb_voters, 2)
+        :param has_delegated_votes: whether the voters have delegated their vote or not, False when None
+        :param weights: voters' vote weights, 1 when None
+        :param copy: whether to copy the arrays, or to keep them as the data when there are no voters yet,
+                     e.g. the memory-mapped arrays of a file (see ArrayStore.extend())
+        :return: whether the voters have been added or not
+        """
+        if len(coordinates) == 0:
+            return False
+
+        coordinates = np.asarray(coordinates, dtype=np.float64).reshape(-1, 2)
+
+        # Create the new voters, labelled as if they were added one by one
+        index = self.__voters.extend(
+            label=[self.__new_voter_label(len(self.__voters) + offset) for offset in range(len(coordinates))],
+            x=coordinates[:, 0],
+            y=coordinates[:, 1],
+            has_delegated_vote=False if has_delegated_votes is None else has_delegated_votes,
+            weight=1 if weights is None else weights,
+            copy=copy
+        )
+
+        DataManager.__version += 1
+        if self.__changes is not None:
+            self.__changes.add_voters(index)
+        elif self.__on_voters_added is not None:
+            self.__on_voters_added(self.__voters, index)
+
+        return True
+
+    def __new_voter_label(self, nb_voters: int) -> str:
+        """
+        Generates a new unique label for a voter, and reserves it for the voter's index.
+
+        :param nb_voters: the number of voters before the new one, i.e. the new voter's index
+        :return: the new label
+        """
+
         # Generate label
-        label = str(len(self.__voters) + 1)
+        label = str(nb_voters + 1)
 
         # Avoid duplicates (unique labels!)
-        added_labels = [added_voter.get_label() for added_voter in self.__voters]
         label_offset = 0
-        while label in added_labels:
+        while label in self.__voter_indexes:
             label_offset += 1
-            label = str(len(self.__voters) + 1 + label_offset)
-
-        # Create a new voter
-        voter = Voter(label=label, coordinates=coordinates)
+            label = str(nb_voters + 1 + label_offset)
 
-        self.__voters.append(voter)
-        if self.__on_voter_added is not None:
-            self.__on_voter_added(voter, len(self.__voters) - 1)
-
-        return True
+        self.__voter_indexes[label] = nb_voters
+        return label
 
-    def get_voters(self) -> list[Voter]:
+    def get_voters(self) -> ArrayStore:
         """
-        Returns the list of voters.
+        Returns the voters, as a sequence of Voter views over the voters' arrays.
+        The arrays themselves can be obtained with get_column().
 
-        :return: list of voters in data
+        :return: voters in data
         """
         return self.__voters
 
@@ -88,6 +219,16 @@ class DataManager:
 
         return self.__voters[index]
 
+    def get_voter_by_label(self, label: str) -> Voter | None:
+        """
+        Returns the voter with the given label.
+
+        :param label: label of the desired voter
+        :return: voter with given label, None if there is no such voter
+        """
+        index = self.__voter_indexes.get(label)
+        return None if index is None else self.__voters[index]
+
     def edit_voter_at(self, index: int, label: str, has_delegated_vote: bool, weight: int) -> bool:
         """
         Modifies the voter label at the given index.
@@ -100,15 +241,20 @@ class DataManager:
         """
 
         # Avoid duplicates (unique labels!)
-        for added_index, added_voter in enumerate(self.__voters):
-            if added_voter.get_label() == label and added_index != index:
+        if self.__voter_indexes.get(label, index) != index:
+            if self.__on_voter_error is not None:
                 self.__on_voter_error("Un votant avec ce nom existe déjà.")
-                return False
+            return False
 
+        del self.__voter_indexes[self.__voters[index].get_label()]
+        self.__voter_indexes[label] = index
         self.__voters[index].set_label(label)
         self.__voters[index].set_delegated_vote(has_delegated_vote)
         self.__voters[index].set_weight(weight)
-        if self.__on_voter_edited is not None:
+        DataManager.__version += 1
+        if self.__changes is not None:
+            self.__changes.edit_voter(index)
+        elif self.__on_voter_edited is not None:
             self.__on_voter_edited(self.__voters[index], index)
 
         return True
@@ -127,7 +273,11 @@ class DataManager:
         """
 
         self.__voters.clear()
-        if self.__on_voters_cleared is not None:
+        self.__voter_indexes.clear()
+        DataManager.__version += 1
+        if self.__changes is not None:
+            self.__changes.clear_voters()
+        elif self.__on_voters_cleared is not None:
             self.__on_voters_cleared()
 
     def set_voter_added_callback(self, callback: Callable[[Voter, int], None]):
@@ -139,6 +289,18 @@ class DataManager:
         """
         self.__on_voter_added = callback
 
+    def set_voters_added_callback(self, callback: Callable[[ArrayStore, int], None]):
+        """
+        Sets the (on voters added) callback, which is called when
+        several voters are added to the data at once.
+
+        So that no Voter view has to be created for each new voter, the callback is given the
+        store of all the voters (see get_voters()), the new ones starting at the given index.
+
+        :param callback: the callback function, takes the voters in the data and the index of the first new one
+        """
+        self.__on_voters_added = callback
+
     def set_voter_edited_callback(self, callback: Callable[[Voter, int], None]):
         """
         Sets the (on voter edited) callback, which is called when
@@ -168,75 +330,98 @@ class DataManager:
 
     # Candidate
 
-    def __get_letter_count(self, index: int) -> int:
-        """
-        Returns the letter count for a label at a given index.
-        :param index: index of candidate in list of candidates
-        :return: the letter count
-        """
-
-        labels_before_index = 0
-        letter_count = 0
-
-        # Search how many powers of 26 can fit before reaching the
-        # given index. We don't want to use log_26 because if we have
-        # a two-lettered label, then we would have already filled the
-        # one-lettered possibilities. So if we have a 676 (26^2) index,
-        # then that means it already contains the 26 one-lettered labels,
-        # so the label only becomes three-lettered if 676+26=702 is reached.
-        while labels_before_index < index:
-            letter_count += 1
-            labels_before_index += 26 ** letter_count
-        return letter_count
-
-    def __purify(self, number: int) -> int:
-        """
-        Returns the corresponding number based on the number of letters.
-
-        Example:
-
-        0 -> A
-        25 -> Z
-
-        If the given number is 26, that should correspond to A, and it returns 0.
-
-        It may look like this is working the same as modulo because it's quite
-        similar. The modulo operator gives us the remainder of the division by a
-        number, by removing multiples of that number. This gives us the remainder
-        by removing powers of the number.
-
-        Now if the number is 676 for instance, this will return 650 and not 0. Why?
-        Because if we have a two-lettered label, then we would have already filled the
-        one-lettered possibilities. So if we have a 676 (26^2) index, then that means
-        it already contains the 26 one-lettered labels, so the label only becomes
-        three-lettered if 676+26=702 is reached. So if we reached 676, then that means
-        we need to deal with one more set of 26s before resetting.
-
-        :param number: the number of existing candidates
-        :return: corresponding number based on the number of letters.
-        """
-
-        i = 1
-        while number >= 26 ** i:
-            number -= 26 ** i
-            i += 1
-        return number
-
-    def __get_label_for(self, index: int) -> str:
-        """
-        Generate an adequate label for the candidate at the given index.
-
-        :param index: new candidate at index needing a label
-        :return: generated label
-        """
-        new_candidate_index = index
-        label_letter_count = self.__get_letter_count(new_candidate_index + 1)
-
-        label = ""
-        for i in reversed(range(1, label_letter_count + 1)):
-            label += chr(ord('A') + (self.__purify(new_candidate_index) % (26 ** i) // (26 ** (i - 1))))
-
-        return label
+    @staticmethod
+    def encode_label(index: int) -> str:
+        """
+        Returns the candidate label for the given index, in bijective base 26:
+        A, B, ..., Z, AA, AB, ..., AZ, BA, ..., ZZ, AAA, ...
+
+        Unlike in plain base 26, there is no zero digit: A stands for 1 and Z for 26,
+        so that the one-lettered labels are all used before the two-lettered ones.
+
+        :param index: index of the candidate, from 0
+        :return: the label
+        """
+        number = index + 1
+        letters = []
+        while number > 0:
+            number, remainder = divmod(number - 1, 26)
+            letters.append(chr(ord('A') + remainder))
+        return "".join(reversed(letters))
+
+    @staticmethod
+    def decode_label(label: str) -> int:
+        """
+        Returns the index of the given candidate label, the inverse of encode_label().
+
+        :param label: the label, made of uppercase letters
+        :return: index of the candidate, from 0
+        """
+        number = 0
+        for letter in label:
+            number = number * 26 + ord(letter) - ord('A') + 1
+        return number - 1
+
+    @staticmethod
+    def __labels_from(index: int) -> Iterator[str]:
+        """
+        Generates the candidate labels for all indexes from the given one,
+        incrementing the last label letter by letter instead of encoding every index.
+
+        :param index: index of the first label
+        :return: iterator over the labels
+        """
+        letters = [ord(letter) for letter in DataManager.encode_label(index)]
+        while True:
+            yield "".join(map(chr, letters))
+
+            # Increment the last letter, carrying over the Zs
+            position = len(letters) - 1
+            while position >= 0 and letters[position] == ord('Z'):
+                letters[position] = ord('A')
+                position -= 1
+            if position >= 0:
+                letters[position] += 1
+            else:
+                letters.insert(0, ord('A'))
+
+    @staticmethod
+    def new_candidate_labels(
+            labels: list[str | None],
+            candidate_indexes: dict[str, int],
+            nb_candidates: int = 0
+    ) -> list[str]:
+        """
+        Returns unique labels for new candidates, and reserves them for the candidates' indexes.
+
+        A candidate without label, or whose label is already taken, gets the first
+        generated label which isn't taken, starting from the one of its own index.
+        Since labels are never freed while adding candidates, the search for the next
+        candidate starts where the last one ended: the whole range is generated at once.
+
+        :param labels: the desired labels, None to generate them
+        :param candidate_indexes: the taken labels, as dict({..., <label>: <index>, ...}), to which the new ones are added
+        :param nb_candidates: the number of candidates before the new ones, i.e. the first new candidate's index
+        :return: the new labels
+        """
+        new_labels = []
+        generated_labels = DataManager.__labels_from(nb_candidates)
+        generated_label = next(generated_labels)
+        generated_index = nb_candidates
+        for index, label in enumerate(labels, start=nb_candidates):
+            # Avoid duplicates (unique labels!)
+            if label is None or label in candidate_indexes:
+                while generated_index < index:
+                    generated_label = next(generated_labels)
+                    generated_index += 1
+                while generated_label in candidate_indexes:
+                    generated_label = next(generated_labels)
+                    generated_index += 1
+                label = generated_label
+
+            candidate_indexes[label] = index
+            new_labels.append(label)
+        return new_labels
 
     def add_candidate(self, coordinates: tuple[float, float], label=None, color=None) -> bool:
         """
@@ -248,34 +433,83 @@ class DataManager:
         :return: whether the candidate has been added or not
         """
 
-        # Generate label
-        if label is None:
-            label = self.__get_label_for(len(self.__candidates))
-
-        # Avoid duplicates (unique labels!)
-        added_labels = [added_candidate.get_label() for added_candidate in self.__candidates]
-        label_offset = 0
-        while label in added_labels:
-            label = self.__get_label_for(len(self.__candidates) + label_offset)
-            label_offset += 1
-
         # Create a new candidate
-        if color is None or color not in mcolors.XKCD_COLORS.values():
-            candidate = Candidate.random_color(label=label, coordinates=coordinates)
-        else:
-            candidate = Candidate(label, coordinates, color)
+        index = self.__candidates.append(
+            label=self.new_candidate_labels([label], self.__candidate_indexes, len(self.__candidates))[0],
+            x=coordinates[0],
+            y=coordinates[1],
+            color=self.__candidate_color(color)
+        )
+
+        DataManager.__version += 1
+        if self.__changes is not None:
+            self.__changes.add_candidates(index)
+        elif self.__on_candidate_added is not None:
+            self.__on_candidate_added(self.__candidates[index], index)
 
-        self.__candidates.append(candidate)
-        if self.__on_candidate_added is not None:
-            self.__on_candidate_added(candidate, len(self.__candidates) - 1)
+        return True
+
+    def add_candidates(
+            self,
+            coordinates: list[tuple[float, float]],
+            labels: list[str | None] | None = None,
+            colors: list[str | None] | None = None
+    ) -> bool:
+        """
+        Adds several candidates to the data at once.
+        The (on candidates added) callback is called only once, with all the new candidates.
+
+        :param coordinates: candidates' coordinates, as a list of tuples or an array of shape (nb_candidates, 2)
+        :param labels: candidates' labels, generated when None
+        :param colors: candidates' colors, random when None
+        :return: whether the candidates have been added or not
+        """
+        if len(coordinates) == 0:
+            return False
+
+        if labels is None:
+            labels = [None] * len(coordinates)
+        if colors is None:
+            colors = [None] * len(coordinates)
+
+        coordinates = np.asarray(coordinates, dtype=np.float64).reshape(-1, 2)
+
+        # Create the new candidates, labelled as if they were added one by one
+        index = self.__candidates.extend(
+            label=self.new_candidate_labels(labels, self.__candidate_indexes, len(self.__candidates)),
+            x=coordinates[:, 0],
+            y=coordinates[:, 1],
+            color=[self.__candidate_color(color) for color in colors]
+        )
+
+        DataManager.__version += 1
+        if self.__changes is not None:
+            self.__changes.add_candidates(index)
+        elif self.__on_candidates_added is not None:
+            self.__on_candidates_added(self.__candidates[index:], index)
 
         return True
 
-    def get_candidates(self) -> list[Candidate]:
+    def __candidate_color(self, color=None) -> str:
+        """
+        Returns the color of a new candidate.
+
+        :param color: the desired color
+        :return: the desired color, or a random one if None or unknown
+        """
+        # Imported here so that the data can be handled without matplotlib (see cli.py)
+        import matplotlib.colors as mcolors
+
+        if color is None or color not in mcolors.XKCD_COLORS.values():
+            return Candidate.pick_random_color()
+        return color
+
+    def get_candidates(self) -> ArrayStore:
         """
-        Returns the list of candidates.
+        Returns the candidates, as a sequence of Candidate views over the candidates' arrays.
+        The arrays themselves can be obtained with get_column().
 
-        :return: list of candidates in data
+        :return: candidates in data
         """
         return self.__candidates
 
@@ -289,6 +523,16 @@ class DataManager:
 
         return self.__candidates[index]
 
+    def get_candidate_by_label(self, label: str) -> Candidate | None:
+        """
+        Returns the candidate with the given label.
+
+        :param label: label of the desired candidate
+        :return: candidate with given label, None if there is no such candidate
+        """
+        index = self.__candidate_indexes.get(label)
+        return None if index is None else self.__candidates[index]
+
     def edit_candidate_at(self, index: int, label: str, color: str) -> bool:
         """
         Modifies the candidate label and color at the given index.
@@ -300,14 +544,19 @@ class DataManager:
         """
 
         # Avoid duplicates (unique labels!)
-        for added_index, added_candidate in enumerate(self.__candidates):
-            if added_candidate.get_label() == label and added_index != index:
+        if self.__candidate_indexes.get(label, index) != index:
+            if self.__on_candidate_error is not None:
                 self.__on_candidate_error("Un candidat avec ce nom existe déjà.")
-                return False
+            return False
 
+        del self.__candidate_indexes[self.__candidates[index].get_label()]
+        self.__candidate_indexes[label] = index
         self.__candidates[index].set_label(label)
         self.__candidates[index].set_color(color)
-        if self.__on_candidate_edited is not None:
+        DataManager.__version += 1
+        if self.__changes is not None:
+            self.__changes.edit_candidate(index)
+        elif self.__on_candidate_edited is not None:
             self.__on_candidate_edited(self.__candidates[index], index)
 
         return True
@@ -326,7 +575,11 @@ class DataManager:
         """
 
         self.__candidates.clear()
-        if self.__on_candidates_cleared is not None:
+        self.__candidate_indexes.clear()
+        DataManager.__version += 1
+        if self.__changes is not None:
+            self.__changes.clear_candidates()
+        elif self.__on_candidates_cleared is not None:
             self.__on_candidates_cleared()
 
     def set_candidate_added_callback(self, callback: Callable[[Candidate, int], None]):
@@ -338,6 +591,15 @@ class DataManager:
         """
         self.__on_candidate_added = callback
 
+    def set_candidates_added_callback(self, callback: Callable[[list[Candidate], int], None]):
+        """
+        Sets the (on candidates added) callback, which is called when
+        several candidates are added to the data at once.
+
+        :param callback: the callback function, takes the new Candidates and the index of the first one in the data
+        """
+        self.__on_candidates_added = callback
+
     def set_candidate_edited_callback(self, callback: Callable[[Candidate, int], None]):
         """
         Sets the (on candidate edited) callback, which is called when
@@ -1,11 +1,20 @@
 import csv
+import gzip
+import io
+import json
+import math
+import struct
 import time
 import os
+import zipfile
+import zlib
 
+from itertools import islice
 from typing import Callable
 
-from candidate import Candidate
-from voter import Voter
+import numpy as np
+
+from array_store import ArrayStore
 
 
 class FileManager:
@@ -32,10 +41,65 @@ class FileManager:
     files have the same name. The file contains the coordinates of the
     points classified under 'Candidats' or 'Votants'. Its format is
     valid.
+
+    Exported text files start with a 'Version 2' line. In this version,
+    the voters' lines also hold their weight and delegation flag (0 or
+    1): 'x,y,weight,delegation'. Files without this line are in version
+    1, where the voters' lines only hold their coordinates. Text files
+    can be compressed with gzip (with the extension '.csv.gz').
+
+    Data can also be exported to, and imported from, binary files (with
+    the extension '.elec'), which are much smaller and faster to load for
+    large electorates. A binary file starts with a header (see
+    __binary_header), followed by blocks of little-endian arrays, each
+    aligned on 8 bytes: the voters' coordinates (float32 or float64,
+    shape (nb_voters, 2)), the voters' weights (int64), the voters'
+    delegation flags (bool), the candidates' coordinates (same type as
+    the voters', shape (nb_candidates, 2)), and finally the candidates'
+    labels and colors, as a UTF-8 JSON list of [label, color] pairs.
+    The arrays are memory-mapped when imported instead of being read.
+
+    Finally, a scenario can be saved to a compressed archive (a zip file,
+    with the extension '.zip'), whose sections are separate members that
+    are compressed, and thus read, independently from each other (see
+    read_archive_section()): 'scenario.json' (the version of the format
+    and the number of voters and candidates), 'candidates.json' (a list
+    of [x, y, label, color]), 'voters.npy' (the voters' coordinates, of
+    shape (nb_voters, 2)), 'delegations.npy' (the voters' weights and
+    delegation flags, in the fields 'weight' and 'has_delegated_vote')
+    and, optionally, 'results.json' (results cached with the scenario).
+    Listing the candidates or reading the results of a large scenario
+    therefore never decompresses its voters.
     """
 
     __separator = ','
 
+    # Number of lines read from or written to a file at once
+    __chunk_size = 65536
+
+    # Text files: first line, followed by the version of the format. Files without it are in version 1
+    __version_header = "Version "
+    __text_version = 2
+
+    # Binary files: extension, and header made of the magic bytes, the version of the format, the size of the
+    # coordinates (4 or 8 bytes), the number of voters, the number of candidates and the size of the labels' table
+    __binary_extension = ".elec"
+    __binary_magic = b"ELECTION"
+    __binary_version = 1
+    __binary_header = struct.Struct("<8sIIQQQ")
+
+    # Archives: extension, version of the format, and members of each section
+    __archive_extension = ".zip"
+    __archive_version = 1
+    __archive_members = {
+        "scenario": "scenario.json",
+        "candidates": "candidates.json",
+        "voters": "voters.npy",
+        "delegations": "delegations.npy",
+        "results": "results.json",
+    }
+    __delegations_dtype = np.dtype([("weight", "<i8"), ("has_delegated_vote", np.bool_)])
+
     def __init__(self, separator=__separator):
         self.__separator = separator
 
@@ -57,118 +121,634 @@ class FileManager:
             self,
             filename: str | None,
             on_error: Callable[[str, str], None],
-            on_success: Callable[[list, list], None]
+            on_success: Callable[[np.ndarray, np.ndarray | None, np.ndarray | None, np.ndarray, list, list], None],
+            on_progress: Callable[[float], None] | None = None,
+            is_cancelled: Callable[[], bool] | None = None
     ) -> int:
         """
         Imports the coordinates of candidates and/or voters from file and plots them on the graph.
 
+        The file, possibly compressed with gzip, is read by chunks of lines. In the voters' section,
+        consecutive lines holding only a voter's values are parsed all at once into an array, the
+        other lines one by one. Nothing is imported if any line is invalid.
+
+        Binary files and archives (see FileManager) are imported with import_objects_from_binary_file()
+        and import_objects_from_archive().
+
         :param filename: name of the file to import from
         :param on_error: error callback
-        :param on_success: success callback
-        :return: 0 if file is imported, -1 if any error is generated
+        :param on_success: success callback, called with the voters' coordinates, delegation flags and weights
+                           (None when not in the file), and the candidates' coordinates, labels and colors
+        :param on_progress: progress callback, called with the fraction of the file read after each chunk
+        :param is_cancelled: called after each chunk, the import stops without calling any callback if it returns True
+        :return: 0 if file is imported, -1 if any error is generated or if the import is cancelled
         """
+        if filename.endswith(self.__binary_extension):
+            return self.import_objects_from_binary_file(filename, on_error, on_success, on_progress, is_cancelled)
+        if filename.endswith(self.__archive_extension):
+            return self.import_objects_from_archive(filename, on_error, on_success, on_progress, is_cancelled)
+
         error_title = "Erreur de lecture"
 
-        candidates = []
+        # Voters, as a list of arrays of shape (nb_voters, nb_voter_values)
         voters = []
+        candidates = []
+        labels = []
+        colors = []
         object = ""
+        # Version of the format of the file, and number of values on each voter's line:
+        # coordinates, followed by the weight and the delegation flag since version 2
+        version = 1
+        nb_voter_values = 2
 
-        f = open(filename, "r")
-        for i, line in enumerate(csv.reader(f), start=1):
-            nb_inputs = len(line)
-            if nb_inputs > 4:
-                on_error(error_title, self.create_error_message(i, True))
-                return -1
-            if nb_inputs == 0:
-                continue
-            if nb_inputs == 1:
-                if line[0] == "Votants" or line[0] == "Candidats":
-                    object = line[0]
-                else:
-                    on_error(error_title, self.create_error_message(i, True))
-                    return -1
-            if nb_inputs >= 2:
+        file_size = max(os.path.getsize(filename), 1)
+        with open(filename, "rb") as raw_file, io.TextIOWrapper(
+                gzip.GzipFile(fileobj=raw_file) if filename.endswith(".gz") else raw_file, newline=""
+        ) as f:
+            line_number = 1
+            chunks = iter(lambda: list(islice(f, self.__chunk_size)), [])
+            while True:
                 try:
-                    x = float(line[0])
-                    y = float(line[1])
-                    if x < -1 or x > 1 or y < -1 or y > 1:
-                        raise ValueError()
-                except ValueError:
-                    on_error(error_title, self.create_error_message(i, False))
+                    lines = next(chunks, None)
+                except (EOFError, zlib.error, OSError):
+                    # Truncated or damaged compressed file
+                    on_error(error_title, "Le fichier est incomplet ou endommagé.")
                     return -1
+                if lines is None:
+                    break
 
-                if nb_inputs == 3 or nb_inputs == 4:
-                    if object == "Candidats":
-                        label = line[2]
-                        if label == "":
-                            on_error(error_title, "Le nom du candidat ne peut pas être vide.")
+                if is_cancelled is not None and is_cancelled():
+                    return -1
+
+                # Indexes of the lines which don't hold exactly a voter's values
+                nb_separators = np.fromiter((line.count(self.__separator) for line in lines), np.int64, len(lines))
+                irregular_lines = np.flatnonzero(nb_separators != nb_voter_values - 1)
+
+                index = 0
+                while index < len(lines):
+                    i = line_number + index
+
+                    if object == "Votants" and nb_separators[index] == nb_voter_values - 1:
+                        # Parse the voters up to the next irregular line at once
+                        next_irregular = np.searchsorted(irregular_lines, index)
+                        end = irregular_lines[next_irregular] if next_irregular < len(irregular_lines) else len(lines)
+                        values, invalid, line_format = self.__parse_voters(lines[index:end], nb_voter_values)
+                        if values is None:
+                            on_error(error_title, self.create_error_message(i + invalid, line_format))
                             return -1
-                        try:
-                            color = line[3]
-                        except IndexError:
-                            color = Candidate.random_color(label, (x, y)).get_color()
-                    else:
+                        voters.append(values)
+                        index = end
+                        continue
+
+                    line = next(csv.reader([lines[index]], delimiter=self.__separator), [])
+                    index += 1
+
+                    nb_inputs = len(line)
+                    if nb_inputs > 4:
                         on_error(error_title, self.create_error_message(i, True))
                         return -1
+                    if nb_inputs == 0:
+                        continue
+                    if nb_inputs == 1:
+                        if line[0] == "Votants" or line[0] == "Candidats":
+                            object = line[0]
+                        elif i == 1 and line[0] == self.__version_header + str(self.__text_version):
+                            version = self.__text_version
+                            nb_voter_values = 4
+                            irregular_lines = np.flatnonzero(nb_separators != nb_voter_values - 1)
+                        else:
+                            on_error(error_title, self.create_error_message(i, True))
+                            return -1
+                    if nb_inputs >= 2:
+                        coordinates = self.__parse_point(line)
+                        if coordinates is None:
+                            on_error(error_title, self.create_error_message(i, False))
+                            return -1
+
+                        if object == "Votants" and version >= 2:
+                            details = self.__parse_voter_details(line[2:]) if nb_inputs == 4 else None
+                            if details is None:
+                                on_error(error_title, self.create_error_message(i, True))
+                                return -1
+                            voters.append(np.array([(*coordinates, *details)]))
+                            continue
+
+                        if nb_inputs == 3 or nb_inputs == 4:
+                            if object == "Candidats":
+                                label = line[2]
+                                if label == "":
+                                    on_error(error_title, "Le nom du candidat ne peut pas être vide.")
+                                    return -1
+                                # A random color is picked when there is none
+                                color = line[3] if nb_inputs == 4 else None
+                            else:
+                                on_error(error_title, self.create_error_message(i, True))
+                                return -1
+                        else:
+                            label = None
+                            color = None
+
+                        if object == "Candidats":
+                            candidates.append(coordinates)
+                            labels.append(label)
+                            colors.append(color)
+                        elif object == "Votants":
+                            voters.append(np.array([coordinates]))
+                        else:
+                            on_error(error_title, self.create_error_message(i, True))
+                            return -1
+
+                line_number += len(lines)
+                if on_progress is not None:
+                    # Progress through the file itself, compressed or not
+                    on_progress(min(raw_file.tell() / file_size, 1.0))
+
+        voters = np.concatenate(voters) if voters else np.empty((0, nb_voter_values))
+        on_success(
+            voters[:, :2],
+            voters[:, 3].astype(np.bool_) if version >= 2 else None,
+            voters[:, 2].astype(np.int64) if version >= 2 else None,
+            np.array(candidates, dtype=np.float64).reshape(-1, 2),
+            labels,
+            colors
+        )
+        return 0
+
+    def __parse_voters(self, lines: list[str], nb_values: int) -> tuple[np.ndarray | None, int, bool]:
+        """
+        Parses lines holding the values of voters only (see import_objects_from_file()), all at once.
+
+        :param lines: the lines to parse
+        :param nb_values: the number of values on each line: 2 (coordinates) or 4 (coordinates, weight, delegation)
+        :return: tuple(array of shape (nb_lines, nb_values), -1, False) if all voters are valid, otherwise
+                 tuple(None, index of the first invalid line, whether the error is in the format of the line)
+        """
+        try:
+            values = np.loadtxt(
+                lines, delimiter=self.__separator, comments=None, quotechar='"', dtype=np.float64, ndmin=2
+            )
+        except ValueError:
+            values = None
+        if values is None or values.shape[1] != nb_values:
+            # Parse the lines one by one to find the invalid one
+            values = []
+            for index, line in enumerate(csv.reader(lines, delimiter=self.__separator)):
+                if len(line) != nb_values:
+                    return None, index, True
+                point = self.__parse_point(line)
+                if point is None:
+                    return None, index, False
+                details = self.__parse_voter_details(line[2:]) if nb_values == 4 else ()
+                if details is None:
+                    return None, index, True
+                values.append((*point, *details))
+            return np.array(values, dtype=np.float64).reshape(-1, nb_values), -1, False
+
+        invalid_coordinates = ~((-1 <= values[:, :2]) & (values[:, :2] <= 1)).all(axis=1)
+        invalid = invalid_coordinates.copy()
+        if nb_values == 4:
+            weights, delegations = values[:, 2], values[:, 3]
+            invalid |= ~((weights >= 0) & (weights == np.floor(weights)) & np.isfinite(weights))
+            invalid |= ~((delegations == 0) | (delegations == 1))
+        invalid = np.flatnonzero(invalid)
+        if len(invalid):
+            return None, int(invalid[0]), not invalid_coordinates[invalid[0]]
+        return values, -1, False
+
+    @staticmethod
+    def __parse_point(line: list[str]) -> tuple[float, float] | None:
+        """
+        Parses the coordinates at the beginning of a line.
+
+        :param line: the values of the line
+        :return: the coordinates, or None if they are not numbers in [-1, 1]
+        """
+        try:
+            x = float(line[0])
+            y = float(line[1])
+        except ValueError:
+            return None
+        if not (-1 <= x <= 1 and -1 <= y <= 1):
+            return None
+        return x, y
+
+    @staticmethod
+    def __parse_voter_details(values: list[str]) -> tuple[int, bool] | None:
+        """
+        Parses the weight and the delegation flag of a voter.
+
+        :param values: the weight and the delegation flag (0 or 1)
+        :return: tuple(weight, delegation flag), or None if they are not valid
+        """
+        try:
+            weight = float(values[0])
+            delegation = float(values[1])
+        except ValueError:
+            return None
+        if not weight.is_integer() or weight < 0 or delegation not in (0, 1):
+            return None
+        return int(weight), bool(delegation)
+
+    def import_objects_from_binary_file(
+            self,
+            filename: str,
+            on_error: Callable[[str, str], None],
+            on_success: Callable[[np.ndarray, np.ndarray, np.ndarray, np.ndarray, list, list], None],
+            on_progress: Callable[[float], None] | None = None,
+            is_cancelled: Callable[[], bool] | None = None
+    ) -> int:
+        """
+        Imports the candidates and/or voters from a binary file (see FileManager).
+
+        The voters' and candidates' arrays are memory-mapped copy-on-write: they are only read from the
+        file when used, and can be modified without modifying the file. The voters' coordinates and weights
+        are checked by chunks of rows, so that checking them doesn't hold a copy of the whole file in memory.
+
+        :param filename: name of the file to import from
+        :param on_error: error callback
+        :param on_success: success callback, called with the voters' coordinates, delegation flags
+                           and weights, and the candidates' coordinates, labels and colors
+        :param on_progress: progress callback, called with the fraction of the voters checked after each chunk
+        :param is_cancelled: called after each chunk, the import stops without calling any callback if it returns True
+        :return: 0 if file is imported, -1 if any error is generated or if the import is cancelled
+        """
+        error_title = "Erreur de lecture"
+        invalid_file_message = "Le fichier n'est pas un fichier de données binaire valide."
+
+        with open(filename, "rb") as f:
+            header = f.read(self.__binary_header.size)
+            if len(header) < self.__binary_header.size:
+                on_error(error_title, invalid_file_message)
+                return -1
+            magic, version, item_size, nb_voters, nb_candidates, table_size = self.__binary_header.unpack(header)
+            if magic != self.__binary_magic or version != self.__binary_version or item_size not in (4, 8):
+                on_error(error_title, invalid_file_message)
+                return -1
+
+            layout = self.__binary_layout(item_size, nb_voters, nb_candidates)
+            table_offset = layout.pop("table")[0]
+            if os.path.getsize(filename) < table_offset + table_size:
+                on_error(error_title, invalid_file_message)
+                return -1
+            f.seek(table_offset)
+            table = f.read(table_size)
+
+        try:
+            labels, colors = zip(*json.loads(table.decode("utf-8"))) if nb_candidates else ((), ())
+        except (UnicodeDecodeError, ValueError, TypeError):
+            on_error(error_title, invalid_file_message)
+            return -1
+        if len(labels) != nb_candidates:
+            on_error(error_title, invalid_file_message)
+            return -1
+
+        arrays = {}
+        for name, (offset, dtype, shape) in layout.items():
+            if math.prod(shape) == 0:
+                # Empty files can't be memory-mapped
+                arrays[name] = np.empty(shape, dtype=dtype)
+            else:
+                arrays[name] = np.memmap(filename, dtype=dtype, mode="c", offset=offset, shape=shape)
+
+        if not self.__are_coordinates_valid(arrays["candidates"]):
+            on_error(error_title, "Les coordonnées du fichier sont invalides.")
+            return -1
+        for start in range(0, nb_voters, self.__chunk_size * 16):
+            if is_cancelled is not None and is_cancelled():
+                return -1
+            stop = min(start + self.__chunk_size * 16, nb_voters)
+            if not self.__are_coordinates_valid(arrays["voters"][start:stop]):
+                on_error(error_title, "Les coordonnées du fichier sont invalides.")
+                return -1
+            if (arrays["weights"][start:stop] < 0).any():
+                on_error(error_title, invalid_file_message)
+                return -1
+            if on_progress is not None:
+                on_progress(stop / nb_voters)
+
+        on_success(
+            arrays["voters"],
+            arrays["delegations"],
+            arrays["weights"],
+            arrays["candidates"],
+            list(labels),
+            list(colors)
+        )
+        return 0
+
+    def import_objects_from_archive(
+            self,
+            filename: str,
+            on_error: Callable[[str, str], None],
+            on_success: Callable[[np.ndarray, np.ndarray, np.ndarray, np.ndarray, list, list], None],
+            on_progress: Callable[[float], None] | None = None,
+            is_cancelled: Callable[[], bool] | None = None
+    ) -> int:
+        """
+        Imports the candidates and/or voters from an archive (see FileManager).
+
+        :param filename: name of the file to import from
+        :param on_error: error callback
+        :param on_success: success callback, called with the voters' coordinates, delegation flags
+                           and weights, and the candidates' coordinates, labels and colors
+        :param on_progress: progress callback, called with the fraction of the sections read after each section
+        :param is_cancelled: called after each section, the import stops without calling any callback if it returns True
+        :return: 0 if file is imported, -1 if any error is generated or if the import is cancelled
+        """
+        sections = {}
+        for index, section in enumerate(("candidates", "voters", "delegations")):
+            if is_cancelled is not None and is_cancelled():
+                return -1
+            try:
+                sections[section] = self.read_archive_section(filename, section)
+            except ValueError as error:
+                on_error("Erreur de lecture", str(error))
+                return -1
+            if on_progress is not None:
+                on_progress((index + 1) / 3)
+        candidates, labels, colors = sections["candidates"]
+        voters = sections["voters"]
+        delegations = sections["delegations"]
+
+        on_success(
+            voters,
+            delegations["has_delegated_vote"],
+            delegations["weight"],
+            candidates,
+            labels,
+            colors
+        )
+        return 0
+
+    def read_archive_section(self, filename: str, section: str):
+        """
+        Reads a single section of an archive (see FileManager), without decompressing the other ones.
+
+        :param filename: name of the archive
+        :param section: "scenario", "candidates", "voters", "delegations" or "results"
+        :return: for "scenario", dict(version, nb_voters, nb_candidates),
+                 for "candidates", tuple(coordinates of shape (nb_candidates, 2), labels, colors),
+                 for "voters", the coordinates of shape (nb_voters, 2),
+                 for "delegations", a structured array with the fields "weight" and "has_delegated_vote",
+                 for "results", the cached results, or None if there are none
+        :raise ValueError: if the file is not a valid archive
+        """
+        invalid_file_message = "Le fichier n'est pas une archive de scénario valide."
+
+        try:
+            with zipfile.ZipFile(filename) as archive:
+                scenario = json.loads(archive.read(self.__archive_members["scenario"]).decode("utf-8"))
+                if scenario.get("version") != self.__archive_version:
+                    raise ValueError(invalid_file_message)
+                nb_voters = scenario["nb_voters"]
+                nb_candidates = scenario["nb_candidates"]
+                if section == "scenario":
+                    return scenario
+
+                member = self.__archive_members[section]
+                if section == "results" and member not in archive.namelist():
+                    return None
+                with archive.open(member) as f:
+                    if member.endswith(".json"):
+                        content = json.loads(f.read().decode("utf-8"))
+                    else:
+                        content = np.lib.format.read_array(f, allow_pickle=False)
+        except (OSError, KeyError, TypeError, AttributeError, ValueError, zipfile.BadZipFile) as error:
+            raise ValueError(invalid_file_message) from error
+
+        if section == "results":
+            return content
+
+        if section == "candidates":
+            if not isinstance(content, list) or len(content) != nb_candidates:
+                raise ValueError(invalid_file_message)
+            try:
+                coordinates = np.array([(x, y) for x, y, label, color in content], dtype=np.float64).reshape(-1, 2)
+            except (ValueError, TypeError) as error:
+                raise ValueError(invalid_file_message) from error
+            content = (coordinates, [candidate[2] for candidate in content], [candidate[3] for candidate in content])
+        elif section == "voters":
+            if content.dtype.kind != "f" or content.shape != (nb_voters, 2):
+                raise ValueError(invalid_file_message)
+            coordinates = content
+        else:
+            if content.dtype != self.__delegations_dtype or content.shape != (nb_voters,) or (content["weight"] < 0).any():
+                raise ValueError(invalid_file_message)
+            return content
+
+        if not ((-1 <= coordinates) & (coordinates <= 1)).all():
+            raise ValueError("Les coordonnées du fichier sont invalides.")
+        return content
+
+    def export_scenario_archive(
+            self,
+            filename: str,
+            candidates: ArrayStore,
+            voters: ArrayStore,
+            results: dict | None = None
+    ):
+        """
+        Writes a scenario to an archive (see FileManager), each section being compressed separately.
+
+        :param filename: name of the file to write to
+        :param candidates: the candidates
+        :param voters: the voters
+        :param results: results to cache with the scenario, which must be serializable to JSON
+        """
+        delegations = np.empty(len(voters), dtype=self.__delegations_dtype)
+        delegations["weight"] = voters.get_column("weight")
+        delegations["has_delegated_vote"] = voters.get_column("has_delegated_vote")
+        sections = {
+            "scenario": {
+                "version": self.__archive_version,
+                "nb_voters": len(voters),
+                "nb_candidates": len(candidates),
+            },
+            "candidates": [
+                [x, y, label, color] for x, y, label, color in zip(
+                    candidates.get_column("x").tolist(),
+                    candidates.get_column("y").tolist(),
+                    candidates.get_column("label"),
+                    candidates.get_column("color")
+                )
+            ],
+            "voters": np.column_stack((voters.get_column("x"), voters.get_column("y"))).astype("<f8", copy=False),
+            "delegations": delegations,
+        }
+        if results is not None:
+            sections["results"] = results
+
+        with zipfile.ZipFile(filename, "w", compression=zipfile.ZIP_DEFLATED, compresslevel=1) as archive:
+            for section, content in sections.items():
+                member = self.__archive_members[section]
+                if member.endswith(".json"):
+                    archive.writestr(member, json.dumps(content))
                 else:
-                    label = None
-                    color = None
+                    with archive.open(member, "w", force_zip64=True) as f:
+                        np.lib.format.write_array(f, content, allow_pickle=False)
+
+    @staticmethod
+    def __are_coordinates_valid(coordinates: np.ndarray) -> bool:
+        """
+        :param coordinates: array of shape (nb_points, 2)
+        :return: whether all the coordinates are in [-1, 1] or not
+        """
+        return bool(((-1 <= coordinates) & (coordinates <= 1)).all())
+
+    def __binary_layout(self, item_size: int, nb_voters: int, nb_candidates: int) -> dict[str, tuple]:
+        """
+        Computes the position of the blocks of a binary file (see FileManager).
+
+        :param item_size: the size of the coordinates, in bytes
+        :param nb_voters: the number of voters
+        :param nb_candidates: the number of candidates
+        :return: dict({..., <block name>: tuple(offset, dtype, shape), ...}), in the order of the file
+        """
+        coordinates = np.dtype(f"<f{item_size}")
+        blocks = [
+            ("voters", coordinates, (nb_voters, 2)),
+            ("weights", np.dtype("<i8"), (nb_voters,)),
+            ("delegations", np.dtype(np.bool_), (nb_voters,)),
+            ("candidates", coordinates, (nb_candidates, 2)),
+            ("table", np.dtype(np.uint8), (0,)),
+        ]
+
+        layout = {}
+        offset = self.__binary_header.size
+        for name, dtype, shape in blocks:
+            # Align the block on 8 bytes
+            offset += -offset % 8
+            layout[name] = (offset, dtype, shape)
+            offset += dtype.itemsize * math.prod(shape)
+        return layout
+
+    def __export_objects_to_binary_file(
+            self,
+            filename: str,
+            candidates: ArrayStore,
+            voters: ArrayStore,
+            dtype: type
+    ):
+        """
+        Writes the candidates and voters to a binary file (see FileManager).
 
-                if object == "Candidats":
-                    candidates.append((x, y, label, color))
-                elif object == "Votants":
-                    voters.append((x, y))
+        :param filename: name of the file to write to
+        :param candidates: the candidates
+        :param voters: the voters
+        :param dtype: the type of the coordinates, np.float32 or np.float64
+        """
+        table = json.dumps(
+            [[label, color] for label, color in zip(candidates.get_column("label"), candidates.get_column("color"))]
+        ).encode("utf-8")
+        item_size = np.dtype(dtype).itemsize
+        layout = self.__binary_layout(item_size, len(voters), len(candidates))
+        arrays = {
+            "voters": np.column_stack((voters.get_column("x"), voters.get_column("y"))),
+            "weights": voters.get_column("weight"),
+            "delegations": voters.get_column("has_delegated_vote"),
+            "candidates": np.column_stack((candidates.get_column("x"), candidates.get_column("y"))),
+        }
+
+        with open(filename, "wb") as f:
+            f.write(self.__binary_header.pack(
+                self.__binary_magic, self.__binary_version, item_size, len(voters), len(candidates), len(table)
+            ))
+            for name, (offset, block_dtype, shape) in layout.items():
+                f.write(bytes(offset - f.tell()))
+                if name == "table":
+                    f.write(table)
                 else:
-                    on_error(error_title, self.create_error_message(i, True))
-                    return -1
-        f.close()
-        on_success(voters, candidates)
-        return 0
+                    arrays[name].astype(block_dtype, copy=False).reshape(shape).tofile(f)
 
     def export_objects_to_file(
             self,
-            candidates: list[Candidate],
-            voters: list[Voter],
+            candidates: ArrayStore,
+            voters: ArrayStore,
             on_error: Callable[[str, str], None],
-            on_success: Callable[[str, str], None]
+            on_success: Callable[[str, str], None],
+            binary: bool = False,
+            compress: bool = False,
+            archive: bool = False
     ) -> int:
         """
         Creates a new file and writes the coordinates of the candidates and/or voters present on the graph in it.
         The file is created in the directory 'files'.
 
-        :param candidates: the list of candidates
-        :param voters: the list of voters
+        :param candidates: the candidates
+        :param voters: the voters
         :param on_error: error callback
         :param on_success: success callback
+        :param binary: whether to write a binary file (see FileManager) or a text file
+        :param compress: whether to compress the text file with gzip or not
+        :param archive: whether to write an archive (see FileManager), rather than a binary or text file
         :return: 0 if file is exported, -1 if any error is generated
         """
-        if candidates == [] and voters == []:
+        if not candidates and not voters:
             on_error("Erreur de sauvegarde", "Il n'y a ni candidats ni votants sur le graphe.")
             return -1
 
-        filename = "donnees-" + time.strftime("%d%m%Y-%H%M%S") + ".csv"
+        if archive:
+            extension = self.__archive_extension
+        elif binary:
+            extension = self.__binary_extension
+        else:
+            extension = ".csv.gz" if compress else ".csv"
+        filename = "donnees-" + time.strftime("%d%m%Y-%H%M%S") + extension
         if not os.path.isdir("./files/"):
             os.mkdir("./files/")
-        file = open("./files/" + filename, "w")
 
-        if candidates:
-            file.write("Candidats\n")
-            for candidate in candidates:
-                x, y = candidate.coordinates()
-                output = [str(x), str(y), candidate.get_label(), candidate.get_color()]
-                file.write(self.__separator.join(output) + "\n")
-
-        if voters:
-            if candidates:
-                file.write("\n")
-            file.write("Votants\n")
-            for voter in voters:
-                x, y = voter.coordinates()
-                output = [str(x), str(y)]
-                file.write(self.__separator.join(output) + "\n")
-
-        file.close()
+        if archive:
+            self.export_scenario_archive("./files/" + filename, candidates, voters)
+        elif binary:
+            self.__export_objects_to_binary_file("./files/" + filename, candidates, voters, np.float64)
+        else:
+            self.__export_objects_to_text_file("./files/" + filename, candidates, voters, compress)
 
         on_success("Sauvegarde réussie", "Le fichier " + filename + " a été créé dans le répertoire 'files'.")
 
         return 0
+
+    def __export_objects_to_text_file(self, filename: str, candidates: ArrayStore, voters: ArrayStore, compress: bool):
+        """
+        Writes the candidates and voters to a text file, in the latest version of the format:
+        each voter's line holds their coordinates, weight and delegation flag (0 or 1).
+
+        The voters' lines are formatted from the voters' arrays by chunks, and each chunk is written at once.
+
+        :param filename: name of the file to write to
+        :param candidates: the candidates
+        :param voters: the voters
+        :param compress: whether to compress the file with gzip or not
+        """
+        if compress:
+            file = gzip.open(filename, "wt", compresslevel=1, newline="")
+        else:
+            file = open(filename, "w", newline="", buffering=1 << 20)
+
+        with file:
+            file.write(self.__version_header + str(self.__text_version) + "\n")
+
+            if candidates:
+                file.write("Candidats\n")
+                csv.writer(file, delimiter=self.__separator, lineterminator="\n").writerows(zip(
+                    candidates.get_column("x").tolist(),
+                    candidates.get_column("y").tolist(),
+                    candidates.get_column("label"),
+                    candidates.get_column("color")
+                ))
+
+            if voters:
+                if candidates:
+                    file.write("\n")
+                file.write("Votants\n")
+                # Floats are written as str() does, so that they are read back exactly
+                line_format = self.__separator.join(["%r", "%r", "%d", "%d"]) + "\n"
+                columns = [
+                    voters.get_column("x"),
+                    voters.get_column("y"),
+                    voters.get_column("weight"),
+                    voters.get_column("has_delegated_vote").view(np.uint8)
+                ]
+                for start in range(0, len(voters), self.__chunk_size):
+                    chunk = [column[start:start + self.__chunk_size].tolist() for column in columns]
+                    file.write("".join(map(line_format.__mod__, zip(*chunk))))
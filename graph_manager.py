@@ -1,12 +1,19 @@
-import math
 from tkinter import Widget, Canvas
-from typing import Callable
+from typing import Callable, Sequence
 
+import numpy as np
 from matplotlib import pyplot as plt
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+from matplotlib.collections import PathCollection
+from matplotlib.colors import ListedColormap, to_rgba
+from matplotlib.path import Path
 from matplotlib.patheffects import withStroke
+from matplotlib.transforms import Affine2D, AffineDeltaTransform
 
+from array_store import ArrayStore
 from candidate import Candidate
+from change_set import ChangeSet
+from profile_manager import ProfileManager
 from voter import Voter
 
 
@@ -21,20 +28,10 @@ class GraphManager:
     re-drawing with build() and click-handling with bind(). !
     """
 
-    # Store the voters' data (points and annotations) in the form of:
-    # list (tuple(str("voter_label"), tuple(point, annotation)))
-    __voters = list()
-
     # Store the candidates' data (points and annotations) in the form of:
     # list (tuple(str("candidate_label"), tuple(point, annotation)))
     __candidates = list()
 
-    # Store the plotted candidates' approbation approval circles
-    __approbation_circles = list()
-
-    # Store the plotted voters' closeness circles
-    __closeness_circles = list()
-
     # Font and marker size for annotations
     __font_size = 8
     __marker_size = 4
@@ -42,13 +39,25 @@ class GraphManager:
     # Variable to keep track of the toggle button state
     __toggle_state = False
 
-    def __init__(self, tk_root: Widget):
+    # Maximum number of voters' labels shown at once
+    __max_voter_annotations = 200
+
+    # Number of bins along each axis of the voters' density image
+    __density_bins = 256
+
+    def __init__(self, tk_root: Widget, density_threshold: int = 100_000):
+        """
+        :param tk_root: the widget in which to display the graph
+        :param density_threshold: number of voters above which voters are drawn as a density image
+        """
+        self.__density_threshold = density_threshold
+
         # Create a figure
         self.__fig = plt.figure()
 
         # Create and configure axes for the graph
         self.__axes = self.__fig.add_subplot()
-        self.__axes.set(xlim=(-1.1, 1.1), ylim=(-1.1, 1.1))
+        self.__axes.set(xlim=ProfileManager.GRAPH_LIMITS, ylim=ProfileManager.GRAPH_LIMITS)
         # Add text on top, right, bottom and left side of graph respectively
         self.__axes.text(
             0.5,
@@ -99,42 +108,107 @@ class GraphManager:
         self.__axes.xaxis.set_ticks_position("bottom")
         self.__axes.yaxis.set_ticks_position("left")
 
+        # Store the voters' data in arrays, and plot all their points as collections whose
+        # offsets are updated from the arrays when the graph is built. There is one collection
+        # per color (voters who have delegated their vote are grey): with a single color,
+        # matplotlib draws a collection by stamping the same marker, which is much faster.
+        self.__nb_voters = 0
+        self.__voter_offsets = np.empty((0, 2))
+        self.__voter_delegations = np.empty(0, dtype=bool)
+        # Store of the voters in the data, from which the labels are only read when they are shown
+        self.__voters = None
+        self.__voter_points = self.__axes.scatter(
+            [], [], s=(self.__marker_size + 1) ** 2, color="black", linewidths=0, zorder=10, animated=True
+        )
+        self.__delegated_voter_points = self.__axes.scatter(
+            [], [], s=(self.__marker_size + 1) ** 2, color="grey", linewidths=0, zorder=10, animated=True
+        )
+        self.__are_voter_points_outdated = False
+        # Annotations of the voters whose labels are shown: dict({..., <voter index>: annotation, ...})
+        # Labels are only shown for the first voters in view (up to __max_voter_annotations), and their
+        # annotations are created when they are shown, and removed when they are hidden.
+        self.__voter_annotations = {}
+        # View in which the shown labels were chosen, and whether the voters have changed since
+        self.__annotated_view = None
+        self.__are_voter_annotations_outdated = False
+
+        # Past the density threshold, voters are drawn as an image of the number of voters in each bin
+        # of a grid covering the graph instead. The counts are kept up to date as voters are added.
+        self.__voter_counts = np.zeros((self.__density_bins, self.__density_bins), dtype=np.int64)
+        # (empty bins are transparent, and the lightest grey is still visible)
+        cmap = ListedColormap(plt.get_cmap("Greys")(np.linspace(0.3, 1, 256)))
+        cmap.set_bad(alpha=0)
+        self.__voter_density = self.__axes.imshow(
+            np.ma.masked_equal(self.__voter_counts.T, 0),
+            cmap=cmap,
+            extent=(*self.__axes.get_xlim(), *self.__axes.get_ylim()),
+            origin="lower",
+            aspect="auto",
+            interpolation="nearest",
+            alpha=0.8,
+            zorder=10,
+            animated=True,
+            # Unlike other animated artists, images are still drawn by full redraws of the figure,
+            # so the image is only made visible while it is drawn on its own (see __draw_voter_points())
+            visible=False,
+        )
+
+        # Everything plotted after this point is animated: it is left out of the full redraws of
+        # the figure, and drawn on top of cached images of the graph instead (blitting). Two images
+        # are cached: the static background (axes, texts), and the background with the voters'
+        # points on it, on which newly added voters can be drawn without redrawing the others.
+        self.__background = None
+        self.__voters_background = None
+        # Number of voters drawn on __voters_background, and whether they have changed since
+        self.__nb_drawn_voters = 0
+        self.__are_drawn_voters_outdated = True
+        # Collections used to draw the newly added voters' points only
+        self.__new_voter_points = self.__axes.scatter(
+            [], [], s=(self.__marker_size + 1) ** 2, color="black", linewidths=0, zorder=10, animated=True
+        )
+        self.__new_delegated_voter_points = self.__axes.scatter(
+            [], [], s=(self.__marker_size + 1) ** 2, color="grey", linewidths=0, zorder=10, animated=True
+        )
+
+        # Approval circles around candidates, and closeness circles around voters
+        self.__approbation_circles, self.__approbation_radius = self.__add_circles()
+        self.__closeness_circles, self.__closeness_radius = self.__add_circles()
+
         # Create a tkinter canvas to display the graph
         self.__canvas = FigureCanvasTkAgg(self.__fig, master=tk_root)
+        # Cache the images again whenever the whole figure is redrawn (first build, resize, ...)
+        self.__canvas.mpl_connect("draw_event", self.__on_draw)
 
-    def add_voter(self, voter: Voter) -> bool:
+    def add_voters(self, voters: ArrayStore, index: int):
         """
-        Adds the voter to the graph (point and annotation), without building it.
+        Adds the voters of a store from the given index to the graph, without building it.
         Calling build() is necessary to see the updated changes.
 
-        :param voter: the voter to add
-        :return: whether the voter was successfully added or not
-        """
-        if voter.get_label() in self.__voters:
-            return False
-
-        # Plot the voter on the graph
-        point, = self.__axes.plot(
-            voter.coordinates()[0],
-            voter.coordinates()[1],
-            "o",
-            markersize=self.__marker_size,
-            color="grey" if voter.has_delegated_vote() else "black",
-            zorder=10,
-        )
-        # Label the point on the graph
-        annotation = self.__axes.annotate(
-            text=voter.get_label(),
-            xy=voter.coordinates(),
-            xytext=(voter.coordinates()[0] - 0.02, voter.coordinates()[1] + 0.05),
-            fontsize=self.__font_size,
-            color="grey" if voter.has_delegated_vote() else "black",
-            zorder=11,
-        )
-        # Add voter to the dict
-        self.__voters.append((voter.get_label(), (point, annotation)))
-
-        return True
+        The voters' coordinates and delegation flags are copied from the store's columns,
+        while their labels are read from the store when they are shown.
+
+        :param voters: the voters in the data (see DataManager.get_voters())
+        :param index: index of the first voter to add, which must be the number of voters on the graph
+        """
+        nb_voters = len(voters)
+        if nb_voters > len(self.__voter_offsets):
+            # Double the capacity of the arrays
+            capacity = max(nb_voters, 2 * len(self.__voter_offsets))
+            offsets = np.empty((capacity, 2))
+            offsets[:index] = self.__voter_offsets[:index]
+            self.__voter_offsets = offsets
+            delegations = np.empty(capacity, dtype=bool)
+            delegations[:index] = self.__voter_delegations[:index]
+            self.__voter_delegations = delegations
+
+        self.__voter_offsets[index:nb_voters, 0] = voters.get_column("x")[index:]
+        self.__voter_offsets[index:nb_voters, 1] = voters.get_column("y")[index:]
+        self.__voter_delegations[index:nb_voters] = voters.get_column("has_delegated_vote")[index:]
+        self.__voters = voters
+        self.__count_voters(self.__voter_offsets[index:nb_voters])
+        self.__nb_voters = nb_voters
+        self.__are_voter_points_outdated = True
+        self.__are_voter_annotations_outdated = True
 
     def edit_voter_at(self, index: int, voter: Voter):
         """
@@ -144,41 +218,86 @@ class GraphManager:
         :param index: index of the desired voter
         :param voter: new voter data
         """
-        label, (point, annotation) = self.__voters[index]
-        point.remove()
-        annotation.remove()
-
-        # Plot the voter on the graph
-        point, = self.__axes.plot(
-            voter.coordinates()[0],
-            voter.coordinates()[1],
-            'o',
-            markersize=self.__marker_size,
-            color="grey" if voter.has_delegated_vote() else "black",
-            zorder=10,
-        )
-        # Label the point on the graph
-        annotation = self.__axes.annotate(
-            text=voter.get_label(),
-            xy=voter.coordinates(),
-            xytext=(voter.coordinates()[0] - 0.02, voter.coordinates()[1] + 0.05),
-            fontsize=self.__font_size,
-            color="grey" if voter.has_delegated_vote() else "black",
-            zorder=10,
-        )
-        # Replace voter in the dict
-        self.__voters[index] = (voter.get_label(), (point, annotation))
+        self.__count_voters(self.__voter_offsets[index:index + 1], -1)
+        self.__voter_offsets[index] = voter.coordinates()
+        self.__count_voters(self.__voter_offsets[index:index + 1])
+        self.__voter_delegations[index] = voter.has_delegated_vote()
+        self.__are_voter_points_outdated = True
+        self.__are_drawn_voters_outdated = True
+        self.__are_voter_annotations_outdated = True
+
+        # Update the label, if it is shown
+        annotation = self.__voter_annotations.get(index)
+        if annotation is not None:
+            annotation.remove()
+            self.__voter_annotations[index] = self.__annotate_voter(index)
 
     def clear_voters(self):
         """
         Clears all the voters from the graph, without building it.
         Calling build() is necessary to see the updated changes.
         """
-        for (label, (point, annotation)) in self.__voters:
-            point.remove()
+        for annotation in self.__voter_annotations.values():
             annotation.remove()
+        self.__voter_annotations.clear()
 
-        self.__voters.clear()
+        self.__voter_offsets = np.empty((0, 2))
+        self.__voter_delegations = np.empty(0, dtype=bool)
+        self.__voter_counts[:] = 0
+        self.clear_voter_closeness_circles()
+        self.__nb_voters = 0
+        self.__are_voter_points_outdated = True
+        self.__are_drawn_voters_outdated = True
+        self.__are_voter_annotations_outdated = True
+
+    def __update_voter_points(self):
+        """
+        Updates the offsets of the voters' points from the voters' arrays.
+        """
+        offsets = self.__voter_offsets[:self.__nb_voters]
+        delegations = self.__voter_delegations[:self.__nb_voters]
+        self.__voter_points.set_offsets(offsets[~delegations])
+        self.__delegated_voter_points.set_offsets(offsets[delegations])
+        self.__are_voter_points_outdated = False
+
+    def __count_voters(self, offsets: np.ndarray, sign: int = 1):
+        """
+        Adds voters to (or removes them from) the counts of the bins of the voters' density image.
+
+        :param offsets: the voters' coordinates, as an array of shape (nb_voters, 2)
+        :param sign: 1 to add the voters, -1 to remove them
+        """
+        (x_min, x_max), (y_min, y_max) = self.__axes.get_xlim(), self.__axes.get_ylim()
+        xs = ((offsets[:, 0] - x_min) / (x_max - x_min) * self.__density_bins).astype(np.int64)
+        ys = ((offsets[:, 1] - y_min) / (y_max - y_min) * self.__density_bins).astype(np.int64)
+        bins = np.clip(xs, 0, self.__density_bins - 1) * self.__density_bins + np.clip(ys, 0, self.__density_bins - 1)
+        counts = np.bincount(bins, minlength=self.__density_bins ** 2)
+        self.__voter_counts += sign * counts.reshape(self.__density_bins, self.__density_bins)
+
+    def __is_density_shown(self) -> bool:
+        """
+        :return: whether voters are drawn as a density image or not
+        """
+        return self.__nb_voters > self.__density_threshold
+
+    def __annotate_voter(self, index: int):
+        """
+        Labels the point of the voter at the given index on the graph.
+
+        :param index: index of the voter
+        :return: the annotation
+        """
+        x, y = self.__voter_offsets[index]
+        color = "grey" if self.__voter_delegations[index] else "black"
+        return self.__axes.annotate(
+            text=self.__voters.get("label", index),
+            xy=(x, y),
+            xytext=(x - 0.02, y + 0.05),
+            fontsize=self.__font_size,
+            color=color,
+            zorder=11,
+            animated=True,
+        )
 
     def add_candidate(self, candidate: Candidate) -> bool:
         """
@@ -192,6 +311,29 @@ class GraphManager:
         if candidate.get_label() in self.__candidates:
             return False
 
+        # Add candidate to the dict
+        self.__candidates.append((candidate.get_label(), self.__plot_candidate(candidate)))
+
+        return True
+
+    def add_candidates(self, candidates: list[Candidate]):
+        """
+        Adds several candidates to the graph (points and annotations), without building it.
+        Calling build() is necessary to see the updated changes.
+
+        The candidates' labels are expected to be unique, as they are in the data.
+
+        :param candidates: the candidates to add
+        """
+        self.__candidates.extend((candidate.get_label(), self.__plot_candidate(candidate)) for candidate in candidates)
+
+    def __plot_candidate(self, candidate: Candidate) -> tuple:
+        """
+        Plots a candidate on the graph.
+
+        :param candidate: the candidate to plot
+        :return: tuple(point, annotation)
+        """
         # Plot the candidate on the graph
         point, = self.__axes.plot(
             candidate.coordinates()[0],
@@ -199,9 +341,10 @@ class GraphManager:
             's',
             markersize=self.__marker_size,
             color=candidate.get_color(),
-            zorder=11
+            zorder=11,
+            animated=True
         )
-        
+
         # Label the point on the graph
         annotation = self.__axes.annotate(
             text=candidate.get_label(),
@@ -209,12 +352,10 @@ class GraphManager:
             xytext=(candidate.coordinates()[0] - 0.02, candidate.coordinates()[1] + 0.05),
             fontsize=self.__font_size,
             zorder=11,
-            path_effects=[withStroke(linewidth=2, foreground="white")]
+            path_effects=[withStroke(linewidth=2, foreground="white")],
+            animated=True
         )
-        # Add candidate to the dict
-        self.__candidates.append((candidate.get_label(), (point, annotation)))
-
-        return True
+        return point, annotation
 
     def edit_candidate_at(self, index: int, candidate: Candidate):
         """
@@ -235,7 +376,8 @@ class GraphManager:
             's',
             markersize=self.__marker_size,
             color=candidate.get_color(),
-            zorder=11
+            zorder=11,
+            animated=True
         )
 
         # Label the point on the graph
@@ -245,7 +387,8 @@ class GraphManager:
             xytext=(candidate.coordinates()[0] - 0.02, candidate.coordinates()[1] + 0.05),
             fontsize=self.__font_size,
             zorder=11,
-            path_effects=[withStroke(linewidth=2, foreground="white")]
+            path_effects=[withStroke(linewidth=2, foreground="white")],
+            animated=True
         )
         # Replace candidate in the dict
         self.__candidates[index] = (candidate.get_label(), (point, annotation))
@@ -262,20 +405,139 @@ class GraphManager:
         self.__candidates.clear()
         self.clear_candidate_approbation_circles()
 
+    def apply_changes(self, changes: ChangeSet, voters: ArrayStore, candidates: Sequence[Candidate]):
+        """
+        Applies the changes made to the data during a batch (see DataManager.batch())
+        to the graph all at once, without building it.
+        Calling build() is necessary to see the updated changes.
+
+        :param changes: the changes made to the data during the batch
+        :param voters: the voters in the data
+        :param candidates: the candidates in the data
+        """
+        if changes.has_cleared_voters():
+            self.clear_voters()
+        for index in changes.get_edited_voters():
+            self.edit_voter_at(index, voters[index])
+        first_added_voter = changes.get_first_added_voter()
+        if first_added_voter is not None:
+            self.add_voters(voters, first_added_voter)
+
+        if changes.has_cleared_candidates():
+            self.clear_candidates()
+        for index in changes.get_edited_candidates():
+            self.edit_candidate_at(index, candidates[index])
+        first_added_candidate = changes.get_first_added_candidate()
+        if first_added_candidate is not None:
+            self.add_candidates(candidates[first_added_candidate:])
+
     def build(self):
         """
-        Toggles the visibility of the annotations of all voters based on the value of __toggle_state.
-        Builds the updated graph by calling canvas.draw().
+        Shows or hides the voters' labels based on the value of __toggle_state.
+        Builds the updated graph by drawing what changed on top of the cached images of the graph,
+        or by calling canvas.draw() if there are none yet.
         """
-        if self.__toggle_state:
-            # Shows annotations
-            for (_, (_, annotation)) in self.__voters:
-                annotation.set_visible(True)
+        self.__update_voter_annotations()
+
+        if self.__voters_background is None:
+            self.__canvas.draw()
+            return
+
+        if self.__are_drawn_voters_outdated or self.__is_density_shown():
+            self.__canvas.restore_region(self.__background)
+            self.__draw_voter_points()
         else:
-            # Hides annotations
-            for (_, (_, annotation)) in self.__voters:
-                annotation.set_visible(False)
-        self.__canvas.draw()
+            # Only the new voters need to be drawn
+            self.__canvas.restore_region(self.__voters_background)
+            self.__draw_new_voter_points()
+        self.__voters_background = self.__canvas.copy_from_bbox(self.__fig.bbox)
+        self.__draw_overlay()
+        self.__canvas.blit(self.__fig.bbox)
+
+    def __on_draw(self, event):
+        """
+        Caches the images of the graph once the figure has been redrawn,
+        and draws the animated artists on top of it.
+
+        :param event: the draw event
+        """
+        self.__background = self.__canvas.copy_from_bbox(self.__fig.bbox)
+        self.__draw_voter_points()
+        self.__voters_background = self.__canvas.copy_from_bbox(self.__fig.bbox)
+        self.__draw_overlay()
+
+    def __draw_voter_points(self):
+        """
+        Draws the points of all voters, or their density image past the density threshold.
+        """
+        if self.__is_density_shown():
+            self.__voter_density.set_data(np.ma.masked_equal(self.__voter_counts.T, 0))
+            self.__voter_density.set_clim(1, max(self.__voter_counts.max(), 1))
+            self.__voter_density.set_visible(True)
+            self.__axes.draw_artist(self.__voter_density)
+            self.__voter_density.set_visible(False)
+            self.__nb_drawn_voters = self.__nb_voters
+            self.__are_drawn_voters_outdated = False
+            return
+
+        if self.__are_voter_points_outdated:
+            self.__update_voter_points()
+        self.__axes.draw_artist(self.__voter_points)
+        self.__axes.draw_artist(self.__delegated_voter_points)
+        self.__nb_drawn_voters = self.__nb_voters
+        self.__are_drawn_voters_outdated = False
+
+    def __draw_new_voter_points(self):
+        """
+        Draws the points of the voters added since the voters were last drawn.
+        """
+        if self.__are_voter_points_outdated:
+            self.__update_voter_points()
+        offsets = self.__voter_offsets[self.__nb_drawn_voters:self.__nb_voters]
+        delegations = self.__voter_delegations[self.__nb_drawn_voters:self.__nb_voters]
+        for points, new_offsets in (
+                (self.__new_voter_points, offsets[~delegations]),
+                (self.__new_delegated_voter_points, offsets[delegations]),
+        ):
+            if len(new_offsets):
+                points.set_offsets(new_offsets)
+                self.__axes.draw_artist(points)
+                points.set_offsets(np.empty((0, 2)))
+        self.__nb_drawn_voters = self.__nb_voters
+
+    def __draw_overlay(self):
+        """
+        Draws the animated artists above the voters' points: candidates, annotations and circles.
+        """
+        artists = [artist for (label, (point, annotation)) in self.__candidates for artist in (point, annotation)]
+        artists.extend(self.__voter_annotations.values())
+        artists.extend((self.__approbation_circles, self.__closeness_circles))
+        for artist in sorted(artists, key=lambda artist: artist.get_zorder()):
+            self.__axes.draw_artist(artist)
+
+    def __update_voter_annotations(self):
+        """
+        Shows the labels of the first voters in view (up to __max_voter_annotations) if __toggle_state
+        is True, and hides all of them otherwise. Only the annotations which appear or disappear are
+        created or removed, and nothing is done if neither the voters nor the view have changed.
+        """
+        view = (self.__axes.get_xlim(), self.__axes.get_ylim())
+        if not self.__are_voter_annotations_outdated and view == self.__annotated_view:
+            return
+        self.__annotated_view = view
+        self.__are_voter_annotations_outdated = False
+
+        indexes = set()
+        if self.__toggle_state and not self.__is_density_shown():
+            (x_min, x_max), (y_min, y_max) = view
+            xs, ys = self.__voter_offsets[:self.__nb_voters].T
+            in_view = (x_min <= xs) & (xs <= x_max) & (y_min <= ys) & (ys <= y_max)
+            indexes = set(np.flatnonzero(in_view)[:self.__max_voter_annotations].tolist())
+
+        for index in self.__voter_annotations.keys() - indexes:
+            self.__voter_annotations.pop(index).remove()
+        for index in sorted(indexes - self.__voter_annotations.keys()):
+            self.__voter_annotations[index] = self.__annotate_voter(index)
 
     def get_toggle_state(self) -> bool:
         """
@@ -290,6 +552,24 @@ class GraphManager:
         :param value: the value to affect to toggle_state
         """
         self.__toggle_state = value
+        self.__are_voter_annotations_outdated = True
+
+    def get_density_threshold(self) -> int:
+        """
+        :return: number of voters above which voters are drawn as a density image
+        """
+        return self.__density_threshold
+
+    def set_density_threshold(self, density_threshold: int):
+        """
+        Sets the number of voters above which voters are drawn as a density image.
+        Calling build() is necessary to see the updated changes.
+
+        :param density_threshold: the new density threshold
+        """
+        self.__density_threshold = density_threshold
+        self.__are_drawn_voters_outdated = True
+        self.__are_voter_annotations_outdated = True
 
     def get_tk_widget(self) -> Canvas:
         """
@@ -314,92 +594,80 @@ class GraphManager:
 
         :return: the diagonal size of the graph
         """
-        return math.sqrt(
-            (int(self.__axes.get_xlim()[1]) - int(self.__axes.get_xlim()[0])) ** 2
-            + (int(self.__axes.get_ylim()[1]) - int(self.__axes.get_ylim()[0])) ** 2
-        )
+        return ProfileManager.compute_diagonal(self.__axes.get_xlim(), self.__axes.get_ylim())
 
-    def add_candidate_approbation_circles(self, approval_radius: int):
+    def __add_circles(self) -> tuple:
         """
-        Adds the approval circles around candidates on the graph.
-        Voters inside a candidate's circle are approving of them.
+        Adds an empty collection of circles to the graph. All the circles of the collection are
+        drawn from the same unit circle, moved to their centers (the offsets of the collection)
+        and scaled by the same transform, so that their radius can be changed in place.
 
-        :param approval_radius: Radius of the approval circle
+        :return: tuple(collection, scale transform)
         """
-        # Remove the already plotted approval circles
-        self.clear_candidate_approbation_circles()
+        radius = Affine2D()
+        circles = PathCollection(
+            [Path.unit_circle()],
+            offsets=np.empty((0, 2)),
+            offset_transform=self.__axes.transData,
+            transform=radius + AffineDeltaTransform(self.__axes.transData),
+            facecolors="none",
+            zorder=15,
+            animated=True,
+        )
+        self.__axes.add_collection(circles, autolim=False)
+        return circles, radius
 
-        # Calculate the multiplier in order to fill the diagonal:
-        #   - radius multiplier: diagonal size / x-axis size
-        #   - diameter multiplier: 2 * radius multiplier
-        multiplier = (
+    def __get_radius_multiplier(self) -> float:
+        """
+        Calculates the multiplier in order to fill the diagonal:
+          - radius multiplier: diagonal size / x-axis size
+          - diameter multiplier: 2 * radius multiplier
+
+        :return: the multiplier from a radius in % to a radius in the graph's coordinates
+        """
+        return (
             2
             * self.get_diagonal()
             / (int(self.__axes.get_xlim()[1]) - int(self.__axes.get_xlim()[0]))
         )
 
+    def add_candidate_approbation_circles(self, approval_radius: int):
+        """
+        Adds the approval circles around candidates on the graph, or updates their radius.
+        Voters inside a candidate's circle are approving of them.
+
+        :param approval_radius: Radius of the approval circle
+        """
         # For each candidate, plot the approval circles (color them accordingly)
-        for (candidate_label, (coordinates, _)) in self.__candidates:
-            xs, ys = coordinates.get_data()
-
-            # Plot the approval circle
-            circle = plt.Circle(
-                (xs[0], ys[0]),
-                multiplier * approval_radius / 100,
-                color=coordinates.get_color(),
-                fill=False,
-                zorder=15,
-            )
-            self.__approbation_circles.append(circle)
-            self.__axes.add_patch(circle)
+        points = [point for (candidate_label, (point, _)) in self.__candidates]
+        self.__approbation_circles.set_offsets(
+            np.array([point.get_xydata()[0] for point in points]).reshape(-1, 2)
+        )
+        self.__approbation_circles.set_edgecolors([point.get_color() for point in points])
+        self.__approbation_radius.clear().scale(self.__get_radius_multiplier() * approval_radius / 100)
 
     def clear_candidate_approbation_circles(self):
         """
         Clears the approval circles around candidates on the graph.
         """
-        # Remove the already plotted approval circles
-        for approbation_circle in self.__approbation_circles:
-            approbation_circle.remove()
-        self.__approbation_circles.clear()
+        self.__approbation_circles.set_offsets(np.empty((0, 2)))
 
     def add_voter_closeness_circles(self, closeness_radius: int):
         """
-        Adds the closeness circles around voters on the graph.
+        Adds the closeness circles around voters on the graph, or updates their radius.
 
-        :param approval_radius: Radius of the closeness circle
+        :param closeness_radius: Radius of the closeness circle
         """
-        # Remove the already plotted closeness circles
-        self.clear_voter_closeness_circles()
-
-        # Calculate the multiplier in order to fill the diagonal:
-        #   - radius multiplier: diagonal size / x-axis size
-        #   - diameter multiplier: 2 * radius multiplier
-        multiplier = (
-                2
-                * self.get_diagonal()
-                / (int(self.__axes.get_xlim()[1]) - int(self.__axes.get_xlim()[0]))
-        )
-
         # For each voter, plot the closeness circles (color them accordingly)
-        for (voter_label, (coordinates, _)) in self.__voters:
-            xs, ys = coordinates.get_data()
-
-            # Plot the closeness circle
-            circle = plt.Circle(
-                (xs[0], ys[0]),
-                multiplier * closeness_radius / 100,
-                color=coordinates.get_color(),
-                fill=False,
-                zorder=15,
-                )
-            self.__closeness_circles.append(circle)
-            self.__axes.add_patch(circle)
+        delegations = self.__voter_delegations[:self.__nb_voters]
+        self.__closeness_circles.set_offsets(self.__voter_offsets[:self.__nb_voters])
+        self.__closeness_circles.set_edgecolors(
+            np.where(delegations[:, np.newaxis], to_rgba("grey"), to_rgba("black"))
+        )
+        self.__closeness_radius.clear().scale(self.__get_radius_multiplier() * closeness_radius / 100)
 
     def clear_voter_closeness_circles(self):
         """
         Clears the closeness circles around voters on the graph.
         """
-        # Remove the already plotted approval circles
-        for closeness_circle in self.__closeness_circles:
-            closeness_circle.remove()
-        self.__closeness_circles.clear()
\ No newline at end of file
+        self.__closeness_circles.set_offsets(np.empty((0, 2)))
@@ -1,29 +1,37 @@
 import math
+import queue
 import random
 import string
+import threading
 
 import numpy as np
 from scipy.spatial.distance import cdist
 import tkinter as tk
 from tkinter import filedialog as fd
+from tkinter import ttk
 from tkinter.colorchooser import askcolor
 from PIL import Image, ImageTk
 
+from array_store import ArrayStore
 from keyboard_manager import KeyboardManager
 from candidate import Candidate
+from change_set import ChangeSet
 from data_manager import DataManager
 from graph_manager import GraphManager
 from file_manager import FileManager
+from profile_manager import ProfileManager
 from testing_helper import record_time
 from tooltip import bind_tooltip
 from voter import Voter
+from voting_details_manager import VotingDetails
 from voting_manager import VotingManager, CondorcetMethod, CondorcetTieBreakingRule
+from voting_profile import VotingProfile
 
 # Create a Data Manager
 data_manager = DataManager()
 
-# Create a Voting Manager
-voting_manager = VotingManager()
+# Create a Voting Manager, whose results' details can be shown
+voting_manager = VotingManager(VotingDetails())
 
 # Create a Keyboard Manager
 keyboard_manager = KeyboardManager()
@@ -31,6 +39,9 @@ keyboard_manager = KeyboardManager()
 # Create a File Manager
 file_manager = FileManager()
 
+# Create a Profile Manager
+profile_manager = ProfileManager()
+
 # Create a Details Voting Manager
 voting_details_manager = voting_manager.voting_details_manager
 
@@ -203,7 +214,24 @@ def on_voter_added(voter: Voter, index: int):
     :param index: index of the new voter
     """
     # Add voter on the graph
-    graph_manager.add_voter(voter)
+    graph_manager.add_voters(data_manager.get_voters(), index)
+
+    # Add voter to the profile
+    profile_manager.on_voter_added(voter, index)
+
+
+def on_voters_added(voters: ArrayStore, index: int):
+    """
+    Callback function for when several voters are added to the data at once.
+
+    :param voters: the voters in the data, the new ones starting at index
+    :param index: index of the first new voter
+    """
+    # Add voters on the graph
+    graph_manager.add_voters(voters, index)
+
+    # Add voters to the profile
+    profile_manager.on_voters_added(voters, index)
 
 
 def on_voter_edited(voter: Voter, index: int):
@@ -214,6 +242,7 @@ def on_voter_edited(voter: Voter, index: int):
     :param index: index of the edited candidate
     """
     graph_manager.edit_voter_at(index, voter)
+    profile_manager.on_voter_edited(voter, index)
 
 
 def on_voters_cleared():
@@ -222,6 +251,7 @@ def on_voters_cleared():
     """
     graph_manager.clear_voters()
     graph_manager.build()
+    profile_manager.on_voters_cleared()
 
 
 def on_candidate_added(candidate: Candidate, index: int):
@@ -237,6 +267,26 @@ def on_candidate_added(candidate: Candidate, index: int):
     # Add candidate in left panel
     list_box__candidates.insert(index, candidate.get_label())
 
+    # Add candidate to the profile
+    profile_manager.on_candidate_added(candidate, index)
+
+
+def on_candidates_added(candidates: list[Candidate], index: int):
+    """
+    Callback function for when several candidates are added to the data at once.
+
+    :param candidates: newly added candidates
+    :param index: index of the first new candidate
+    """
+    # Add candidates on the graph
+    graph_manager.add_candidates(candidates)
+
+    # Add candidates in left panel
+    list_box__candidates.insert(index, *[candidate.get_label() for candidate in candidates])
+
+    # Add candidates to the profile
+    profile_manager.on_candidates_added(candidates, index)
+
 
 def on_candidate_edited(candidate: Candidate, index: int):
     """
@@ -251,6 +301,8 @@ def on_candidate_edited(candidate: Candidate, index: int):
     list_box__candidates.delete(index)
     list_box__candidates.insert(index, candidate.get_label())
 
+    profile_manager.on_candidate_edited(candidate, index)
+
 
 def on_candidates_cleared():
     """
@@ -259,6 +311,31 @@ def on_candidates_cleared():
     graph_manager.clear_candidates()
     graph_manager.build()
     list_box__candidates.delete(0, tk.END)
+    profile_manager.on_candidates_cleared()
+
+
+def on_data_changed(changes: ChangeSet):
+    """
+    Callback function for when the data was changed in bulk (see DataManager.batch()).
+    The graph, the left panel and the profile are all updated at once.
+
+    :param changes: the changes made to the data
+    """
+    graph_manager.apply_changes(changes, data_manager.get_voters(), data_manager.get_candidates())
+
+    # Update candidates in left panel
+    candidates = data_manager.get_candidates()
+    if changes.has_cleared_candidates():
+        list_box__candidates.delete(0, tk.END)
+    for index in changes.get_edited_candidates():
+        list_box__candidates.delete(index)
+        list_box__candidates.insert(index, candidates[index].get_label())
+    if changes.get_first_added_candidate() is not None:
+        list_box__candidates.insert(
+            tk.END, *[candidate.get_label() for candidate in candidates[changes.get_first_added_candidate():]]
+        )
+
+    profile_manager.on_data_changed(changes)
 
 
 def on_candidate_error(error: str):
@@ -270,12 +347,15 @@ def on_candidate_error(error: str):
 
 # Bind callback functions with Data Manager
 data_manager.set_voter_added_callback(on_voter_added)
+data_manager.set_voters_added_callback(on_voters_added)
 data_manager.set_voter_edited_callback(on_voter_edited)
 data_manager.set_voters_cleared_callback(on_voters_cleared)
 data_manager.set_candidate_added_callback(on_candidate_added)
+data_manager.set_candidates_added_callback(on_candidates_added)
 data_manager.set_candidate_edited_callback(on_candidate_edited)
 data_manager.set_candidates_cleared_callback(on_candidates_cleared)
 data_manager.set_candidate_error_callback(on_candidate_error)
+data_manager.set_changes_callback(on_data_changed)
 
 
 def on_key_press(event):
@@ -505,16 +585,15 @@ def distribute(is_voter: bool):
     else:
         nb = default_nb_candidates_voters
 
-    for i in range(nb):
-        # Random coordinates
-        coordinates = (random.uniform(-1, 1), random.uniform(-1, 1))
+    # Random coordinates
+    coordinates = np.random.uniform(-1, 1, (nb, 2))
 
-        if is_voter:
-            # Voter :
-            data_manager.add_voter(coordinates)
-        else:
-            # Candidate :
-            data_manager.add_candidate(coordinates)
+    if is_voter:
+        # Voters :
+        data_manager.add_voters(coordinates)
+    else:
+        # Candidates :
+        data_manager.add_candidates(coordinates)
 
     # Build the graph: redraw the canvas
     graph_manager.build()
@@ -541,62 +620,32 @@ def distribute_gaussian(x: float, y: float):
 
         sigma = np.interp(spread_percentage, (min_spread_percentage, max_spread_percentage), (0.1, 0.7))
 
-        x_values = np.random.normal(x, sigma, nb**2)
-        y_values = np.random.normal(y, sigma, nb**2)
+        # Draw nb points at a time, keeping only the ones inside the graph, until there are enough
+        coordinates = np.empty((0, 2))
+        while len(coordinates) < nb:
+            values = np.random.normal((x, y), sigma, (nb, 2))
+            inside = np.all((-1 <= values) & (values <= 1), axis=1)
+            coordinates = np.vstack((coordinates, values[inside]))
+        coordinates = coordinates[:nb]
 
-        i = 0
-        for xs, ys in zip(x_values, y_values):
-            if i == nb:
-                break
-            if -1 <= xs <= 1 and -1 <= ys <= 1:
-                if is_voter_gaussian:
-                    data_manager.add_voter((xs, ys))
-                else:
-                    data_manager.add_candidate((xs, ys))
-                i += 1
+        if is_voter_gaussian:
+            data_manager.add_voters(coordinates)
+        else:
+            data_manager.add_candidates(coordinates)
         graph_manager.build()
 
     disable_all_buttons(False)
 
 
-def generate_profils():
+def generate_profils() -> VotingProfile | None:
     """
-    Function to generate the scores.
+    Function to generate the voting profile.
+    The profile is only computed again if the data changed since the last call.
 
-    :return: dict({..., <voter label>: tuple(list(..., tuple(<candidate label>, <approval ratio>), ...), weight), ...})
+    :return: the voting profile of the voters who haven't delegated their vote, None if there are no such voters or no candidates
     """
-    # Dictionary to store the scores for each voter
-    profils = dict()
-
     # Calculates the max distance (diagonal) of the plot
-    maximum = graph_manager.get_diagonal()
-
-    # List of voters
-    voters = data_manager.get_voters()
-
-    # List of voters who haven't delegated their vote
-    voters_no_delegation = [voter for voter in voters if not voter.has_delegated_vote()]
-
-    # List of candidates
-    candidates = data_manager.get_candidates()
-
-    # Loop to calculate the scores for each voter
-    for voter in voters_no_delegation:
-        # profil = list(...tuple(<candidate label>, <approval ratio>)...)
-        profil = list(map(
-            lambda candidate:
-            (
-                candidate.get_label(),
-                (maximum - math.dist(voter.coordinates(), candidate.coordinates())) / maximum
-            ),
-            candidates
-        ))
-        # Sort by closest match
-        profil.sort(key=lambda x: x[1], reverse=True)
-        # profils = dict({...<voter label>: <profil>...})
-        profils[voter.get_label()] = (profil, voter.get_weight())
-
-    return profils
+    return profile_manager.get_profile(data_manager, graph_manager.get_diagonal())
 
 
 def validate_approval_radius(*args):
@@ -616,7 +665,7 @@ def show_approbation_popup(profils, is_multiple_method):
     """
     Show a popup asking the user for the approval circle's radius.
 
-    :param profils: Scores for each voter
+    :param profils: voting profile (None in the "multiple method" version, where it is not used)
     :param is_multiple_method: boolean to check if we need the "multiple method" version or not
     """
     global top_approbation
@@ -687,7 +736,7 @@ def show_borda_popup(profils, is_multiple_method):
     Show a popup asking the user for the maximum score attribution in borda.
 
     :param is_multiple_method: boolean to check if we need the "multiple method" version or not
-    :param profils: Scores for each voter
+    :param profils: voting profile (None in the "multiple method" version, where it is not used)
     """
     global top_borda
     top_borda = tk.Toplevel(root)
@@ -751,7 +800,7 @@ def calculate_approbation(profils, approval_radius):
     """
     Determine winner using the approval voting system (système de vote par approbation).
 
-    :param profils: Scores for each voter
+    :param profils: voting profile
     :param approval_radius: Radius of the approval circle
     """
     # Show circles on the graph
@@ -808,7 +857,7 @@ def show_combined_voting_systems_popup():
     var_approbation.trace(
         "w",
         lambda *args: [
-            show_approbation_popup(generate_profils(), True) if var_approbation.get() == 1 else None
+            show_approbation_popup(None, True) if var_approbation.get() == 1 else None
         ]
     )
 
@@ -817,7 +866,7 @@ def show_combined_voting_systems_popup():
     var_borda.trace(
         "w",
         lambda *args: [
-            show_borda_popup(generate_profils(), True) if var_borda.get() == 1 else None
+            show_borda_popup(None, True) if var_borda.get() == 1 else None
         ]
     )
     check_borda = tk.Checkbutton(top_combined_mode, text="Borda", variable=var_borda, anchor="w")
@@ -838,7 +887,7 @@ def show_combined_voting_systems_popup():
     var_condorcet.trace(
         "w",
         lambda *args: [
-            show_condorcet_popup(generate_profils(), True) if var_condorcet.get() == 1 else None
+            show_condorcet_popup(None, True) if var_condorcet.get() == 1 else None
         ]
     )
     check_condorcet = tk.Checkbutton(top_combined_mode, text="Condorcet", variable=var_condorcet, anchor="w")
@@ -878,7 +927,10 @@ def display_multiple_voting_systems_winner(list_of_checks: list):
     combined_results_popup = tk.Toplevel(root)
     combined_results_popup.title("Mode combiné - résultats")
 
-    if all(element.get() == 0 for element in list_of_checks) or not generate_profils():
+    # The profile is computed once and shared by every selected voting system
+    profils = generate_profils()
+
+    if all(element.get() == 0 for element in list_of_checks) or not profils:
         tk.Label(combined_results_popup, text="Aucun résultat a communiqué").pack()
     else:
         tk.Label(combined_results_popup, text="Mode de vote").grid(row=0, column=0)
@@ -889,7 +941,7 @@ def display_multiple_voting_systems_winner(list_of_checks: list):
             if var_method.get() == 1:
                 match var_method.__str__():
                     case "approbation":
-                        result_approbation = voting_manager.approbation(generate_profils(),
+                        result_approbation = voting_manager.approbation(profils,
                                                                         int(stringvar_approval_radius.get()) if stringvar_approval_radius.get() != "" else default_approval_radius
                                                                         )
                         tk.Label(combined_results_popup, text="Approbation", width=len("Approbation")).grid(
@@ -911,7 +963,7 @@ def display_multiple_voting_systems_winner(list_of_checks: list):
                         row_index += 1
                     case "borda":
                         borda_max = len(data_manager.get_candidates())
-                        result_borda = voting_manager.borda(generate_profils(),
+                        result_borda = voting_manager.borda(profils,
                                                             int(stringvar_borda_max.get()) if stringvar_borda_max.get() != "" else borda_max,
                                                             int(stringvar_borda_step.get()) if stringvar_borda_step.get() != "" else 1
                                                             )
@@ -927,7 +979,7 @@ def display_multiple_voting_systems_winner(list_of_checks: list):
                         row_index += 1
                     case "condorcet":
                         result_condorcet = voting_manager.condorcet(
-                            generate_profils(),
+                            profils,
                             CondorcetMethod(var_condorcet_method.get()),
                             CondorcetTieBreakingRule(var_condorcet_tie_breaking.get())
                         )
@@ -961,8 +1013,7 @@ def display_multiple_voting_systems_winner(list_of_checks: list):
                                          width="20").grid(row=row_index, column=2)
                                 row_index += 1
                     case _:
-                        func = "voting_manager." + var_method.__str__() + "(generate_profils())"
-                        result = eval(func)
+                        result = getattr(voting_manager, var_method.__str__())(profils)
                         mode_text = string.capwords(var_method.__str__().replace('_', ' '))
                         tk.Label(combined_results_popup, text=mode_text,
                                  width=len(mode_text)).grid(row=row_index, column=0)
@@ -980,7 +1031,7 @@ def show_condorcet_popup(profils, is_multiple_method):
     """
     Show a popup asking the user to choose the Condorcet method and tie-breaking rule.
 
-    :param profils: Scores for each voter
+    :param profils: voting profile (None in the "multiple method" version, where it is not used)
     :param is_multiple_method: boolean to check if we need the "multiple method" version or not
     """
     global top_condorcet
@@ -1255,18 +1306,109 @@ def display_condorcet_winner_popup(
 def import_file_callback(frame):
     """
     Function called on press of 'import file' button.
-    Allows user to choose a file and calls import_objects_from_file() function from FileManager.
+    Allows user to choose a file and imports it in the background with import_file_in_background().
 
     :param frame: The popup frame of import file.
     """
     filetypes = (
         ('csv files', '*.csv'),
+        ('compressed csv files', '*.csv.gz'),
+        ('binary files', '*.elec'),
+        ('scenario archives', '*.zip'),
     )
     name = fd.askopenfilename(initialdir='./files/', filetypes=filetypes)
     if name == '':
         return
-    file_manager.import_objects_from_file(name, show_error, on_import_file_success)
     frame.destroy()
+    import_file_in_background(name)
+
+
+top_import_progress = None
+
+
+def import_file_in_background(name: str):
+    """
+    Imports a file in a worker thread, so that the window stays responsive, while showing the progress of the import
+    in a popup which allows to cancel it.
+
+    The worker only parses the file into arrays: its callbacks are passed to the main thread through a queue, polled
+    with root.after() by poll_import_queue(), and the objects are then added in a single batch by
+    on_import_file_success().
+
+    :param name: name of the file to import
+    """
+    global top_import_progress
+    if top_import_progress:
+        top_import_progress.destroy()
+
+    messages = queue.Queue()
+    cancelled = threading.Event()
+
+    top_import_progress = tk.Toplevel(root)
+    top_import_progress.title("Lecture d'un fichier")
+    # Closing the popup, or replacing it by another import, cancels the import
+    top_import_progress.bind("<Destroy>", lambda event: cancelled.set())
+    tk.Label(top_import_progress, text="Lecture du fichier " + name.split("/")[-1] + "...").pack(padx=10, pady=10)
+    progress_bar = ttk.Progressbar(top_import_progress, length=300, maximum=1.0)
+    progress_bar.pack(padx=10)
+    cancel_button = tk.Button(top_import_progress, text="Annuler", command=top_import_progress.destroy)
+    cancel_button.pack(pady=10)
+    keyboard_manager.enter_bind(top_import_progress, cancel_button)
+
+    def run():
+        try:
+            file_manager.import_objects_from_file(
+                name,
+                lambda title, message: messages.put(("error", (title, message))),
+                lambda *objects: messages.put(("success", objects)),
+                on_progress=lambda fraction: messages.put(("progress", fraction)),
+                is_cancelled=cancelled.is_set
+            )
+        except Exception as error:
+            # Any error must reach the popup, which would otherwise wait forever
+            messages.put(("error", ("Erreur de lecture", str(error))))
+        finally:
+            messages.put(("done", None))
+
+    threading.Thread(target=run, daemon=True).start()
+    root.after(50, poll_import_queue, messages, cancelled, top_import_progress, progress_bar)
+
+
+def poll_import_queue(
+        messages: queue.Queue,
+        cancelled: threading.Event,
+        popup: tk.Toplevel,
+        progress_bar: ttk.Progressbar
+):
+    """
+    Handles the messages sent by the worker thread of import_file_in_background(), and polls again until it is done.
+
+    :param messages: the queue of the messages, as tuple(kind, value)
+    :param cancelled: the event set when the import is cancelled
+    :param popup: the popup showing the progress of the import
+    :param progress_bar: the progress bar of the import
+    """
+    while True:
+        try:
+            kind, value = messages.get_nowait()
+        except queue.Empty:
+            root.after(50, poll_import_queue, messages, cancelled, popup, progress_bar)
+            return
+
+        if cancelled.is_set():
+            # Only wait for the worker to stop
+            if kind == "done":
+                return
+        elif kind == "progress":
+            progress_bar["value"] = value
+        elif kind == "error":
+            popup.destroy()
+            show_error(*value)
+        elif kind == "success":
+            on_import_file_success(*value)
+        elif kind == "done":
+            popup.destroy()
+            return
 
 
 top_file = None
@@ -1311,7 +1453,10 @@ def show_import_file_popup():
              0.4391129032258063,-0.5809523809523809 \
              -0.3459677419354841,0.317857142857143 \
              -0.554435483870968,-0.2952380952380951 \
-             0.20846774193548367,-0.15238095238095206",
+             0.20846774193548367,-0.15238095238095206\n\n" +
+             "Les fichiers créés par la sauvegarde commencent par la ligne \"Version 2\", et les lignes des " +
+             "votants y ont le format \"x,y,poids,délégation\" (délégation valant 0 ou 1). Ils peuvent aussi " +
+             "être compressés (.csv.gz), binaires (.elec) ou des archives de scénario (.zip).",
         wraplength=530,
         justify="left"
     ).pack()
@@ -1326,25 +1471,88 @@ def show_import_file_popup():
     keyboard_manager.esc_bind(top_file)
 
 
-def on_import_file_success(file_voters: list[tuple[float, float]], file_candidates: list[tuple[float, float, str, str]]):
+def on_import_file_success(
+        file_voters: np.ndarray,
+        file_delegations: np.ndarray | None,
+        file_weights: np.ndarray | None,
+        file_candidates: np.ndarray,
+        file_labels: list[str | None],
+        file_colors: list[str | None]
+):
     """
-    Function called when file is successfully imported. The list of variables/candidates is added on graph.
+    Function called when file is successfully imported. The voters/candidates are added on graph.
 
-    :param file_voters: list of voters to add on graph
-    :param file_candidates: list of candidates to add on graph
+    :param file_voters: coordinates of the voters to add on graph, as an array of shape (nb_voters, 2)
+    :param file_delegations: whether the voters have delegated their vote or not, False when None
+    :param file_weights: vote weights of the voters, 1 when None
+    :param file_candidates: coordinates of the candidates to add on graph, as an array of shape (nb_candidates, 2)
+    :param file_labels: labels of the candidates, generated when None
+    :param file_colors: colors of the candidates, random when None
     """
-    for x, y, label, color in file_candidates:
-        data_manager.add_candidate((x, y), label=label, color=color)
-    for voter in file_voters:
-        data_manager.add_voter(voter)
+    with data_manager.batch():
+        data_manager.add_candidates(file_candidates, labels=file_labels, colors=file_colors)
+        # The arrays, which may be memory-mapped, are kept as the voters' data instead of being copied
+        data_manager.add_voters(file_voters, has_delegated_votes=file_delegations, weights=file_weights, copy=False)
     graph_manager.build()
 
 
-def call_export_file():
+top_export_file = None
+
+
+def show_export_file_popup():
+    """
+    Shows popup to choose the format of the file to export to.
+    """
+    global top_export_file
+    if top_export_file:
+        top_export_file.destroy()
+
+    top_export_file = tk.Toplevel(root)
+    top_export_file.title("Sauvegarde des données")
+
+    tk.Label(
+        top_export_file,
+        text="Le format texte (.csv) peut être lu et modifié à la main.\n" +
+             "Le format binaire (.elec) est plus compact et plus rapide à lire pour un grand nombre de votants.\n" +
+             "L'archive (.zip) est compressée, et ses candidats peuvent être lus sans lire les votants.",
+        justify="left"
+    ).pack(padx=10, pady=10)
+
+    compress = tk.BooleanVar(top_export_file, value=False)
+    tk.Checkbutton(top_export_file, text="Compresser le fichier texte (.csv.gz)", variable=compress).pack()
+
+    csv_button = tk.Button(
+        top_export_file,
+        text="Texte (.csv)",
+        command=lambda: [call_export_file(compress=compress.get()), top_export_file.destroy()]
+    )
+    csv_button.pack(side=tk.LEFT, expand=True, pady=10)
+    tk.Button(
+        top_export_file,
+        text="Binaire (.elec)",
+        command=lambda: [call_export_file(binary=True), top_export_file.destroy()]
+    ).pack(side=tk.LEFT, expand=True, pady=10)
+    tk.Button(
+        top_export_file,
+        text="Archive (.zip)",
+        command=lambda: [call_export_file(archive=True), top_export_file.destroy()]
+    ).pack(side=tk.LEFT, expand=True, pady=10)
+    keyboard_manager.enter_bind(top_export_file, csv_button)
+    keyboard_manager.esc_bind(top_export_file)
+
+
+def call_export_file(binary: bool = False, compress: bool = False, archive: bool = False):
     """
     Function that calls export_objects_to_file function in file_manager
+
+    :param binary: whether to export to a binary file or to a text file
+    :param compress: whether to compress the text file or not
+    :param archive: whether to export to a scenario archive
     """
-    file_manager.export_objects_to_file(data_manager.get_candidates(), data_manager.get_voters(), show_error, show_success)
+    file_manager.export_objects_to_file(
+        data_manager.get_candidates(), data_manager.get_voters(), show_error, show_success,
+        binary=binary, compress=compress, archive=archive
+    )
 
 
 def show_error(title: str, message: str):
@@ -1573,49 +1781,50 @@ def show_democratie_liquide_popup():
 
 def democratie_liquide(distance: int, proba: float, nb_tours: int):
     log_string = ""
-    for i in range(nb_tours):
-        # Create a list of voters who should delegate their vote
-        all_voters = data_manager.get_voters()
-        delegating_voters = []
-        non_delegating_voters = []
-        for voter_index, voter in enumerate(all_voters):
-            # If the voter has already delegated their vote, then skip
-            if voter.has_delegated_vote():
-                continue
-
-            # Check if the voter should delegate their vote
-            should_delegate = True
-            for candidate in data_manager.get_candidates():
-                maximum = graph_manager.get_diagonal()
-                voter_candidate_dist = 100 - (maximum - math.dist(voter.coordinates(), candidate.coordinates())) / maximum * 100
-
-                if voter_candidate_dist < distance:
-                    should_delegate = False
-                    break
-
-            # Add the voter to the delegating voters list, if needed
-            if should_delegate:
-                delegating_voters.append((voter_index, voter))
-            else:
-                non_delegating_voters.append((voter_index, voter))
-
-        if len(delegating_voters) == 0:
-            break
-
-        delegating_coords = np.array([voter[1].coordinates() for voter in delegating_voters])
-        non_delegating_coords = np.array([voter[1].coordinates() for voter in non_delegating_voters])
-        distances = cdist(delegating_coords, non_delegating_coords)
-        closest_indices = np.argmin(distances, axis=1)
-        closest_points = [non_delegating_voters[i] for i in closest_indices]
-        for ind, (voter_index, voter) in enumerate(delegating_voters):
-            if random.random() < proba:
-                closest_voter_index = closest_points[ind][0]
-                all_voters[closest_voter_index].set_weight(all_voters[closest_voter_index].get_weight() + voter.get_weight())
-                data_manager.edit_voter_at(voter_index, voter.get_label(), True, 0)
-                data_manager.edit_voter_at(closest_voter_index, all_voters[closest_voter_index].get_label(), all_voters[closest_voter_index].has_delegated_vote(), all_voters[closest_voter_index].get_weight())
-                log_string += "votant " + voter.get_label() + " délègue au votant " + all_voters[closest_voter_index].get_label()  + " (poids : " + str(all_voters[closest_voter_index].get_weight()) + ")\n"
-
-    # graph_manager.add_voter_closeness_circles(distance)
+    with data_manager.batch():
+        for i in range(nb_tours):
+            # Create a list of voters who should delegate their vote
+            all_voters = data_manager.get_voters()
+            delegating_voters = []
+            non_delegating_voters = []
+            for voter_index, voter in enumerate(all_voters):
+                # If the voter has already delegated their vote, then skip
+                if voter.has_delegated_vote():
+                    continue
+
+                # Check if the voter should delegate their vote
+                should_delegate = True
+                for candidate in data_manager.get_candidates():
+                    maximum = graph_manager.get_diagonal()
+                    voter_candidate_dist = 100 - (maximum - math.dist(voter.coordinates(), candidate.coordinates())) / maximum * 100
+
+                    if voter_candidate_dist < distance:
+                        should_delegate = False
+                        break
+
+                # Add the voter to the delegating voters list, if needed
+                if should_delegate:
+                    delegating_voters.append((voter_index, voter))
+                else:
+                    non_delegating_voters.append((voter_index, voter))
+
+            if len(delegating_voters) == 0:
+                break
+
+            delegating_coords = np.array([voter[1].coordinates() for voter in delegating_voters])
+            non_delegating_coords = np.array([voter[1].coordinates() for voter in non_delegating_voters])
+            distances = cdist(delegating_coords, non_delegating_coords)
+            closest_indices = np.argmin(distances, axis=1)
+            closest_points = [non_delegating_voters[i] for i in closest_indices]
+            for ind, (voter_index, voter) in enumerate(delegating_voters):
+                if random.random() < proba:
+                    closest_voter_index = closest_points[ind][0]
+                    all_voters[closest_voter_index].set_weight(all_voters[closest_voter_index].get_weight() + voter.get_weight())
+                    data_manager.edit_voter_at(voter_index, voter.get_label(), True, 0)
+                    data_manager.edit_voter_at(closest_voter_index, all_voters[closest_voter_index].get_label(), all_voters[closest_voter_index].has_delegated_vote(), all_voters[closest_voter_index].get_weight())
+                    log_string += "votant " + voter.get_label() + " délègue au votant " + all_voters[closest_voter_index].get_label()  + " (poids : " + str(all_voters[closest_voter_index].get_weight()) + ")\n"
+
+    graph_manager.add_voter_closeness_circles(distance)
     graph_manager.build()
 
     show_democratie_liquide_log(log_string)
@@ -1627,9 +1836,10 @@ def show_democratie_liquide_log(log_string: string):
         log_dialog.destroy()
 
     log_dialog = tk.Toplevel(root)
-    log_dialog.protocol('WM_DELETE_WINDOW',
-                        lambda: [graph_manager.clear_voter_closeness_circles(), graph_manager.build(),
-                                 log_dialog.destroy()])
+    # The closeness circles are only shown with the log
+    on_log_closed = lambda e=None: [graph_manager.clear_voter_closeness_circles(), graph_manager.build(),
+                                   log_dialog.destroy()]
+    log_dialog.protocol('WM_DELETE_WINDOW', on_log_closed)
     log_dialog.title("Log de ce qui s'est passé")
 
     if log_string == "":
@@ -1637,12 +1847,15 @@ def show_democratie_liquide_log(log_string: string):
 
     tk.Label(log_dialog, text=log_string).pack()
 
-    keyboard_manager.esc_bind(log_dialog)
+    keyboard_manager.esc_bind(log_dialog, on_log_closed)
 
 
 def reset_voters_delegations(event):
-    for index, voter in enumerate(data_manager.get_voters()):
-        data_manager.edit_voter_at(index, voter.get_label(), False, 1)
+    with data_manager.batch():
+        for index, voter in enumerate(data_manager.get_voters()):
+            data_manager.edit_voter_at(index, voter.get_label(), False, 1)
+    # The closeness circles show the delegations which have just been reset
+    graph_manager.clear_voter_closeness_circles()
     graph_manager.build()
 
 
@@ -1657,7 +1870,7 @@ import_file.place(relx=0, rely=0, relwidth=button_width, relheight=button_height
 
 # Export file on button click
 export_file = tk.Button(main_panel, text="Sauvegarder les données", takefocus=0, highlightbackground="white", borderwidth=1,
-                        command=lambda: call_export_file())
+                        command=lambda: show_export_file_popup())
 export_file.place(relx=0.25, rely=0, relwidth=button_width, relheight=button_height)
 
 # Reset the voters on button click
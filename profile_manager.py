@@ -0,0 +1,570 @@
+import math
+from collections import OrderedDict
+
+import numpy as np
+from scipy.spatial.distance import cdist
+
+from array_store import ArrayStore
+from candidate import Candidate
+from change_set import ChangeSet
+from data_manager import DataManager
+from voter import Voter
+from voting_profile import VotingProfile
+
+
+class ProfileManager:
+    """
+    Class to manage the voting profiles.
+
+    A profile gives, for every voter, the candidates ranked from the closest
+    to the farthest, along with an approval ratio for each of them. Instead of
+    computing one distance at a time, the profiles are computed from arrays of
+    coordinates: the whole voter/candidate distance matrix is obtained in one
+    call, and the rankings are obtained by sorting each row of that matrix.
+
+    The profiles of the data are cached by data version: as long as nothing
+    changes in the data, the same profile is returned without any computation.
+    Only the profiles of the last few versions are kept.
+
+    The approval ratios and rankings of all voters are also kept up to date
+    with the data through the data manager callbacks: adding a candidate only
+    computes one new column and inserts the candidate into each ranking, and
+    adding or editing a voter only computes that voter's row. A new profile can
+    then be obtained without computing the whole distance matrix again.
+    """
+
+    # Number of profiles kept in the cache
+    __cache_size = 3
+
+    # Number of voters whose ranking is updated at once when a candidate is added
+    __chunk_size = 65536
+
+    # Limits of both axes of the graph (see GraphManager), whose diagonal is the max distance of the approval ratios
+    GRAPH_LIMITS = (-1.1, 1.1)
+
+    def __init__(self, cache_size: int = __cache_size):
+        self.__cache_size = cache_size
+        # Cached profiles: OrderedDict({..., (<data manager>, <data version>, <maximum>): <profile>, ...}),
+        # least recently used first
+        self.__cache = OrderedDict()
+        self.__cache_hits = 0
+        self.__cache_misses = 0
+
+        # Data manager the state below was computed from
+        self.__data_manager = None
+        # Data version the state below corresponds to, None if there is no state
+        self.__state_version = None
+        # Max distance (diagonal) the approval ratios were computed with
+        self.__state_maximum = None
+        # Number of voters in the state, the arrays below have room for more
+        self.__nb_voters = 0
+        # Coordinates of all voters, of shape (capacity, 2)
+        self.__voter_coordinates = np.empty((0, 2))
+        # Coordinates of all candidates, of shape (nb_candidates, 2)
+        self.__candidate_coordinates = np.empty((0, 2))
+        # Approval ratios of all voters, of shape (capacity, candidate capacity): like the rows,
+        # the arrays below have room for more candidates
+        self.__approvals = np.empty((0, 0))
+        # Rankings of all voters, of shape (capacity, candidate capacity)
+        self.__rankings = np.empty((0, 0), dtype=np.int32)
+
+    @staticmethod
+    def compute_diagonal(xlim: tuple[float, float], ylim: tuple[float, float]) -> float:
+        """
+        Computes the max distance (diagonal) of a plot from the limits of its axes, which are truncated to integers.
+
+        :param xlim: the limits of the x-axis
+        :param ylim: the limits of the y-axis
+        :return: the diagonal size of the plot
+        """
+        return math.sqrt((int(xlim[1]) - int(xlim[0])) ** 2 + (int(ylim[1]) - int(ylim[0])) ** 2)
+
+    def compute_distances(self, voter_coordinates: np.ndarray, candidate_coordinates: np.ndarray) -> np.ndarray:
+        """
+        Computes the distance between every voter and every candidate.
+
+        :param voter_coordinates: array of shape (nb_voters, 2)
+        :param candidate_coordinates: array of shape (nb_candidates, 2)
+        :return: array of shape (nb_voters, nb_candidates) of euclidean distances
+        """
+        voter_coordinates = np.asarray(voter_coordinates, dtype=np.float64).reshape(-1, 2)
+        candidate_coordinates = np.asarray(candidate_coordinates, dtype=np.float64).reshape(-1, 2)
+        return cdist(voter_coordinates, candidate_coordinates)
+
+    def compute_approvals(self, distances: np.ndarray, maximum: float) -> np.ndarray:
+        """
+        Converts distances into approval ratios: 1 for a candidate on the voter,
+        0 for a candidate at the maximum distance.
+
+        :param distances: array of shape (nb_voters, nb_candidates)
+        :param maximum: the max distance (diagonal) of the plot
+        :return: array of shape (nb_voters, nb_candidates) of approval ratios
+        """
+        approvals = maximum - distances
+        approvals /= maximum
+        return approvals
+
+    def compute_rankings(self, approvals: np.ndarray) -> np.ndarray:
+        """
+        Ranks the candidates of every voter from the most to the least approved.
+        The sort is stable: candidates with the same approval keep their order.
+
+        :param approvals: array of shape (nb_voters, nb_candidates)
+        :return: array of shape (nb_voters, nb_candidates) of candidate indexes
+        """
+        return np.argsort(-approvals, axis=1, kind="stable")
+
+    def generate(
+            self,
+            voter_coordinates: np.ndarray,
+            candidate_coordinates: np.ndarray,
+            maximum: float
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Generates the rankings and the approval ratios of all voters.
+
+        :param voter_coordinates: array of shape (nb_voters, 2)
+        :param candidate_coordinates: array of shape (nb_candidates, 2)
+        :param maximum: the max distance (diagonal) of the plot
+        :return: tuple(rankings matrix, approval ratios matrix), where rankings[v, r] is the index
+                 of the candidate ranked r-th by voter v, and approvals[v, c] is the approval ratio
+                 of voter v for candidate c
+        """
+        distances = self.compute_distances(voter_coordinates, candidate_coordinates)
+        approvals = self.compute_approvals(distances, maximum)
+        return self.compute_rankings(approvals), approvals
+
+    def generate_profile(
+            self,
+            voter_coordinates: np.ndarray,
+            candidate_coordinates: np.ndarray,
+            maximum: float,
+            weights: np.ndarray,
+            candidate_labels: list[str],
+            voter_labels: list[str] | None = None
+    ) -> VotingProfile:
+        """
+        Generates the compact voting profile of all voters.
+
+        :param voter_coordinates: array of shape (nb_voters, 2)
+        :param candidate_coordinates: array of shape (nb_candidates, 2)
+        :param maximum: the max distance (diagonal) of the plot
+        :param weights: the voters' vote weights, of shape (nb_voters,)
+        :param candidate_labels: the candidates' labels
+        :param voter_labels: the voters' labels
+        :return: the voting profile, with float32 approval ratios
+        """
+        rankings, approvals = self.generate(voter_coordinates, candidate_coordinates, maximum)
+        return VotingProfile(rankings, approvals.astype(np.float32), weights, candidate_labels, voter_labels)
+
+    def get_profile(self, data_manager: DataManager, maximum: float) -> VotingProfile | None:
+        """
+        Returns the voting profile of the voters who haven't delegated their vote,
+        computing it only if the data changed since it was last computed.
+
+        :param data_manager: the data to compute the profile of
+        :param maximum: the max distance (diagonal) of the plot
+        :return: the voting profile, None if there are no such voters or no candidates
+        """
+        key = (data_manager, data_manager.get_version(), maximum)
+        if key in self.__cache:
+            self.__cache_hits += 1
+            self.__cache.move_to_end(key)
+            return self.__cache[key]
+
+        self.__cache_misses += 1
+        profile = self.__compute_profile(data_manager, maximum)
+        self.__cache[key] = profile
+        if len(self.__cache) > self.__cache_size:
+            self.__cache.popitem(last=False)
+        return profile
+
+    def __compute_profile(self, data_manager: DataManager, maximum: float) -> VotingProfile | None:
+        """
+        Computes the voting profile of the voters who haven't delegated their vote.
+        The approval ratios and rankings are only computed from scratch if they
+        haven't been kept up to date with the data.
+
+        :param data_manager: the data to compute the profile of
+        :param maximum: the max distance (diagonal) of the plot
+        :return: the voting profile, None if there are no such voters or no candidates
+        """
+        if (
+                self.__data_manager is not data_manager
+                or self.__state_version != data_manager.get_version()
+                or self.__state_maximum != maximum
+        ):
+            self.__build_state(data_manager, maximum)
+
+        voters = data_manager.get_voters()
+        candidates = data_manager.get_candidates()
+
+        # Mask of the voters who haven't delegated their vote
+        no_delegation = ~voters.get_column("has_delegated_vote")
+
+        if not no_delegation.any() or not candidates:
+            return None
+
+        nb_candidates = len(self.__candidate_coordinates)
+        return VotingProfile(
+            self.__rankings[:self.__nb_voters, :nb_candidates][no_delegation],
+            self.__approvals[:self.__nb_voters, :nb_candidates][no_delegation].astype(np.float32),
+            voters.get_column("weight")[no_delegation],
+            candidates.get_column("label"),
+            voters.get_column("label")[no_delegation]
+        )
+
+    def __build_state(self, data_manager: DataManager, maximum: float):
+        """
+        Computes the approval ratios and rankings of all voters from scratch.
+
+        :param data_manager: the data to compute the state of
+        :param maximum: the max distance (diagonal) of the plot
+        """
+        voters = data_manager.get_voters()
+        candidates = data_manager.get_candidates()
+
+        self.__data_manager = data_manager
+        self.__state_version = data_manager.get_version()
+        self.__state_maximum = maximum
+        self.__nb_voters = len(voters)
+        self.__voter_coordinates = np.column_stack((voters.get_column("x"), voters.get_column("y")))
+        self.__candidate_coordinates = np.column_stack((candidates.get_column("x"), candidates.get_column("y")))
+        rankings, self.__approvals = self.generate(self.__voter_coordinates, self.__candidate_coordinates, maximum)
+        self.__rankings = rankings.astype(np.int32)
+
+    def __is_next_version(self) -> bool:
+        """
+        Checks that the data changed exactly once since the state was last updated,
+        so that the change can be applied to the state. Otherwise, the state is
+        dropped and will be computed from scratch when it is needed.
+
+        :return: whether the change can be applied to the state or not
+        """
+        if self.__state_version is None:
+            return False
+        if self.__data_manager.get_version() != self.__state_version + 1:
+            self.__state_version = None
+            return False
+        return True
+
+    def __reserve(self, nb_voters: int):
+        """
+        Makes room in the state for the given number of voters,
+        doubling the capacity of the arrays when they are full.
+
+        :param nb_voters: the number of voters the state must be able to hold
+        """
+        capacity = len(self.__voter_coordinates)
+        if nb_voters <= capacity:
+            return
+
+        capacity = max(nb_voters, 2 * capacity)
+        self.__voter_coordinates = self.__resized(self.__voter_coordinates, capacity, self.__nb_voters)
+        self.__approvals = self.__resized(self.__approvals, capacity, self.__nb_voters)
+        self.__rankings = self.__resized(self.__rankings, capacity, self.__nb_voters)
+
+    def __reserve_candidates(self, nb_candidates: int):
+        """
+        Makes room in the state for the given number of candidates,
+        doubling the number of columns of the arrays when they are full.
+
+        :param nb_candidates: the number of candidates the state must be able to hold
+        """
+        capacity = self.__approvals.shape[1]
+        if nb_candidates <= capacity:
+            return
+
+        capacity = max(nb_candidates, 2 * capacity)
+        nb_voters = self.__nb_voters
+        kept_candidates = len(self.__candidate_coordinates)
+        approvals = np.empty((len(self.__approvals), capacity))
+        approvals[:nb_voters, :kept_candidates] = self.__approvals[:nb_voters, :kept_candidates]
+        rankings = np.empty((len(self.__rankings), capacity), dtype=np.int32)
+        rankings[:nb_voters, :kept_candidates] = self.__rankings[:nb_voters, :kept_candidates]
+        self.__approvals = approvals
+        self.__rankings = rankings
+
+    @staticmethod
+    def __resized(array: np.ndarray, capacity: int, nb_rows: int) -> np.ndarray:
+        """
+        Returns a copy of the first rows of an array, with room for more rows.
+
+        :param array: the array to copy
+        :param capacity: the number of rows of the new array
+        :param nb_rows: the number of rows to copy
+        :return: the new array
+        """
+        resized = np.empty((capacity,) + array.shape[1:], dtype=array.dtype)
+        resized[:nb_rows] = array[:nb_rows]
+        return resized
+
+    def __update_voter_at(self, index: int, coordinates: tuple[float, float]):
+        """
+        Computes the approval ratios and the ranking of a single voter.
+
+        :param index: index of the voter in the state
+        :param coordinates: voter's coordinates
+        """
+        nb_candidates = len(self.__candidate_coordinates)
+        self.__voter_coordinates[index] = coordinates
+        rankings, approvals = self.generate(
+            self.__voter_coordinates[index], self.__candidate_coordinates, self.__state_maximum
+        )
+        self.__approvals[index, :nb_candidates] = approvals[0]
+        self.__rankings[index, :nb_candidates] = rankings[0]
+
+    def on_voter_added(self, voter: Voter, index: int):
+        """
+        Updates the state when a voter is added to the data: only the new voter's row is computed.
+
+        :param voter: newly added voter
+        :param index: index of the new voter
+        """
+        if not self.__is_next_version():
+            return
+        if index != self.__nb_voters:
+            self.__state_version = None
+            return
+
+        self.__reserve(index + 1)
+        self.__update_voter_at(index, voter.coordinates())
+        self.__nb_voters += 1
+        self.__state_version += 1
+
+    def on_voters_added(self, voters: ArrayStore, index: int):
+        """
+        Updates the state when several voters are added to the data at once:
+        only the new voters' rows are computed, from the voters' columns.
+
+        :param voters: the voters in the data, the new ones starting at index
+        :param index: index of the first new voter
+        """
+        if not self.__is_next_version():
+            return
+        if index != self.__nb_voters:
+            self.__state_version = None
+            return
+
+        self.__add_voter_rows(index, len(voters))
+        self.__state_version += 1
+
+    def __add_voter_rows(self, index: int, nb_voters: int):
+        """
+        Computes the rows of the voters added to the data from the given index.
+
+        :param index: index of the first new voter
+        :param nb_voters: the number of voters in the data
+        """
+        self.__reserve(nb_voters)
+        all_voters = self.__data_manager.get_voters()
+        self.__voter_coordinates[index:nb_voters, 0] = all_voters.get_column("x")[index:nb_voters]
+        self.__voter_coordinates[index:nb_voters, 1] = all_voters.get_column("y")[index:nb_voters]
+        nb_candidates = len(self.__candidate_coordinates)
+        rankings, self.__approvals[index:nb_voters, :nb_candidates] = self.generate(
+            self.__voter_coordinates[index:nb_voters], self.__candidate_coordinates, self.__state_maximum
+        )
+        self.__rankings[index:nb_voters, :nb_candidates] = rankings
+        self.__nb_voters = nb_voters
+
+    def on_voter_edited(self, voter: Voter, index: int):
+        """
+        Updates the state when a voter is edited in the data: only the voter's row is computed again.
+
+        :param voter: updated voter
+        :param index: index of the edited voter
+        """
+        if not self.__is_next_version():
+            return
+
+        self.__update_voter_at(index, voter.coordinates())
+        self.__state_version += 1
+
+    def on_voters_cleared(self):
+        """
+        Updates the state when all voters are cleared from the data.
+        """
+        if not self.__is_next_version():
+            return
+
+        self.__nb_voters = 0
+        self.__state_version += 1
+
+    def on_data_changed(self, changes: ChangeSet):
+        """
+        Updates the state at the end of a batch of changes (see DataManager.batch()).
+        The clears are applied first, then the candidates added during the batch are
+        added to the rankings of the remaining voters, and finally the rows of the
+        added and edited voters are computed.
+
+        :param changes: the changes made to the data during the batch
+        """
+        if self.__state_version is None:
+            return
+        if self.__state_version != changes.get_start_version():
+            self.__state_version = None
+            return
+
+        if changes.has_cleared_voters():
+            self.__nb_voters = 0
+        if changes.has_cleared_candidates():
+            self.__clear_candidate_columns()
+
+        nb_candidates = len(self.__data_manager.get_candidates())
+        first_added_candidate = changes.get_first_added_candidate()
+        if first_added_candidate is not None:
+            if first_added_candidate != len(self.__candidate_coordinates):
+                self.__state_version = None
+                return
+            self.__add_candidate_columns(first_added_candidate, nb_candidates)
+
+        nb_voters = len(self.__data_manager.get_voters())
+        first_added_voter = changes.get_first_added_voter()
+        if first_added_voter is not None:
+            if first_added_voter != self.__nb_voters:
+                self.__state_version = None
+                return
+            self.__add_voter_rows(first_added_voter, nb_voters)
+
+        edited_voters = changes.get_edited_voters()
+        if edited_voters:
+            all_voters = self.__data_manager.get_voters()
+            self.__voter_coordinates[edited_voters, 0] = all_voters.get_column("x")[edited_voters]
+            self.__voter_coordinates[edited_voters, 1] = all_voters.get_column("y")[edited_voters]
+            rankings, self.__approvals[edited_voters, :nb_candidates] = self.generate(
+                self.__voter_coordinates[edited_voters], self.__candidate_coordinates, self.__state_maximum
+            )
+            self.__rankings[edited_voters, :nb_candidates] = rankings
+
+        self.__state_version = self.__data_manager.get_version()
+
+    def on_candidate_added(self, candidate: Candidate, index: int):
+        """
+        Updates the state when a candidate is added to the data: the approval ratios
+        for the new candidate are computed, and the candidate is inserted into each
+        ranking after all the candidates that are at least as approved.
+
+        :param candidate: newly added candidate
+        :param index: index of the new candidate
+        """
+        if not self.__is_next_version():
+            return
+        nb_candidates = len(self.__candidate_coordinates)
+        if index != nb_candidates:
+            self.__state_version = None
+            return
+
+        nb_voters = self.__nb_voters
+        self.__reserve_candidates(nb_candidates + 1)
+        self.__candidate_coordinates = np.vstack((self.__candidate_coordinates, candidate.coordinates()))
+
+        # New column of approval ratios
+        new_approvals = self.compute_approvals(
+            self.compute_distances(self.__voter_coordinates[:nb_voters], self.__candidate_coordinates[index]),
+            self.__state_maximum
+        )[:, 0]
+
+        # Rank of the new candidate for every voter: the sort being stable,
+        # it comes after the candidates with the same approval ratio
+        positions = (self.__approvals[:nb_voters, :nb_candidates] >= new_approvals[:, np.newaxis]).sum(axis=1)
+        self.__approvals[:nb_voters, index] = new_approvals
+
+        # Candidates ranked after the new one move one rank down, in place, by chunks of voters
+        ranks = np.arange(1, nb_candidates + 1)
+        for start in range(0, nb_voters, self.__chunk_size):
+            stop = min(start + self.__chunk_size, nb_voters)
+            rankings = self.__rankings[start:stop]
+            moved = ranks > positions[start:stop, np.newaxis]
+            np.copyto(rankings[:, 1:nb_candidates + 1], rankings[:, :nb_candidates], where=moved)
+        self.__rankings[np.arange(nb_voters), positions] = index
+
+        self.__state_version += 1
+
+    def on_candidates_added(self, candidates: list[Candidate], index: int):
+        """
+        Updates the state when several candidates are added to the data at once:
+        the approval ratios for the new candidates are computed, and the rankings
+        are sorted again.
+
+        :param candidates: newly added candidates
+        :param index: index of the first new candidate
+        """
+        if not self.__is_next_version():
+            return
+        if index != len(self.__candidate_coordinates):
+            self.__state_version = None
+            return
+
+        self.__add_candidate_columns(index, index + len(candidates))
+        self.__state_version += 1
+
+    def __add_candidate_columns(self, index: int, nb_candidates: int):
+        """
+        Computes the approval ratios for the candidates added to the data from the given index,
+        and sorts the rankings again.
+
+        :param index: index of the first new candidate
+        :param nb_candidates: the number of candidates in the data
+        """
+        nb_voters = self.__nb_voters
+        all_candidates = self.__data_manager.get_candidates()
+        new_coordinates = np.column_stack((
+            all_candidates.get_column("x")[index:nb_candidates],
+            all_candidates.get_column("y")[index:nb_candidates]
+        ))
+        self.__reserve_candidates(nb_candidates)
+        self.__candidate_coordinates = np.vstack((self.__candidate_coordinates, new_coordinates))
+
+        self.__approvals[:nb_voters, index:nb_candidates] = self.compute_approvals(
+            self.compute_distances(self.__voter_coordinates[:nb_voters], new_coordinates), self.__state_maximum
+        )
+        self.__rankings[:nb_voters, :nb_candidates] = self.compute_rankings(
+            self.__approvals[:nb_voters, :nb_candidates]
+        )
+
+    def on_candidate_edited(self, candidate: Candidate, index: int):
+        """
+        Updates the state when a candidate is edited in the data.
+        Only the label and the color can be edited, so nothing has to be computed.
+
+        :param candidate: updated candidate
+        :param index: index of the edited candidate
+        """
+        if not self.__is_next_version():
+            return
+
+        self.__state_version += 1
+
+    def on_candidates_cleared(self):
+        """
+        Updates the state when all candidates are cleared from the data.
+        """
+        if not self.__is_next_version():
+            return
+
+        self.__clear_candidate_columns()
+        self.__state_version += 1
+
+    def __clear_candidate_columns(self):
+        """
+        Removes all candidates from the state, keeping the room of the arrays for the next ones.
+        """
+        self.__candidate_coordinates = np.empty((0, 2))
+
+    def clear_cache(self):
+        """
+        Clears the cached profiles.
+        """
+        self.__cache.clear()
+
+    def get_cache_hits(self) -> int:
+        """
+        :return: the number of profiles returned from the cache
+        """
+        return self.__cache_hits
+
+    def get_cache_misses(self) -> int:
+        """
+        :return: the number of profiles that had to be computed
+        """
+        return self.__cache_misses
@@ -0,0 +1,59 @@
+import unittest
+
+import numpy as np
+
+from voter import Voter
+
+
+class TestArrayStore(unittest.TestCase):
+    def setUp(self) -> None:
+        self.store = Voter.new_store()
+        self.store.append(label="1", x=0.2, y=0.2, has_delegated_vote=False, weight=1)
+        self.store.extend(label=["2", "3"], x=[0.4, 0.6], y=[-0.4, -0.6], has_delegated_vote=False, weight=[2, 3])
+
+    def test_views(self):
+        self.assertEqual(len(self.store), 3)
+        self.assertEqual([voter.get_label() for voter in self.store], ["1", "2", "3"])
+        self.assertEqual(self.store[-1].coordinates(), (0.6, -0.6))
+        self.assertEqual([voter.get_weight() for voter in self.store[1:]], [2, 3])
+        with self.assertRaises(IndexError):
+            self.store[3]
+
+        # Views read and write the arrays
+        self.store[0].set_delegated_vote(True)
+        self.assertEqual(self.store.get_column("has_delegated_vote").tolist(), [True, False, False])
+        self.assertEqual(self.store[0], self.store[0])
+        self.assertNotEqual(self.store[0], self.store[1])
+
+    def test_growth(self):
+        self.store.extend(
+            label=[str(index) for index in range(4, 1004)],
+            x=np.zeros(1000),
+            y=np.ones(1000),
+            has_delegated_vote=False,
+            weight=1
+        )
+        self.assertEqual(len(self.store.get_column("x")), 1003)
+        self.assertEqual(self.store[1002].get_label(), "1003")
+        self.assertEqual(self.store[2].coordinates(), (0.6, -0.6))
+        with self.assertRaises(ValueError):
+            self.store.get_column("x")[0] = 1
+
+        self.store.clear()
+        self.assertEqual(len(self.store), 0)
+        self.assertEqual(list(self.store), [])
+
+    def test_extend_without_copy(self):
+        self.store.clear()
+        x = np.linspace(-1, 1, 5)
+        self.store.extend(copy=False, label=list("abcde"), x=x, y=np.zeros(5), has_delegated_vote=False, weight=1)
+        self.assertTrue(np.shares_memory(self.store.get_column("x"), x))
+        self.assertEqual(self.store[4].coordinates(), (1.0, 0.0))
+
+        # The arrays are only adopted by an empty store
+        self.store.extend(copy=False, label=["f"], x=[0.5], y=[0.5], has_delegated_vote=False, weight=1)
+        self.assertEqual(len(self.store), 6)
+        self.assertEqual(x.tolist(), np.linspace(-1, 1, 5).tolist())
+
+    def tearDown(self):
+        return
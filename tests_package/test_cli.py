@@ -0,0 +1,89 @@
+import json
+import math
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+
+import numpy as np
+
+import cli
+from data_manager import DataManager
+from profile_manager import ProfileManager
+
+
+class TestCli(unittest.TestCase):
+    def setUp(self) -> None:
+        self.directory = tempfile.TemporaryDirectory()
+        self.filename = os.path.join(self.directory.name, "scenario.csv")
+        with open(self.filename, "w") as f:
+            f.write(
+                "Version 2\nCandidats\n0.1,0.2,B\n-0.3,0.4\n0.5,-0.6,A,#ffa62b\n"
+                "Votants\n0.7,0.8,1,0\n-0.1,0.3,2,0\n0.4,-0.5,0,1\n0.2,0.2,1,0\n-0.9,-0.9,1,0\n"
+            )
+        self.data_manager = DataManager()
+        self.data_manager.clear_voters()
+        self.data_manager.clear_candidates()
+
+    def test_diagonal(self):
+        self.assertEqual(
+            ProfileManager.compute_diagonal(ProfileManager.GRAPH_LIMITS, ProfileManager.GRAPH_LIMITS), math.sqrt(8)
+        )
+
+    def test_same_profile_as_graph(self):
+        voters, delegations, weights, candidates, candidate_labels = cli.load_scenario(self.filename)
+        profile = cli.compute_profile(voters, delegations, weights, candidates, candidate_labels)
+
+        # Same data added on the graph
+        with self.data_manager.batch():
+            self.data_manager.add_candidates(candidates, labels=["B", None, "A"])
+            self.data_manager.add_voters(voters, has_delegated_votes=delegations, weights=weights)
+        expected = ProfileManager().get_profile(self.data_manager, math.sqrt(8))
+
+        self.assertEqual(profile.get_candidate_labels(), expected.get_candidate_labels())
+        self.assertEqual(profile.get_voter_labels(), expected.get_voter_labels())
+        np.testing.assert_array_equal(profile.get_rankings(), expected.get_rankings())
+        np.testing.assert_array_equal(profile.get_scores(), expected.get_scores())
+        np.testing.assert_array_equal(profile.get_weights(), expected.get_weights())
+
+    def test_main(self):
+        output = os.path.join(self.directory.name, "results.json")
+        self.assertEqual(
+            cli.main([self.filename, "--rules", "pluralite_simple", "condorcet", "--output", output]), 0
+        )
+        with open(output) as f:
+            results = json.load(f)
+        self.assertEqual(list(results), ["pluralite_simple", "condorcet"])
+        self.assertEqual(results["pluralite_simple"]["winner"], "B")
+        self.assertEqual(sum(results["pluralite_simple"]["scores"].values()), 5)
+
+        self.assertEqual(cli.main([os.path.join(self.directory.name, "missing.csv")]), 1)
+
+    def test_single_candidate(self):
+        filename = os.path.join(self.directory.name, "single.csv")
+        output = os.path.join(self.directory.name, "results.json")
+        with open(filename, "w") as f:
+            f.write("Candidats\n0.1,0.2,A\nVotants\n0.7,0.8\n-0.1,0.3\n")
+        self.assertEqual(cli.main([filename, "--rules", "borda", "veto", "--output", output]), 0)
+        with open(output) as f:
+            results = json.load(f)
+        self.assertEqual(results["borda"]["scores"], {"A": 2})
+        self.assertEqual(results["veto"], {"winner": "A", "multiple_winners": False, "winners": [], "scores": {"A": 0}})
+
+    def test_no_tkinter_nor_matplotlib(self):
+        modules = subprocess.run(
+            [sys.executable, "-c", "import sys, cli; print(' '.join(sys.modules))"],
+            cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+            capture_output=True,
+            text=True,
+            check=True
+        ).stdout.split()
+        self.assertNotIn("tkinter", modules)
+        self.assertNotIn("matplotlib", modules)
+
+    def tearDown(self):
+        self.data_manager.clear_voters()
+        self.data_manager.clear_candidates()
+        self.directory.cleanup()
+        return
@@ -0,0 +1,132 @@
+import time
+import unittest
+
+import numpy as np
+
+from data_manager import DataManager
+
+
+class TestDataManager(unittest.TestCase):
+    def setUp(self) -> None:
+        self.data_manager = DataManager()
+        self.data_manager.clear_voters()
+        self.data_manager.clear_candidates()
+        self.added = []
+        self.data_manager.set_voters_added_callback(
+            lambda voters, index: self.added.append((len(voters) - index, index))
+        )
+        self.data_manager.set_candidates_added_callback(
+            lambda candidates, index: self.added.append((len(candidates), index))
+        )
+
+    def test_add_voters(self):
+        self.data_manager.add_voter((0.0, 0.0))
+        self.data_manager.edit_voter_at(0, "3", False, 1)
+        self.data_manager.add_voters(np.array([(0.1, 0.1), (0.2, 0.2), (0.3, 0.3)]))
+
+        # Same labels as when adding the voters one by one
+        self.assertEqual([voter.get_label() for voter in self.data_manager.get_voters()], ["3", "2", "4", "5"])
+        self.assertEqual(self.data_manager.get_voter_at(2).coordinates(), (0.2, 0.2))
+        self.assertEqual(self.added, [(3, 1)])
+
+        # Labels stay unique
+        self.assertFalse(self.data_manager.edit_voter_at(1, "5", False, 1))
+        self.assertTrue(self.data_manager.edit_voter_at(1, "2", True, 1))
+        self.assertTrue(self.data_manager.edit_voter_at(1, "6", True, 1))
+        self.assertTrue(self.data_manager.edit_voter_at(0, "2", False, 1))
+
+    def test_add_candidates(self):
+        self.data_manager.add_candidate((0.0, 0.0), label="B")
+        self.data_manager.add_candidates(
+            [(0.1, 0.1), (0.2, 0.2), (0.3, 0.3)], labels=[None, "A", "Z"], colors=[None, "#ffffff", None]
+        )
+
+        self.assertEqual([candidate.get_label() for candidate in self.data_manager.get_candidates()], ["B", "C", "A", "Z"])
+        self.assertEqual(self.added, [(3, 1)])
+        self.assertFalse(self.data_manager.edit_candidate_at(0, "Z", "#ffffff"))
+
+    def test_candidate_labels(self):
+        labels = ["A", "Z", "AA", "AZ", "BA", "ZZ", "AAA", "ZZZ", "AAAA"]
+        indexes = [0, 25, 26, 51, 52, 701, 702, 18277, 18278]
+        self.assertEqual([DataManager.encode_label(index) for index in indexes], labels)
+        self.assertEqual([DataManager.decode_label(label) for label in labels], indexes)
+
+        # Taken labels are skipped
+        self.data_manager.add_candidates([(0.0, 0.0)] * 3, labels=["B", "D", None])
+        self.data_manager.add_candidates([(0.0, 0.0)] * 4, labels=[None, "B", None, "AB"])
+        self.assertEqual(
+            [candidate.get_label() for candidate in self.data_manager.get_candidates()],
+            ["B", "D", "C", "E", "F", "G", "AB"]
+        )
+
+    def test_get_by_label(self):
+        self.data_manager.add_voters([(0.1, 0.1), (0.2, 0.2)])
+        self.data_manager.add_candidates([(0.3, 0.3), (0.4, 0.4)])
+
+        self.assertEqual(self.data_manager.get_voter_by_label("2").coordinates(), (0.2, 0.2))
+        self.assertEqual(self.data_manager.get_candidate_by_label("A").coordinates(), (0.3, 0.3))
+        self.assertIsNone(self.data_manager.get_voter_by_label("3"))
+
+        # Lookups follow the edits
+        self.data_manager.edit_voter_at(1, "two", False, 1)
+        self.data_manager.edit_candidate_at(0, "C", "#ffffff")
+        self.assertIsNone(self.data_manager.get_voter_by_label("2"))
+        self.assertEqual(self.data_manager.get_voter_by_label("two").coordinates(), (0.2, 0.2))
+        self.assertIsNone(self.data_manager.get_candidate_by_label("A"))
+        self.assertEqual(self.data_manager.get_candidate_by_label("C").coordinates(), (0.3, 0.3))
+        self.data_manager.add_voter((0.5, 0.5))
+        self.assertEqual(self.data_manager.get_voter_by_label("3").coordinates(), (0.5, 0.5))
+
+        # and the clears
+        self.data_manager.clear_voters()
+        self.data_manager.clear_candidates()
+        self.assertIsNone(self.data_manager.get_voter_by_label("1"))
+        self.assertIsNone(self.data_manager.get_candidate_by_label("C"))
+
+    def test_batch(self):
+        self.data_manager.add_voters([(0.1, 0.1), (0.2, 0.2), (0.3, 0.3)])
+        self.data_manager.add_candidate((0.0, 0.0))
+        self.added.clear()
+        changes = []
+        self.data_manager.set_changes_callback(changes.append)
+        self.data_manager.set_voter_edited_callback(lambda voter, index: self.fail("callback called in batch"))
+
+        version = self.data_manager.get_version()
+        with self.data_manager.batch():
+            self.data_manager.edit_voter_at(2, "3", True, 0)
+            self.data_manager.edit_voter_at(0, "1", False, 2)
+            with self.data_manager.batch():
+                self.data_manager.add_voters([(0.4, 0.4), (0.5, 0.5)])
+            self.data_manager.edit_voter_at(3, "four", False, 1)
+            self.data_manager.clear_candidates()
+            self.data_manager.add_candidates([(0.6, 0.6), (0.7, 0.7)])
+            self.data_manager.edit_candidate_at(1, "Z", "#ffffff")
+            self.assertEqual(changes, [])
+
+        self.assertEqual(self.added, [])
+        self.assertEqual(len(changes), 1)
+        self.assertEqual(changes[0].get_start_version(), version)
+        self.assertFalse(changes[0].has_cleared_voters())
+        self.assertEqual(changes[0].get_first_added_voter(), 3)
+        self.assertEqual(changes[0].get_edited_voters(), [0, 2])
+        self.assertTrue(changes[0].has_cleared_candidates())
+        self.assertEqual(changes[0].get_first_added_candidate(), 0)
+        self.assertEqual(changes[0].get_edited_candidates(), [])
+
+        # Empty batches don't call the callback
+        with self.data_manager.batch():
+            pass
+        self.assertEqual(len(changes), 1)
+
+    def test_add_many_voters(self):
+        start = time.perf_counter()
+        self.data_manager.add_voters(np.random.uniform(-1, 1, (100_000, 2)))
+        self.assertLess(time.perf_counter() - start, 2)
+
+        labels = [voter.get_label() for voter in self.data_manager.get_voters()]
+        self.assertEqual(len(set(labels)), 100_000)
+
+    def tearDown(self):
+        self.data_manager.clear_voters()
+        self.data_manager.clear_candidates()
+        return
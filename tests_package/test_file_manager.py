@@ -0,0 +1,243 @@
+import gzip
+import os
+import tempfile
+import unittest
+import zipfile
+
+import numpy as np
+
+from candidate import Candidate
+from file_manager import FileManager
+from voter import Voter
+
+
+class TestFileManager(unittest.TestCase):
+    def setUp(self) -> None:
+        self.file_manager = FileManager()
+        self.directory = tempfile.TemporaryDirectory()
+        self.errors = []
+        self.imported = []
+        self.working_directory = os.getcwd()
+        os.chdir(self.directory.name)
+
+    def import_text(self, text: str) -> int:
+        filename = os.path.join(self.directory.name, "import.csv")
+        with open(filename, "w") as f:
+            f.write(text)
+        return self.file_manager.import_objects_from_file(
+            filename,
+            lambda title, message: self.errors.append(message),
+            lambda *objects: self.imported.append(objects)
+        )
+
+    def test_import(self):
+        text = "Candidats\n0.1,0.2,A,#ffa62b\n-0.3,0.4\n0.5,-0.6,C\n\nVotants\n0.7,0.8\n" + "0.1,-0.1\n" * 1000
+        self.assertEqual(self.import_text(text), 0)
+
+        voters, delegations, weights, candidates, labels, colors = self.imported[0]
+        np.testing.assert_array_equal(voters, [(0.7, 0.8)] + [(0.1, -0.1)] * 1000)
+        self.assertIsNone(delegations)
+        self.assertIsNone(weights)
+        np.testing.assert_array_equal(candidates, [(0.1, 0.2), (-0.3, 0.4), (0.5, -0.6)])
+        self.assertEqual(labels, ["A", None, "C"])
+        self.assertEqual(colors, ["#ffa62b", None, None])
+
+    def test_import_errors(self):
+        valid_voters = "Votants\n" + "0.1,-0.1\n" * 100
+        cases = [
+            (valid_voters + "0.1,1.5\n", "Les coordonnées à la ligne 102 sont invalides."),
+            (valid_voters + "0.1,a\n", "Les coordonnées à la ligne 102 sont invalides."),
+            (valid_voters + "0.1,0.1,A\n", "Le format de la ligne 102 est invalide."),
+            (valid_voters + "Autres\n", "Le format de la ligne 102 est invalide."),
+            ("Candidats\n0.1,0.1,,#ffa62b\n", "Le nom du candidat ne peut pas être vide."),
+            ("0.1,0.1\n", "Le format de la ligne 1 est invalide."),
+            ("Candidats\n1,2,3,4,5\n", "Le format de la ligne 2 est invalide."),
+        ]
+        for text, message in cases:
+            self.errors.clear()
+            self.assertEqual(self.import_text(text), -1)
+            self.assertEqual(self.errors, [message])
+        self.assertEqual(self.imported, [])
+
+        # Truncated and damaged compressed files
+        filename = os.path.join(self.directory.name, "import.csv.gz")
+        content = gzip.compress(valid_voters.encode())
+        for damaged in (content[:len(content) // 2], content[:20] + bytes(len(content) - 20)):
+            with open(filename, "wb") as f:
+                f.write(damaged)
+            self.errors.clear()
+            self.assertEqual(
+                self.file_manager.import_objects_from_file(
+                    filename, lambda title, message: self.errors.append(message), self.fail
+                ),
+                -1
+            )
+            self.assertEqual(self.errors, ["Le fichier est incomplet ou endommagé."])
+
+    def test_import_version_2(self):
+        text = "Version 2\nCandidats\n0.1,0.2,A,#ffa62b\nVotants\n0.7,0.8,3,0\n" + "0.1,-0.1,0,1\n" * 1000
+        self.assertEqual(self.import_text(text), 0)
+        voters, delegations, weights, candidates, labels, colors = self.imported[0]
+        np.testing.assert_array_equal(voters, [(0.7, 0.8)] + [(0.1, -0.1)] * 1000)
+        np.testing.assert_array_equal(delegations, [False] + [True] * 1000)
+        np.testing.assert_array_equal(weights, [3] + [0] * 1000)
+
+        valid_voters = "Version 2\nVotants\n" + "0.1,-0.1,1,0\n" * 100
+        cases = [
+            (valid_voters + "0.1,1.5,1,0\n", "Les coordonnées à la ligne 103 sont invalides."),
+            (valid_voters + "0.1,0.1,1.5,0\n", "Le format de la ligne 103 est invalide."),
+            (valid_voters + "0.1,0.1,1,2\n", "Le format de la ligne 103 est invalide."),
+            (valid_voters + "0.1,0.1\n", "Le format de la ligne 103 est invalide."),
+            ("Votants\nVersion 2\n", "Le format de la ligne 2 est invalide."),
+            ("Version 3\n", "Le format de la ligne 1 est invalide."),
+        ]
+        for text, message in cases:
+            self.errors.clear()
+            self.assertEqual(self.import_text(text), -1)
+            self.assertEqual(self.errors, [message])
+
+    def test_import_progress(self):
+        filename = os.path.join(self.directory.name, "import.csv.gz")
+        with gzip.open(filename, "wt") as f:
+            f.write("Votants\n" + "0.1,-0.1\n" * 200_000)
+        progress = []
+        self.assertEqual(
+            self.file_manager.import_objects_from_file(
+                filename, self.fail, lambda *objects: self.imported.append(objects), on_progress=progress.append
+            ),
+            0
+        )
+        self.assertGreater(len(progress), 1)
+        self.assertEqual(progress, sorted(progress))
+        self.assertEqual(progress[-1], 1.0)
+        self.assertEqual(len(self.imported[0][0]), 200_000)
+
+        # Cancelled after the first chunk
+        progress.clear()
+        self.assertEqual(
+            self.file_manager.import_objects_from_file(
+                filename, self.fail, self.fail, on_progress=progress.append, is_cancelled=lambda: len(progress) > 0
+            ),
+            -1
+        )
+        self.assertEqual(len(progress), 1)
+
+    def export_and_import(self, **kwargs) -> str:
+        voters = Voter.new_store()
+        voters.extend(
+            label=["1", "2", "3"], x=[0.1, -0.2, 1.0], y=[0.3, 0.4, -1.0], has_delegated_vote=[False, True, False],
+            weight=[1, 0, 2]
+        )
+        candidates = Candidate.new_store()
+        candidates.extend(label=["A", "B,é"], x=[0.5, -0.5], y=[0.0, 0.1], color=["#ffa62b", "#65fe08"])
+        self.assertEqual(
+            self.file_manager.export_objects_to_file(candidates, voters, self.fail, lambda *message: None, **kwargs),
+            0
+        )
+        filename = os.path.join("files", os.listdir("files")[0])
+
+        self.assertEqual(
+            self.file_manager.import_objects_from_file(filename, self.fail, lambda *objects: self.imported.append(objects)),
+            0
+        )
+        voters, delegations, weights, candidates, labels, colors = self.imported[0]
+        np.testing.assert_array_equal(voters, [(0.1, 0.3), (-0.2, 0.4), (1.0, -1.0)])
+        np.testing.assert_array_equal(delegations, [False, True, False])
+        np.testing.assert_array_equal(weights, [1, 0, 2])
+        np.testing.assert_array_equal(candidates, [(0.5, 0.0), (-0.5, 0.1)])
+        self.assertEqual(labels, ["A", "B,é"])
+        self.assertEqual(colors, ["#ffa62b", "#65fe08"])
+        return filename
+
+    def test_text_file(self):
+        self.assertTrue(self.export_and_import().endswith(".csv"))
+
+    def test_compressed_text_file(self):
+        self.assertTrue(self.export_and_import(compress=True).endswith(".csv.gz"))
+
+    def test_binary_file(self):
+        filename = self.export_and_import(binary=True)
+        self.assertTrue(filename.endswith(".elec"))
+
+        # Truncated file
+        self.imported.clear()
+        with open(filename, "rb") as f:
+            content = f.read()
+        with open(filename, "wb") as f:
+            f.write(content[:-10])
+        self.assertEqual(
+            self.file_manager.import_objects_from_file(
+                filename, lambda title, message: self.errors.append(message), self.fail
+            ),
+            -1
+        )
+        self.assertEqual(self.errors, ["Le fichier n'est pas un fichier de données binaire valide."])
+
+    def test_binary_file_arrays(self):
+        filename = self.export_and_import(binary=True)
+
+        # The arrays can be modified without modifying the file
+        voters = self.imported[0][0]
+        voters[0] = (0.9, 0.9)
+        self.imported.clear()
+        self.file_manager.import_objects_from_file(filename, self.fail, lambda *objects: self.imported.append(objects))
+        np.testing.assert_array_equal(self.imported[0][0][0], (0.1, 0.3))
+
+        # Negative weight
+        with open(filename, "rb") as f:
+            content = f.read()
+        weights = np.array([1, 0, 2], dtype="<i8").tobytes()
+        self.assertEqual(content.count(weights), 1)
+        with open(filename, "wb") as f:
+            f.write(content.replace(weights, np.array([1, -1, 2], dtype="<i8").tobytes()))
+        self.assertEqual(
+            self.file_manager.import_objects_from_file(
+                filename, lambda title, message: self.errors.append(message), self.fail
+            ),
+            -1
+        )
+        self.assertEqual(self.errors, ["Le fichier n'est pas un fichier de données binaire valide."])
+
+    def test_archive(self):
+        filename = self.export_and_import(archive=True)
+        self.assertTrue(filename.endswith(".zip"))
+        self.assertIsNone(self.file_manager.read_archive_section(filename, "results"))
+
+        # Each section is compressed on its own
+        with zipfile.ZipFile(filename) as archive:
+            self.assertEqual(
+                sorted(archive.namelist()), ["candidates.json", "delegations.npy", "scenario.json", "voters.npy"]
+            )
+            self.assertTrue(all(info.compress_type == zipfile.ZIP_DEFLATED for info in archive.infolist()))
+
+        # so the candidates and the results can be read while the voters are unreadable
+        voters = Voter.new_store()
+        voters.extend(label=["1"], x=[0.1], y=[0.2], has_delegated_vote=[False], weight=[1])
+        candidates = Candidate.new_store()
+        candidates.extend(label=["A"], x=[0.5], y=[0.0], color=["#ffa62b"])
+        self.file_manager.export_scenario_archive("archive.zip", candidates, voters, results={"borda": ["A"]})
+        with zipfile.ZipFile("archive.zip") as archive:
+            sections = {name: archive.read(name) for name in archive.namelist()}
+        with zipfile.ZipFile("archive.zip", "w", compression=zipfile.ZIP_DEFLATED) as archive:
+            for name, content in sections.items():
+                archive.writestr(name, content[:10] if name == "voters.npy" else content)
+
+        self.assertEqual(self.file_manager.read_archive_section("archive.zip", "scenario")["nb_voters"], 1)
+        coordinates, labels, colors = self.file_manager.read_archive_section("archive.zip", "candidates")
+        np.testing.assert_array_equal(coordinates, [(0.5, 0.0)])
+        self.assertEqual((labels, colors), (["A"], ["#ffa62b"]))
+        self.assertEqual(self.file_manager.read_archive_section("archive.zip", "results"), {"borda": ["A"]})
+        with self.assertRaises(ValueError):
+            self.file_manager.read_archive_section("archive.zip", "voters")
+        self.assertEqual(
+            self.file_manager.import_objects_from_file(
+                "archive.zip", lambda title, message: self.errors.append(message), self.fail
+            ),
+            -1
+        )
+        self.assertEqual(self.errors, ["Le fichier n'est pas une archive de scénario valide."])
+
+    def tearDown(self):
+        os.chdir(self.working_directory)
+        self.directory.cleanup()
+        return
@@ -0,0 +1,153 @@
+import math
+import unittest
+
+import numpy as np
+
+from data_manager import DataManager
+from profile_manager import ProfileManager
+
+
+class TestProfileManager(unittest.TestCase):
+    def setUp(self) -> None:
+        self.profile_manager = ProfileManager()
+        self.maximum = math.sqrt(8)
+        self.voters = [(0.2, 0.2), (-0.5, 0.9), (0.7, -0.3), (0.0, 0.0)]
+        self.candidates = [(0.1, 0.1), (-0.4, 0.8), (0.9, -0.9), (0.5, 0.5)]
+
+    def test_generate(self):
+        rankings, approvals = self.profile_manager.generate(
+            np.array(self.voters), np.array(self.candidates), self.maximum
+        )
+        self.assertEqual(rankings.shape, (len(self.voters), len(self.candidates)))
+        self.assertEqual(approvals.shape, (len(self.voters), len(self.candidates)))
+
+        for voter_index, voter in enumerate(self.voters):
+            expected = [
+                (candidate_index, (self.maximum - math.dist(voter, candidate)) / self.maximum)
+                for candidate_index, candidate in enumerate(self.candidates)
+            ]
+            expected.sort(key=lambda x: x[1], reverse=True)
+
+            self.assertEqual(rankings[voter_index].tolist(), [index for index, _ in expected])
+            for candidate_index, approval in expected:
+                self.assertAlmostEqual(approvals[voter_index, candidate_index], approval)
+
+    def test_generate_keeps_order_of_equidistant_candidates(self):
+        rankings, _ = self.profile_manager.generate(
+            np.array([(0.0, 0.0)]), np.array([(0.5, 0.0), (0.0, 0.5), (-0.5, 0.0), (0.1, 0.0)]), self.maximum
+        )
+        self.assertEqual(rankings[0].tolist(), [3, 0, 1, 2])
+
+    def test_get_profile_cache(self):
+        data_manager = DataManager()
+        data_manager.clear_voters()
+        data_manager.clear_candidates()
+        profile_manager = ProfileManager(cache_size=2)
+
+        self.assertIsNone(profile_manager.get_profile(data_manager, self.maximum))
+        for voter in self.voters:
+            data_manager.add_voter(voter)
+        for candidate in self.candidates:
+            data_manager.add_candidate(candidate)
+
+        profile = profile_manager.get_profile(data_manager, self.maximum)
+        self.assertEqual(profile.get_nb_voters(), len(self.voters))
+        self.assertIs(profile_manager.get_profile(data_manager, self.maximum), profile)
+        self.assertEqual((profile_manager.get_cache_hits(), profile_manager.get_cache_misses()), (1, 2))
+
+        version = data_manager.get_version()
+        data_manager.edit_voter_at(0, "1", True, 0)
+        self.assertGreater(data_manager.get_version(), version)
+        self.assertEqual(profile_manager.get_profile(data_manager, self.maximum).get_nb_voters(), len(self.voters) - 1)
+        self.assertEqual((profile_manager.get_cache_hits(), profile_manager.get_cache_misses()), (1, 3))
+
+        # The least recently used profiles are evicted
+        profile_manager.get_profile(data_manager, self.maximum * 2)
+        profile_manager.get_profile(data_manager, self.maximum)
+        self.assertEqual((profile_manager.get_cache_hits(), profile_manager.get_cache_misses()), (2, 4))
+        profile_manager.get_profile(data_manager, self.maximum * 3)
+        profile_manager.get_profile(data_manager, self.maximum * 2)
+        self.assertEqual((profile_manager.get_cache_hits(), profile_manager.get_cache_misses()), (2, 6))
+
+        # The data, and so its version, is shared by every data manager
+        other_data_manager = DataManager()
+        profile = profile_manager.get_profile(data_manager, self.maximum)
+        other_data_manager.add_voter((0.5, -0.5))
+        self.assertEqual(other_data_manager.get_version(), data_manager.get_version())
+        self.assertEqual(
+            profile_manager.get_profile(data_manager, self.maximum).get_nb_voters(), profile.get_nb_voters() + 1
+        )
+        self.assertEqual(
+            profile_manager.get_profile(other_data_manager, self.maximum).get_nb_voters(), profile.get_nb_voters() + 1
+        )
+
+        data_manager.clear_voters()
+        data_manager.clear_candidates()
+
+    def test_incremental_updates(self):
+        data_manager = DataManager()
+        data_manager.clear_voters()
+        data_manager.clear_candidates()
+        data_manager.set_voter_added_callback(self.profile_manager.on_voter_added)
+        data_manager.set_voters_added_callback(self.profile_manager.on_voters_added)
+        data_manager.set_voter_edited_callback(self.profile_manager.on_voter_edited)
+        data_manager.set_voters_cleared_callback(self.profile_manager.on_voters_cleared)
+        data_manager.set_candidate_added_callback(self.profile_manager.on_candidate_added)
+        data_manager.set_candidates_added_callback(self.profile_manager.on_candidates_added)
+        data_manager.set_candidate_edited_callback(self.profile_manager.on_candidate_edited)
+        data_manager.set_candidates_cleared_callback(self.profile_manager.on_candidates_cleared)
+
+        def assert_same_profile():
+            # A new profile manager computes the profile from scratch
+            expected = ProfileManager().get_profile(data_manager, self.maximum)
+            profile = self.profile_manager.get_profile(data_manager, self.maximum)
+            self.assertEqual(profile.to_profils(), expected.to_profils())
+
+        self.profile_manager.get_profile(data_manager, self.maximum)
+        for voter in self.voters:
+            data_manager.add_voter(voter)
+        # Candidates equidistant to a voter are ranked in the order they were added
+        for candidate in self.candidates + [(0.3, 0.3), (0.2, 0.2), (-0.5, 0.9)]:
+            data_manager.add_candidate(candidate)
+        assert_same_profile()
+
+        rng = np.random.default_rng(0)
+        data_manager.add_voters(rng.uniform(-1, 1, (100, 2)))
+        data_manager.add_candidates(rng.uniform(-1, 1, (3, 2)))
+        assert_same_profile()
+        data_manager.edit_voter_at(1, "1", True, 0)
+        data_manager.edit_voter_at(5, "five", False, 3)
+        data_manager.add_candidate((0.0, 0.0))
+        data_manager.edit_candidate_at(0, "Z", data_manager.get_candidate_at(0).get_color())
+        assert_same_profile()
+
+        data_manager.set_changes_callback(self.profile_manager.on_data_changed)
+        with data_manager.batch():
+            data_manager.edit_voter_at(1, "1", False, 1)
+            data_manager.add_voters(rng.uniform(-1, 1, (10, 2)))
+            data_manager.add_candidates(rng.uniform(-1, 1, (2, 2)))
+            data_manager.edit_voter_at(2, "2", True, 0)
+        assert_same_profile()
+        with data_manager.batch():
+            data_manager.clear_voters()
+            data_manager.add_voters(rng.uniform(-1, 1, (10, 2)))
+            data_manager.add_candidate((0.3, -0.1))
+        assert_same_profile()
+
+        data_manager.clear_candidates()
+        data_manager.add_candidates([(0.5, -0.5), (0.2, 0.2)])
+        data_manager.add_candidate((0.5, -0.5))
+        assert_same_profile()
+        # The candidates are added to the room kept for them, which grows when it is full
+        for candidate in rng.uniform(-1, 1, (20, 2)).round(1):
+            data_manager.add_candidate(tuple(candidate))
+        assert_same_profile()
+        data_manager.clear_voters()
+        data_manager.add_voter((0.1, 0.2))
+        assert_same_profile()
+
+        data_manager.clear_voters()
+        data_manager.clear_candidates()
+
+    def tearDown(self):
+        return
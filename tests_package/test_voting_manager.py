@@ -1,7 +1,12 @@
+import copy
 import unittest
+from time import monotonic
+
+import numpy as np
 
 import voting_manager
 from voting_manager import VotingManager
+from voting_profile import VotingProfile
 
 
 class TestVotingManager(unittest.TestCase):
@@ -77,6 +82,19 @@ class TestVotingManager(unittest.TestCase):
             self.voting_manager.elimination_successive(self.voting_profils), ('D', False, [])
         )
 
+    def test_elimination_successive_keeps_profils(self):
+        profils = copy.deepcopy(self.voting_profils)
+        self.voting_manager.elimination_successive(profils)
+        self.assertEqual(profils, self.voting_profils)
+
+        profils_condorcet = copy.deepcopy(self.voting_profils_condorcet)
+        self.assertEqual(self.voting_manager.elimination_successive(profils_condorcet), ('A', False, []))
+        self.assertEqual(profils_condorcet, self.voting_profils_condorcet)
+        self.assertEqual(
+            self.voting_manager.voting_details_manager.elimination_successive_details[0],
+            {1: [{'A': 1, 'B': 1, 'C': 1}, 'C'], 2: [{'A': 2, 'B': 1}, '']}
+        )
+
     def test_condorcet(self):
         self.assertEqual(
             self.voting_manager.condorcet(
@@ -123,6 +141,57 @@ class TestVotingManager(unittest.TestCase):
             ('A', True, True, ['B', 'A', 'C']),
         )
 
+    def test_weighted_scores(self):
+        weighted_profils = {
+            "1": ([("A", 0.70), ("B", 0.68), ("C", 0.60)], 2),
+            "2": ([("B", 0.65), ("C", 0.53), ("A", 0.48)], 0),
+            "3": ([("C", 0.79), ("A", 0.46), ("B", 0.44)], 2)
+        }
+        self.assertEqual(self.voting_manager.pluralite_simple(weighted_profils), ('A', True, ['A', 'C']))
+        self.assertEqual(self.voting_manager.voting_details_manager.remaining_methods_details[1], {'A': 2, 'B': 0, 'C': 2})
+        self.assertEqual(self.voting_manager.veto(weighted_profils), ('A', False, ['A']))
+        self.assertEqual(self.voting_manager.borda(weighted_profils, 3, 1), ('A', False, ['A']))
+        self.assertEqual(self.voting_manager.voting_details_manager.remaining_methods_details[1], {'A': 10, 'B': 6, 'C': 8})
+
+    def test_find_winners_many_candidates(self):
+        # Two voters with opposite preferences: every candidate gets the same Borda score
+        nb_candidates = 10000
+        candidate_labels = ["C" + str(index) for index in range(nb_candidates)]
+        rankings = np.array([np.arange(nb_candidates), np.arange(nb_candidates)[::-1]])
+        profile = VotingProfile(rankings, np.zeros((2, nb_candidates)), np.array([1, 1]), candidate_labels)
+
+        start_time = monotonic()
+        winner = self.voting_manager.borda(profile, nb_candidates, 1)
+        self.assertLess(monotonic() - start_time, 2)
+
+        self.assertEqual(winner, ("C0", True, candidate_labels))
+
+    def test_voting_profile(self):
+        profile = VotingProfile.from_profils(self.voting_profils)
+        self.assertEqual(
+            self.voting_manager.pluralite_simple(profile), self.voting_manager.pluralite_simple(self.voting_profils)
+        )
+        self.assertEqual(self.voting_manager.veto(profile), self.voting_manager.veto(self.voting_profils))
+        self.assertEqual(
+            self.voting_manager.borda(profile, len(self.candidates), 1),
+            self.voting_manager.borda(self.voting_profils, len(self.candidates), 1)
+        )
+        self.assertEqual(
+            self.voting_manager.approbation(profile, 25), self.voting_manager.approbation(self.voting_profils, 25)
+        )
+        self.assertEqual(
+            self.voting_manager.elimination_successive(profile),
+            self.voting_manager.elimination_successive(self.voting_profils)
+        )
+        self.assertEqual(
+            self.voting_manager.condorcet(
+                VotingProfile.from_profils(self.voting_profils_condorcet),
+                voting_manager.CondorcetMethod.SIMPSON,
+                voting_manager.CondorcetTieBreakingRule.RANDOM,
+            ),
+            ('A', True, True, ['B', 'A', 'C']),
+        )
+
 
 def tearDown(self):
     return
@@ -0,0 +1,39 @@
+import unittest
+
+import numpy as np
+
+from voting_profile import VotingProfile
+
+
+class TestVotingProfile(unittest.TestCase):
+    def setUp(self) -> None:
+        self.profils = {
+            "1": ([("A", 0.70), ("B", 0.68), ("C", 0.60)], 1),
+            "2": ([("B", 0.65), ("C", 0.53), ("A", 0.48)], 2),
+            "3": ([("C", 0.79), ("A", 0.46), ("B", 0.44)], 1)
+        }
+        self.profile = VotingProfile.from_profils(self.profils)
+
+    def test_from_profils(self):
+        self.assertEqual(self.profile.get_candidate_labels(), ("A", "B", "C"))
+        self.assertEqual(self.profile.get_voter_labels(), ("1", "2", "3"))
+        self.assertEqual(self.profile.get_rankings().dtype, np.int16)
+        self.assertEqual(self.profile.get_rankings().tolist(), [[0, 1, 2], [1, 2, 0], [2, 0, 1]])
+        self.assertEqual(self.profile.get_scores()[1].tolist(), [0.48, 0.65, 0.53])
+        self.assertEqual(self.profile.get_weights().tolist(), [1, 2, 1])
+        self.assertEqual(len(self.profile), 3)
+        self.assertEqual(self.profile.get_nb_candidates(), 3)
+
+    def test_to_profils(self):
+        self.assertEqual(self.profile.to_profils(), self.profils)
+
+    def test_read_only(self):
+        with self.assertRaises(ValueError):
+            self.profile.get_rankings()[0, 0] = 2
+        with self.assertRaises(ValueError):
+            self.profile.get_scores()[0, 0] = 0.5
+        with self.assertRaises(ValueError):
+            self.profile.get_weights()[0] = 3
+
+    def tearDown(self):
+        return
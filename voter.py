@@ -1,59 +1,103 @@
-from dataclasses import dataclass
+import numpy as np
+
+from array_store import ArrayStore
 
 
-@dataclass
 class Voter:
-    """Data class for keeping track of a voter."""
+    """
+    Class for keeping track of a voter.
+
+    A voter is a lightweight view of a row of a voter store (see new_store()):
+    its attributes are read from and written to the store's arrays. A voter
+    created on its own gets a store of its own.
+    """
 
-    __label: str
-    __coordinates: tuple
-    __has_delegated_vote: bool
-    __weight: int
+    __slots__ = ("__store", "__index")
 
     def __init__(self, label: str, coordinates: tuple):
-        self.__label = label
-        self.__coordinates = coordinates
-        self.__has_delegated_vote = False
-        self.__weight = 1
+        self.__store = self.new_store()
+        self.__index = self.__store.append(
+            label=label, x=coordinates[0], y=coordinates[1], has_delegated_vote=False, weight=1
+        )
+
+    @classmethod
+    def new_store(cls) -> ArrayStore:
+        """
+        Creates an empty store of voters, whose items are Voter views.
+
+        :return: the new store
+        """
+        return ArrayStore(
+            {"label": object, "x": np.float64, "y": np.float64, "has_delegated_vote": np.bool_, "weight": np.int64},
+            cls.view
+        )
+
+    @classmethod
+    def view(cls, store: ArrayStore, index: int):
+        """
+        Creates a view of the voter at the given index of a store of voters.
+
+        :param store: the store of voters
+        :param index: index of the voter in the store
+        :return: the voter
+        """
+        voter = cls.__new__(cls)
+        voter.__store = store
+        voter.__index = index
+        return voter
+
+    def __eq__(self, other) -> bool:
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return (
+            (self.get_label(), self.coordinates(), self.has_delegated_vote(), self.get_weight())
+            == (other.get_label(), other.coordinates(), other.has_delegated_vote(), other.get_weight())
+        )
+
+    def __repr__(self) -> str:
+        return (
+            f"Voter(label={self.get_label()!r}, coordinates={self.coordinates()!r}, "
+            f"has_delegated_vote={self.has_delegated_vote()!r}, weight={self.get_weight()!r})"
+        )
 
     def get_label(self) -> str:
         """
         :return: the voter's label
         """
-        return self.__label
+        return self.__store.get("label", self.__index)
 
     def set_label(self, label: str):
         """
         :param label: the voter's new label
         """
-        self.__label = label
+        self.__store.set("label", self.__index, label)
 
     def coordinates(self):
         """
         :return: the voter's coordinates
         """
-        return self.__coordinates
+        return float(self.__store.get("x", self.__index)), float(self.__store.get("y", self.__index))
 
     def has_delegated_vote(self) -> bool:
         """
         :return: whether the voter has delegated their vote or not
         """
-        return self.__has_delegated_vote
+        return bool(self.__store.get("has_delegated_vote", self.__index))
 
     def set_delegated_vote(self, has_delegated_vote: bool):
         """
         :param has_delegated_vote: whether the voter has delegated their vote or not
         """
-        self.__has_delegated_vote = has_delegated_vote
+        self.__store.set("has_delegated_vote", self.__index, has_delegated_vote)
 
     def get_weight(self) -> int:
         """
         :return: the voter's vote weight
         """
-        return self.__weight
+        return int(self.__store.get("weight", self.__index))
 
     def set_weight(self, weight: int):
         """
         :param weight: the voter's vote weight
         """
-        self.__weight = weight
+        self.__store.set("weight", self.__index, weight)
@@ -0,0 +1,44 @@
+class VotingDetailsData:
+    """
+    Class keeping the details of the last results computed by the VotingManager,
+    for each kind of voting method.
+
+    It doesn't depend on tkinter, so that the voting methods can be run without
+    any window: the details are shown by its subclass VotingDetails (see the
+    voting_details_manager module).
+    """
+
+    # Data list for Condorcet
+    condorcet_details = []
+
+    # Data list for STV
+    elimination_successive_details = []
+
+    # Data list for Veto, Borda, Approbation, and Simple plurality.
+    remaining_methods_details = []
+
+    def set_condorcet_details(self, value: list):
+        """
+        Sets the value of condorcet_details.
+
+        :param value: The value to affect
+        """
+        self.condorcet_details = value
+
+    def set_elimination_successive_details(self, value: list):
+        """
+        Sets the value of elimination_successive_details.
+
+        :param value: The value to affect
+        """
+        self.elimination_successive_details = value
+
+    def set_remaining_methods_details(self, value: list):
+        """
+        Sets the value of remaining_methods_details.
+        This functions initializes the data list for the Veto, Borda, Approbation,
+        and Simple plurality voting methods.
+
+        :param value: The value to affect
+        """
+        self.remaining_methods_details = value
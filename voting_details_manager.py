@@ -2,6 +2,7 @@ import tkinter as tk
 from tkinter import ttk, Toplevel
 from data_manager import DataManager
 from keyboard_manager import KeyboardManager
+from voting_details import VotingDetailsData
 
 top_step = None
 top_step_condorcet = None
@@ -10,15 +11,10 @@ top_step_elimination = None
 top_details = None
 
 
-class VotingDetails:
-    # Data list for Condorcet
-    condorcet_details = []
-
-    # Data list for STV
-    elimination_successive_details = []
-
-    # Data list for Veto, Borda, Approbation, and Simple plurality.
-    remaining_methods_details = []
+class VotingDetails(VotingDetailsData):
+    """
+    Class to show the details of the last results computed by the VotingManager.
+    """
 
     # List of candidates from data manager
     __data_manager = DataManager()
@@ -27,32 +23,6 @@ class VotingDetails:
     # Create a Keyboard Manager
     keyboard_manager = KeyboardManager()
 
-    def set_condorcet_details(self, value: list):
-        """
-        Sets the value of condorcet_details.
-
-        :param value: The value to affect
-        """
-        self.condorcet_details = value
-
-    def set_elimination_successive_details(self, value: list):
-        """
-        Sets the value of elimination_successive_details.
-
-        :param value: The value to affect
-        """
-        self.elimination_successive_details = value
-
-    def set_remaining_methods_details(self, value: list):
-        """
-        Sets the value of remaining_methods_details.
-        This functions initializes the data list for the Veto, Borda, Approbation,
-        and Simple plurality voting methods.
-
-        :param value: The value to affect
-        """
-        self.remaining_methods_details = value
-
     def __create_scrollbar(self, frame: Toplevel):
         """
         Creates a scrollbar frame to store the details in.
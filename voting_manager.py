@@ -2,8 +2,11 @@ import hashlib
 from collections import defaultdict
 from enum import Enum
 
+import numpy as np
+
 from data_manager import DataManager
-from voting_details_manager import VotingDetails
+from voting_details import VotingDetailsData
+from voting_profile import VotingProfile
 
 
 class CondorcetMethod(Enum):
@@ -31,8 +34,17 @@ class VotingManager:
     KEY_LOSSES = "losses"
     KEY_DRAWS = "draws"
 
+    # Maximum number of comparisons held in memory while computing pairwise preferences
+    PAIRWISE_CHUNK_SIZE = 2 ** 22
+
     data_manager = DataManager()
-    voting_details_manager = VotingDetails()
+
+    def __init__(self, voting_details_manager: VotingDetailsData | None = None):
+        """
+        :param voting_details_manager: where the details of the results are kept, VotingDetails to be able to show
+                                       them, a VotingDetailsData by default, which doesn't depend on tkinter
+        """
+        self.voting_details_manager = VotingDetailsData() if voting_details_manager is None else voting_details_manager
 
     def __departage(self, candidate_labels: list, reverse: bool = False) -> str:
         """
@@ -47,15 +59,20 @@ class VotingManager:
     def __find_winners(self, results: dict, reverse: bool = True) -> list[str]:
         """
         Finds the winners in a dictionary of candidates and scores.
+        The best score is found first, so that the results are only read twice.
 
         :param results: dictionary of results (..., candidate_label : score, ...)
         :param reverse: whether to select winners by max or min score
         :return: list(winners' labels)
         """
+        if not results:
+            return []
+
+        best_score = max(results.values()) if reverse else min(results.values())
         return [
             candidate_label
             for candidate_label, score in results.items()
-            if score == sorted(results.values(), reverse=reverse)[0]
+            if score == best_score
         ]
 
     def __find_winner(self, results: dict) -> tuple[str, bool, list]:
@@ -70,43 +87,122 @@ class VotingManager:
         winners = self.__find_winners(results)
         return self.__departage(winners), len(winners) > 1, winners
 
-    def __count_scores(self, profils: dict) -> dict:
+    def __as_profile(self, profils: VotingProfile | dict) -> VotingProfile:
+        """
+        Returns the given profile, converting it first if it uses the legacy dictionary format.
+
+        :param profils: voting profile, or dictionary of the scores of each voter
+        :return: the voting profile
+        """
+        if isinstance(profils, VotingProfile):
+            return profils
+        return VotingProfile.from_profils(profils)
+
+    def __counting_weights(self, weights: np.ndarray) -> np.ndarray | None:
+        """
+        Prepares the weights of the voters for __weighted_count().
+
+        :param weights: array of shape (nb_voters,) of weights
+        :return: None if every voter has a weight of 1 (candidates are then simply counted),
+                 the weights as floats otherwise
+        """
+        if np.all(weights == 1):
+            return None
+        return weights.astype(np.float64)
+
+    def __weighted_count(self, candidate_indexes: np.ndarray, weights: np.ndarray | None, nb_candidates: int) -> np.ndarray:
+        """
+        Sums the weights of the voters for each candidate index they point to.
+
+        :param candidate_indexes: array of shape (nb_voters,) of candidate indexes
+        :param weights: weights prepared by __counting_weights()
+        :param nb_candidates: the number of candidates
+        :return: array of shape (nb_candidates,) of summed weights
         """
-        Counts the scores of the candidates based on the preferences of the voters
+        if weights is None:
+            return np.bincount(candidate_indexes, minlength=nb_candidates)
+        return np.bincount(candidate_indexes, weights=weights, minlength=nb_candidates)
 
-        :param profils: dictionary of the scores of each voter
-        :return: dictionary of the updated scores of each voter
+    def __first_appearance_order(self, candidate_indexes: np.ndarray, nb_candidates: int) -> np.ndarray:
         """
-        scores = dict()
+        Returns the distinct candidate indexes in the order of their first appearance.
 
-        for _, (preferences, weight) in profils.items():
-            label = preferences[0][0]
-            if label not in scores:
-                scores[label] = 0
-            scores[label] += weight
-        return scores
+        Candidates usually all appear among the first voters, so the array is scanned
+        in growing chunks until every distinct candidate has been met.
 
-    def elimination_successive(self, profils: dict) -> tuple[str, bool, list]:
+        :param candidate_indexes: array of candidate indexes
+        :param nb_candidates: the number of candidates
+        :return: array of the distinct candidate indexes
+        """
+        nb_distinct = np.count_nonzero(np.bincount(candidate_indexes, minlength=nb_candidates))
+        end = 1024
+        while True:
+            distinct_indexes, first_positions = np.unique(candidate_indexes[:end], return_index=True)
+            if len(distinct_indexes) == nb_distinct or end >= len(candidate_indexes):
+                return distinct_indexes[np.argsort(first_positions)]
+            end *= 4
+
+    def __to_results(self, points: np.ndarray, order: np.ndarray, profile: VotingProfile) -> dict:
+        """
+        Builds a dictionary of results from an array of points.
+        Points are integers if the voters' weights are integers.
+
+        :param points: array of shape (nb_candidates,) of points
+        :param order: candidate indexes to include, in order
+        :param profile: the voting profile the points were computed from
+        :return: dictionary of results (..., candidate_label : score, ...)
+        """
+        if np.issubdtype(profile.get_weights().dtype, np.integer):
+            points = points.astype(np.int64)
+        candidate_labels = profile.get_candidate_labels()
+        return dict(zip([candidate_labels[index] for index in order.tolist()], points[order].tolist()))
+
+    def elimination_successive(self, profils: VotingProfile | dict) -> tuple[str, bool, list] | None:
         """
         Returns the winner according to Single transferable vote (STV) system.
         Eliminates the last candidate in alphabetical order in case of equality.
 
-        :param profils: dictionary of the scores of each voter
+        The scores are not recounted at each round: every voter points to their
+        current preference, and only the ballots of the eliminated candidate are
+        moved to their next remaining preference. The given profile is not modified.
+
+        :param profils: voting profile, or dictionary of the scores of each voter
         :return: tuple(str(winner label), bool(multiple winners?), list(all winners' labels))
         """
+        profile = self.__as_profile(profils)
+        candidate_indexes = {candidate_label: index for index, candidate_label in enumerate(profile.get_candidate_labels())}
+        rankings = profile.get_rankings()
+        nb_voters, nb_candidates = rankings.shape
+        weights = self.__counting_weights(profile.get_weights())
+
         elimination_successive_data = []
+        majority = nb_voters / 2
+
+        # Rank (in their preferences) of the current choice of each voter
+        pointers = np.zeros(nb_voters, dtype=np.int64)
+        is_remaining = np.ones(nb_candidates, dtype=bool)
 
-        scores = self.__count_scores(profils)
-        majority = len(profils) / 2
+        # Points, number of supporters and smallest supporter index of each candidate
+        current_choices = rankings[:, 0]
+        points = self.__weighted_count(current_choices, weights, nb_candidates).astype(np.float64)
+        nb_supporters = np.bincount(current_choices, minlength=nb_candidates)
+        first_supporters = np.full(nb_candidates, nb_voters)
+        # Voter indexes whose current choice is each candidate
+        supporters = [[] for _ in range(nb_candidates)]
+        self.__add_supporters(supporters, first_supporters, np.arange(nb_voters), current_choices)
 
         round_number = 1
         all_scores = dict()
 
-        while scores:
-            scores = self.__count_scores(profils)
+        while np.any(nb_supporters > 0):
+            # Candidates having supporters, in the order of their first supporter
+            order = np.flatnonzero(nb_supporters > 0)
+            order = order[np.argsort(first_supporters[order], kind="stable")]
+            scores = self.__to_results(points, order, profile)
+
             all_scores[round_number] = [scores.copy(), ""]
-            for candidate, points in scores.items():
-                if points > majority:
+            for candidate, candidate_points in scores.items():
+                if candidate_points > majority:
                     winner = candidate, False, []
                     elimination_successive_data.append(all_scores)
                     elimination_successive_data.append(majority)
@@ -115,27 +211,63 @@ class VotingManager:
                     return winner
 
             # Find the list of labels of all candidates who had the lowest score
-            losers = [
-                label
-                for label, score in scores.items()
-                if score == sorted(scores.values(), reverse=False)[0]
-            ]
+            losers = self.__find_winners(scores, reverse=False)
 
             # Remove the candidate whose label is last in alphabetical order
             letter = self.__departage(losers, True)
-            scores.pop(letter)
-
             all_scores[round_number][1] = letter
 
-            for _, (profil, weight) in profils.items():
-                for candidate, _ in profil:
-                    if candidate == letter:
-                        profil.remove((candidate, _))
-                        break
+            eliminated = candidate_indexes[letter]
+            is_remaining[eliminated] = False
+            points[eliminated] = 0
+            nb_supporters[eliminated] = 0
+            moved_voters = np.concatenate(supporters[eliminated])
+            supporters[eliminated] = []
+
+            # Move the ballots of the eliminated candidate to their next remaining preference
+            while len(moved_voters) > 0:
+                pointers[moved_voters] += 1
+                moved_voters = moved_voters[pointers[moved_voters] < nb_candidates]
+                next_choices = rankings[moved_voters, pointers[moved_voters]]
+                is_settled = is_remaining[next_choices]
+
+                settled_voters = moved_voters[is_settled]
+                settled_choices = next_choices[is_settled]
+                points += self.__weighted_count(
+                    settled_choices, None if weights is None else weights[settled_voters], nb_candidates
+                )
+                nb_supporters += np.bincount(settled_choices, minlength=nb_candidates)
+                self.__add_supporters(supporters, first_supporters, settled_voters, settled_choices)
+
+                moved_voters = moved_voters[~is_settled]
 
             round_number += 1
 
-    def approbation(self, profils: dict, approval_radius: int) -> tuple[str, bool, list] | None:
+        return None
+
+    def __add_supporters(self, supporters: list, first_supporters: np.ndarray, voters: np.ndarray, choices: np.ndarray):
+        """
+        Adds voters to the supporters of their current choice.
+
+        :param supporters: list, for each candidate, of the arrays of voter indexes supporting them
+        :param first_supporters: array of shape (nb_candidates,) of the smallest supporter index of each candidate
+        :param voters: array of voter indexes
+        :param choices: array of candidate indexes, the current choice of each voter
+        """
+        if len(voters) == 0:
+            return
+
+        # Group the voters by choice
+        sorted_positions = np.argsort(choices, kind="stable")
+        voters = voters[sorted_positions]
+        choices = choices[sorted_positions]
+        boundaries = np.flatnonzero(np.diff(choices)) + 1
+
+        for candidate_index, candidate_voters in zip(choices[np.r_[0, boundaries]].tolist(), np.split(voters, boundaries)):
+            supporters[candidate_index].append(candidate_voters)
+            first_supporters[candidate_index] = min(first_supporters[candidate_index], candidate_voters.min())
+
+    def approbation(self, profils: VotingProfile | dict, approval_radius: int) -> tuple[str, bool, list] | None:
         """
         Approval voting system (système de vote par approbation).
 
@@ -143,18 +275,23 @@ class VotingManager:
         by voting "yes / no" for each one. Approval is given if the voter is
         within an approval circle whose radius is defined by the user.
 
-        :param profils: Scores for each voter
+        :param profils: voting profile, or dictionary of the scores of each voter
         :param approval_radius: Radius of the approval circle
         :return: tuple(str(winner label), bool(multiple winners?), list(all winners' labels))
         """
-        results = dict()
+        profile = self.__as_profile(profils)
+        rankings = profile.get_rankings()
+        nb_candidates = profile.get_nb_candidates()
 
-        for voter_label, (profil, weight) in profils.items():
-            for candidate_label, score in profil:
-                if (score * 100) >= 100 - approval_radius:
-                    if candidate_label not in results:
-                        results[candidate_label] = 0
-                    results[candidate_label] += weight
+        # Rankings being sorted by score, the approved candidates of each voter are the first ones of their ranking
+        nb_approved = np.count_nonzero(profile.get_scores().astype(np.float64) * 100 >= 100 - approval_radius, axis=1)
+        approved = rankings[np.arange(nb_candidates) < nb_approved[:, np.newaxis]]
+
+        weights = self.__counting_weights(profile.get_weights())
+        if weights is not None:
+            weights = np.repeat(weights, nb_approved)
+        points = self.__weighted_count(approved, weights, nb_candidates)
+        results = self.__to_results(points, self.__first_appearance_order(approved, nb_candidates), profile)
 
         if len(results) == 0:
             winner = None
@@ -164,27 +301,29 @@ class VotingManager:
         self.voting_details_manager.set_remaining_methods_details([winner, results])
         return winner
 
-    def pluralite_simple(self, profils: dict) -> tuple[str, bool, list]:
+    def pluralite_simple(self, profils: VotingProfile | dict) -> tuple[str, bool, list]:
         """
         Returns the winner according to simple majority voting method.
         Returns the first in alphabetical order in case of equality.
 
-        :param profils: dictionary of votes registered by the voters
+        :param profils: voting profile, or dictionary of votes registered by the voters
         :return: tuple(str(winner label), bool(multiple winners?), list(all winners' labels))
         """
-        points_association = dict()
+        profile = self.__as_profile(profils)
+        nb_candidates = profile.get_nb_candidates()
+        first_choices = profile.get_rankings()[:, 0]
 
-        for (candidate, weight) in profils.values():
-            candidate_label, _ = candidate[0]
-            if candidate_label not in points_association:
-                points_association[candidate_label] = 0
-            points_association[candidate_label] += weight
+        # Each voter gives their weight to their first choice
+        points = self.__weighted_count(first_choices, self.__counting_weights(profile.get_weights()), nb_candidates)
+        points_association = self.__to_results(
+            points, self.__first_appearance_order(first_choices, nb_candidates), profile
+        )
 
         winner = self.__find_winner(points_association)
         self.voting_details_manager.set_remaining_methods_details([winner, points_association])
         return winner
 
-    def borda(self, profils: dict, maximum: int, step: int) -> tuple[str, bool, list]:
+    def borda(self, profils: VotingProfile | dict, maximum: int, step: int) -> tuple[str, bool, list]:
         """
         Returns the winner according to Borda voting method.
 
@@ -195,46 +334,68 @@ class VotingManager:
         In case of equality, the function returns the first in alphabetical order.
 
         :param step: step between two scores (ex: if max=100 and step=5, score attribution: 100, 95, 90, ...)
-        :param profils: dictionary of votes registered by the voters
+        :param profils: voting profile, or dictionary of votes registered by the voters
         :param maximum: maximum score to attribute to the top candidate
         :return: tuple(str(winner label), bool(multiple winners?), list(all winners' labels))
         """
-        points_association = dict()
+        profile = self.__as_profile(profils)
+        nb_candidates = profile.get_nb_candidates()
+        rankings = profile.get_rankings()
+        weights = self.__counting_weights(profile.get_weights())
+
+        # Only the ranks giving a positive amount of points are counted
+        nb_ranks = 0
+        while nb_ranks < nb_candidates and maximum - (nb_ranks * step) > 0:
+            nb_ranks += 1
 
-        for (profil, weight) in profils.values():
-            for i, (candidate_label, _) in enumerate(profil):
-                if candidate_label not in points_association:
-                    points_association[candidate_label] = 0
-                if (maximum - (i * step)) > 0:
-                    points_association[candidate_label] += (maximum - (i * step)) * weight
+        # Each rank becomes a contiguous row, counted in one go
+        ranks = np.ascontiguousarray(rankings[:, :nb_ranks].T)
+        points = np.zeros(nb_candidates)
+        for i, candidate_indexes in enumerate(ranks):
+            points += (maximum - (i * step)) * self.__weighted_count(candidate_indexes, weights, nb_candidates)
+
+        points_association = self.__to_results(points, rankings[0], profile)
 
         winner = self.__find_winner(points_association)
         self.voting_details_manager.set_remaining_methods_details([winner, points_association])
         return winner
 
-    def veto(self, profils: dict) -> tuple[str, bool, list]:
+    def veto(self, profils: VotingProfile | dict) -> tuple[str, bool, list]:
         """
         Implementation of veto sorting method : 0 for the last candidate in each profil, 1 for the rest
 
-        :param profils: dictionary of votes registered by the voters
+        :param profils: voting profile, or dictionary of votes registered by the voters
         :return: tuple(str(winner label), bool(multiple winners?), list(all winners' labels))
         """
-        veto_scores = dict()
-
-        for (profil, weight) in profils.values():
-            if len(profil) == 1:
-                return profil[0][0], False, []
-
-            for candidate_label, _ in profil[:-1]:
-                if candidate_label not in veto_scores:
-                    veto_scores[candidate_label] = 0
-                veto_scores[candidate_label] += weight
+        profile = self.__as_profile(profils)
+
+        if profile.get_nb_candidates() == 1:
+            # The only candidate is every voter's last choice
+            winner = profile.get_candidate_labels()[0], False, []
+            self.voting_details_manager.set_remaining_methods_details([winner, {winner[0]: 0}])
+            return winner
+
+        rankings = profile.get_rankings()
+        weights = profile.get_weights()
+
+        # Each voter gives their weight to every candidate, except to their last choice
+        last_choices = rankings[:, -1]
+        points = weights.sum() - self.__weighted_count(
+            last_choices, self.__counting_weights(weights), profile.get_nb_candidates()
+        )
+
+        # Candidates appear in the order of the first voter's preferences, the first voter's
+        # last choice being the last to appear (unless every voter ranks them last)
+        order = rankings[0, :-1]
+        if np.any(last_choices != last_choices[0]):
+            order = np.append(order, last_choices[0])
+        veto_scores = self.__to_results(points, order, profile)
 
         winner = self.__find_winner(veto_scores)
         self.voting_details_manager.set_remaining_methods_details([winner, veto_scores])
         return winner
 
-    def condorcet(self, profils: dict, method: CondorcetMethod, tie_breaking_rule: CondorcetTieBreakingRule) -> tuple[str, bool, bool, list | None] | None:
+    def condorcet(self, profils: VotingProfile | dict, method: CondorcetMethod, tie_breaking_rule: CondorcetTieBreakingRule) -> tuple[str, bool, bool, list | None] | None:
         """
         Condorcet voting system.
 
@@ -250,7 +411,7 @@ class VotingManager:
 
         If there are multiple winners, we use the tie-breaking rule given as argument.
 
-        :param profils: Scores for each voter
+        :param profils: voting profile, or dictionary of the scores of each voter
         :param method: Method to use in case there is no Condorcet winner
         :param tie_breaking_rule: Tie-breaking rule to use in order to decide who wins
         :return: tuple(
@@ -260,8 +421,13 @@ class VotingManager:
                     list(all winners' labels)
                 )
         """
-        # Candidate labels list
-        candidate_labels = [candidate_label for candidate_label, _ in list(profils.values())[0][0]]
+        profile = self.__as_profile(profils)
+        all_candidate_labels = profile.get_candidate_labels()
+        # Candidate indexes, in the order of the first voter's preferences
+        display_order = profile.get_rankings()[0].tolist()
+
+        # Candidate labels list, in the order of the first voter's preferences
+        candidate_labels = [all_candidate_labels[candidate_index] for candidate_index in display_order]
         duel_scores = None
         duel_results = None
         winners = None
@@ -270,50 +436,27 @@ class VotingManager:
         if len(candidate_labels) == 1:
             winner = candidate_labels[0], False, False, None
         else:
-            # We organise duels and calculate scores
-            duel_scores = list()
-            for candidate1_label in candidate_labels:
-                for candidate2_label in candidate_labels:
-                    # so that we have unique pairs (combination)
-                    if candidate2_label > candidate1_label:
-                        current_duel = {candidate1_label: 0, candidate2_label: 0}
-                        for (profil, weight) in profils.values():
-                            for candidate_label, _ in profil:
-                                if candidate_label in current_duel:
-                                    current_duel[candidate_label] += weight
-                                    break
-                        duel_scores.append(current_duel)
-
-            # We try and see if there's a Condorcet winner
-            duel_results = defaultdict(lambda: defaultdict(list))
-            for duel_score in duel_scores:
-                loser, winner = sorted(duel_score.keys(), key=lambda k: duel_score[k])
-
-                if duel_score[winner] != duel_score[loser]:
-                    duel_results[winner][self.KEY_WINS].append(loser)
-                    duel_results[loser][self.KEY_LOSSES].append(winner)
-                else:
-                    duel_results[winner][self.KEY_DRAWS].append(loser)
-                    duel_results[loser][self.KEY_DRAWS].append(winner)
-            try:
+            # preferences[i, j] is the score of candidate i in their duel against candidate j
+            preferences = self.__pairwise_preferences(profile)
+            duel_scores, duel_results = self.__duels_details(preferences, display_order, all_candidate_labels)
+
+            # We try and see if there's a Condorcet winner: a candidate winning all their duels
+            wins = preferences > preferences.T
+            condorcet_winners = np.flatnonzero(wins.sum(axis=1) == profile.get_nb_candidates() - 1)
+            if len(condorcet_winners) > 0:
                 # Condorcet winner success
-                winner_label = next(
-                    candidate_label
-                    for candidate_label, results in duel_results.items()
-                    if len(results[self.KEY_LOSSES]) == 0 and len(results[self.KEY_DRAWS]) == 0
-                )
-                winner = winner_label, False, False, None
-            except StopIteration:
+                winner = all_candidate_labels[condorcet_winners[0]], False, False, None
+            else:
                 # Condorcet winner fail: there's no Condorcet winner
                 # We have to use method given as an argument
                 winners = None
                 match method:
                     # Copeland method
                     case CondorcetMethod.COPELAND:
-                        winners = self.__condorcet_winners_copeland(duel_scores)
+                        winners = self.__condorcet_winners_copeland(preferences, display_order, all_candidate_labels)
                     # Simpson method
                     case CondorcetMethod.SIMPSON:
-                        winners = self.__condorcet_winners_simpson(duel_scores)
+                        winners = self.__condorcet_winners_simpson(preferences, display_order, all_candidate_labels)
 
                 # If we have only one winner, return them
                 if len(winners) == 1:
@@ -354,7 +497,119 @@ class VotingManager:
             ord_of_hash_characters += ord(character)
         return winners[ord_of_hash_characters % len(winners)]
 
-    def __condorcet_winners_copeland(self, duels: list[dict[str, int]]) -> list[str]:
+    def __pairwise_preferences(self, profile: VotingProfile) -> np.ndarray:
+        """
+        Computes the weighted pairwise preference matrix of a profile.
+
+        The position of every candidate in every voter's preferences is computed once,
+        then voters are compared by chunks, so that each chunk holds at most
+        PAIRWISE_CHUNK_SIZE comparisons in memory.
+
+        :param profile: the voting profile
+        :return: array of shape (nb_candidates, nb_candidates) where [i, j] is the total weight
+                 of the voters preferring candidate i to candidate j
+        """
+        rankings = profile.get_rankings()
+        nb_voters, nb_candidates = rankings.shape
+        weights = profile.get_weights().astype(np.float64)
+
+        # positions[v, c] is the rank given by voter v to candidate c
+        positions = np.empty_like(rankings)
+        positions[np.arange(nb_voters)[:, None], rankings] = np.arange(nb_candidates, dtype=rankings.dtype)
+
+        preferences = np.zeros(nb_candidates * nb_candidates)
+        chunk_size = max(1, self.PAIRWISE_CHUNK_SIZE // (nb_candidates * nb_candidates))
+        for start in range(0, nb_voters, chunk_size):
+            chunk = positions[start:start + chunk_size]
+            preferred = chunk[:, :, None] < chunk[:, None, :]
+            preferences += weights[start:start + chunk_size] @ preferred.reshape(len(chunk), -1)
+        preferences = preferences.reshape(nb_candidates, nb_candidates)
+
+        if np.issubdtype(profile.get_weights().dtype, np.integer):
+            return preferences.astype(np.int64)
+        return preferences
+
+    def __duels_details(self, preferences: np.ndarray, display_order: list[int], candidate_labels: tuple[str, ...]) -> tuple[list, dict]:
+        """
+        Lists the duels and their results, for display purposes.
+
+        :param preferences: the pairwise preference matrix
+        :param display_order: the candidate indexes, in display order
+        :param candidate_labels: the candidates' labels
+        :return: tuple(
+                    list(..., { candidate1_label: score, candidate2_label: score }, ...),
+                    dict(..., candidate_label: { "wins": [...], "losses": [...], "draws": [...] }, ...)
+                )
+        """
+        scores = preferences.tolist()
+        duel_scores = list()
+        duel_results = defaultdict(lambda: defaultdict(list))
+        for candidate1_index in display_order:
+            candidate1_label = candidate_labels[candidate1_index]
+            for candidate2_index in display_order:
+                candidate2_label = candidate_labels[candidate2_index]
+                # so that we have unique pairs (combination)
+                if candidate2_label > candidate1_label:
+                    score1 = scores[candidate1_index][candidate2_index]
+                    score2 = scores[candidate2_index][candidate1_index]
+                    duel_scores.append({candidate1_label: score1, candidate2_label: score2})
+
+                    if score1 > score2:
+                        duel_results[candidate1_label][self.KEY_WINS].append(candidate2_label)
+                        duel_results[candidate2_label][self.KEY_LOSSES].append(candidate1_label)
+                    elif score1 < score2:
+                        duel_results[candidate2_label][self.KEY_WINS].append(candidate1_label)
+                        duel_results[candidate1_label][self.KEY_LOSSES].append(candidate2_label)
+                    else:
+                        duel_results[candidate2_label][self.KEY_DRAWS].append(candidate1_label)
+                        duel_results[candidate1_label][self.KEY_DRAWS].append(candidate2_label)
+
+        return duel_scores, duel_results
+
+    def __order_by_first_duel(
+            self,
+            candidates: np.ndarray,
+            counted: np.ndarray,
+            display_order: list[int],
+            candidate_labels: tuple[str, ...],
+            first_candidate_after: bool
+    ) -> list[int]:
+        """
+        Orders candidates by the first duel in which they are counted.
+
+        Duels are held in display order: each candidate of the display order meets the
+        following candidates of the display order whose label comes after theirs.
+
+        :param candidates: the candidate indexes to order
+        :param counted: array of shape (nb_candidates, nb_candidates) where [i, j] tells
+                        whether candidate i is counted in their duel against candidate j
+        :param display_order: the candidate indexes, in display order
+        :param candidate_labels: the candidates' labels
+        :param first_candidate_after: whether the first candidate of a duel is counted after
+                                      the second one when both are counted
+        :return: the ordered candidate indexes
+        """
+        nb_candidates = len(candidate_labels)
+        positions = np.empty(nb_candidates, dtype=np.int64)
+        positions[display_order] = np.arange(nb_candidates)
+        label_ranks = np.empty(nb_candidates, dtype=np.int64)
+        label_ranks[sorted(range(nb_candidates), key=candidate_labels.__getitem__)] = np.arange(nb_candidates)
+
+        first_duels = dict()
+        for candidate in candidates.tolist():
+            # Duels held by the candidate, then duels held by their opponents
+            as_first = counted[candidate] & (label_ranks > label_ranks[candidate])
+            as_second = counted[candidate] & (label_ranks < label_ranks[candidate])
+            duels = []
+            if as_first.any():
+                duels.append((positions[candidate], positions[as_first].min(), int(first_candidate_after)))
+            if as_second.any():
+                duels.append((positions[as_second].min(), positions[candidate], int(not first_candidate_after)))
+            first_duels[candidate] = min(duels, default=(nb_candidates, nb_candidates, 0))
+
+        return sorted(first_duels, key=first_duels.__getitem__)
+
+    def __condorcet_winners_copeland(self, preferences: np.ndarray, display_order: list[int], candidate_labels: tuple[str, ...]) -> list[str]:
         """
         Condorcet voting system.
         Copeland's method.
@@ -364,57 +619,44 @@ class VotingManager:
 
         Winner is the candidate with most points.
 
-        :param duels: list(..., { candidate1_label: score, candidate2_label: score }, ...)
+        :param preferences: the pairwise preference matrix
+        :param display_order: the candidate indexes, in display order
+        :param candidate_labels: the candidates' labels
         :return: list(winners)
         """
-        scores = dict()
-        for duel in duels:
-            duel_items = list(duel.items())
-
-            # Assign a score of 0.5 to each candidate in  case of equality
-            if duel_items[0][1] == duel_items[1][1]:
-                if duel_items[0][0] not in scores:
-                    scores[duel_items[0][0]] = 0
-                if duel_items[1][0] not in scores:
-                    scores[duel_items[1][0]] = 0
-                scores[duel_items[0][0]] += 0.5
-                scores[duel_items[1][0]] += 0.5
-            else:
-                # Assign a score of 1 to the winner
-                winner_index = 0 if duel_items[0][1] > duel_items[1][1] else 1
-                if duel_items[winner_index][0] not in scores:
-                    scores[duel_items[winner_index][0]] = 0
-                scores[duel_items[winner_index][0]] += 1
+        wins = preferences > preferences.T
+        draws = preferences == preferences.T
+        np.fill_diagonal(draws, False)
+
+        scores = wins.sum(axis=1) + 0.5 * draws.sum(axis=1)
+        winners = np.flatnonzero(scores == scores.max())
 
-        return self.__find_winners(scores)
+        # Winners are listed in the order in which they first scored
+        winners = self.__order_by_first_duel(winners, wins | draws, display_order, candidate_labels, False)
+        return [candidate_labels[candidate_index] for candidate_index in winners]
 
-    def __condorcet_winners_simpson(self, duels: list[dict[str, int]]) -> list[str]:
+    def __condorcet_winners_simpson(self, preferences: np.ndarray, display_order: list[int], candidate_labels: tuple[str, ...]) -> list[str]:
         """
         Condorcet voting system.
         Simpson's method.
 
         The winner is the candidate whose highest defeat score in duels is the lowest among the other candidates.
-        :param duels: list(..., { candidate1_label: score, candidate2_label: score }, ...)
+
+        :param preferences: the pairwise preference matrix
+        :param display_order: the candidate indexes, in display order
+        :param candidate_labels: the candidates' labels
         :return: list(winners)
         """
-        # type : { cand1:[difference des DEFAITES de cand1], ... , candN:[difference des DEFAITES de candn] }
-        defeatscores = defaultdict(list)
-
-        for duel in duels:
-            # Creating list of couples in a single duel -> list(tuple):
-            duel_items = list(duel.items())
-            # Initializing the score differences list
-            if duel_items[0][1] < duel_items[1][1]:
-                defeatscores[duel_items[0][0]].append(abs(duel_items[0][1] - duel_items[1][1]))
-            elif duel_items[0][1] > duel_items[1][1]:
-                defeatscores[duel_items[1][0]].append(abs(duel_items[0][1] - duel_items[1][1]))
-            else:
-                defeatscores[duel_items[1][0]].append(0)
-                defeatscores[duel_items[0][0]].append(0)
-
-        maxdefeat = dict()
-
-        for label, listscore in defeatscores.items():
-            maxdefeat[label] = max(listscore)
-
-        return self.__find_winners(maxdefeat, reverse=False)
+        # defeats[i, j] is the difference of scores of the duel lost (or drawn) by i against j
+        defeats = preferences.T - preferences
+        lost_or_drawn = defeats >= 0
+        np.fill_diagonal(lost_or_drawn, False)
+
+        max_defeats = np.where(lost_or_drawn, defeats, -1).max(axis=1)
+        # Candidates who neither lost nor drew any duel have no defeat score
+        max_defeats = np.where(lost_or_drawn.any(axis=1), max_defeats, np.inf)
+        winners = np.flatnonzero(max_defeats == max_defeats.min())
+
+        # Winners are listed in the order in which they first lost or drew
+        winners = self.__order_by_first_duel(winners, lost_or_drawn, display_order, candidate_labels, True)
+        return [candidate_labels[candidate_index] for candidate_index in winners]
@@ -0,0 +1,157 @@
+from dataclasses import dataclass
+
+import numpy as np
+
+
+@dataclass(eq=False)
+class VotingProfile:
+    """
+    Data class for keeping track of the voters' preferences.
+
+    Instead of one list of (candidate label, score) tuples per voter, the
+    preferences are stored in compact matrices indexed by integers:
+
+    - rankings[v, r] is the index of the candidate ranked r-th by voter v
+    - scores[v, c] is the approval ratio of voter v for candidate c
+    - weights[v] is the vote weight of voter v
+    - candidate_labels[c] is the label of candidate c
+
+    A profile is immutable: its matrices are read-only and its labels are tuples,
+    so that a single profile can be shared by every voting rule.
+    """
+
+    __rankings: np.ndarray
+    __scores: np.ndarray
+    __weights: np.ndarray
+    __candidate_labels: tuple[str, ...]
+    __voter_labels: tuple[str, ...]
+
+    def __init__(
+            self,
+            rankings: np.ndarray,
+            scores: np.ndarray,
+            weights: np.ndarray,
+            candidate_labels: list[str],
+            voter_labels: list[str] | None = None
+    ):
+        nb_candidates = len(candidate_labels)
+        self.__weights = self.__read_only(np.asarray(weights))
+        nb_voters = len(self.__weights)
+        self.__rankings = self.__read_only(
+            np.asarray(rankings, dtype=self.rankings_dtype(nb_candidates)).reshape(nb_voters, nb_candidates)
+        )
+        self.__scores = self.__read_only(np.asarray(scores).reshape(nb_voters, nb_candidates))
+        self.__candidate_labels = tuple(candidate_labels)
+        if voter_labels is None:
+            voter_labels = [str(index + 1) for index in range(nb_voters)]
+        self.__voter_labels = tuple(voter_labels)
+
+    @staticmethod
+    def __read_only(array: np.ndarray) -> np.ndarray:
+        """
+        Returns a read-only view of the given array, so that a profile can be
+        shared between voting rules without any of them modifying it.
+
+        :param array: the array to protect
+        :return: a read-only view of the array
+        """
+        view = array.view()
+        view.flags.writeable = False
+        return view
+
+    @staticmethod
+    def rankings_dtype(nb_candidates: int) -> type:
+        """
+        Returns the smallest integer type able to index the given number of candidates.
+
+        :param nb_candidates: the number of candidates
+        :return: np.int16, or np.int32 past 32767 candidates
+        """
+        return np.int16 if nb_candidates <= np.iinfo(np.int16).max else np.int32
+
+    @classmethod
+    def from_profils(cls, profils: dict):
+        """
+        Builds a profile from the legacy dictionary format.
+        Candidates are indexed in the order in which the first voter ranks them.
+
+        :param profils: dict({..., <voter label>: tuple(list(..., tuple(<candidate label>, <approval ratio>), ...), weight), ...})
+        :return: the new profile
+        """
+        if not profils:
+            return cls(np.empty((0, 0)), np.empty((0, 0)), np.empty(0, dtype=np.int64), [], [])
+
+        candidate_labels = [candidate_label for candidate_label, _ in next(iter(profils.values()))[0]]
+        candidate_indexes = {candidate_label: index for index, candidate_label in enumerate(candidate_labels)}
+
+        rankings = np.empty((len(profils), len(candidate_labels)), dtype=cls.rankings_dtype(len(candidate_labels)))
+        scores = np.empty((len(profils), len(candidate_labels)), dtype=np.float64)
+        weights = []
+        for voter_index, (profil, weight) in enumerate(profils.values()):
+            indexes = [candidate_indexes[candidate_label] for candidate_label, _ in profil]
+            rankings[voter_index] = indexes
+            scores[voter_index, indexes] = [score for _, score in profil]
+            weights.append(weight)
+
+        return cls(rankings, scores, np.array(weights), candidate_labels, list(profils.keys()))
+
+    def to_profils(self) -> dict:
+        """
+        Converts the profile to the legacy dictionary format.
+
+        :return: dict({..., <voter label>: tuple(list(..., tuple(<candidate label>, <approval ratio>), ...), weight), ...})
+        """
+        return {
+            voter_label: (
+                [(self.__candidate_labels[index], score) for index, score in zip(ranking, scores[ranking].tolist())],
+                weight
+            )
+            for voter_label, ranking, scores, weight in zip(
+                self.__voter_labels, self.__rankings.tolist(), self.__scores, self.__weights.tolist()
+            )
+        }
+
+    def get_rankings(self) -> np.ndarray:
+        """
+        :return: the rankings matrix, of shape (nb_voters, nb_candidates)
+        """
+        return self.__rankings
+
+    def get_scores(self) -> np.ndarray:
+        """
+        :return: the scores (approval ratios) matrix, of shape (nb_voters, nb_candidates)
+        """
+        return self.__scores
+
+    def get_weights(self) -> np.ndarray:
+        """
+        :return: the voters' vote weights, of shape (nb_voters,)
+        """
+        return self.__weights
+
+    def get_candidate_labels(self) -> tuple[str, ...]:
+        """
+        :return: the candidates' labels, indexed like the rankings
+        """
+        return self.__candidate_labels
+
+    def get_voter_labels(self) -> tuple[str, ...]:
+        """
+        :return: the voters' labels
+        """
+        return self.__voter_labels
+
+    def get_nb_voters(self) -> int:
+        """
+        :return: the number of voters in the profile
+        """
+        return self.__rankings.shape[0]
+
+    def get_nb_candidates(self) -> int:
+        """
+        :return: the number of candidates in the profile
+        """
+        return len(self.__candidate_labels)
+
+    def __len__(self) -> int:
+        return self.get_nb_voters()